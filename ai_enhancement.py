@@ -5,7 +5,7 @@ This module provides enhanced AI capabilities including image analysis
 and speech-to-text functionality for improved problem analysis.
 """
 import streamlit as st
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import os
 import time
 
@@ -86,30 +86,32 @@ def handle_transcription(audio_description: Optional[str] = None) -> Optional[st
     
     return None
 
-def generate_chat_response(user_input: str) -> str:
+def build_chat_messages(user_input: str) -> List[Dict[str, str]]:
     """
-    Generate a chat response based on user input.
+    Build the chat completion messages for a user's chat message.
     
     Args:
         user_input: User's chat message
         
     Returns:
-        AI response text
+        List of message dictionaries with 'role' and 'content'
     """
-    messages = [
+    return [
         {"role": "system", "content": "You are HACKSEEK's AI assistant, an expert in innovation, hackathons, and problem-solving. Help users with project ideas, technical questions, and creative solutions for hackathon challenges. Provide concise, practical advice and respond in a friendly, encouraging tone."},
         {"role": "user", "content": user_input}
     ]
+
+def stream_chat_response(user_input: str) -> Iterator[str]:
+    """
+    Stream a chat response based on user input.
     
-    try:
-        with st.spinner("Generating response..."):
-            response = groq_chat_completion(messages, max_tokens=300, temperature=0.7)
-            if "error" not in response:
-                return response["choices"][0]["message"]["content"]
-            else:
-                return f"Error generating response: {response.get('error', 'Unknown error')}"
-    except Exception as e:
-        return f"Failed to generate response: {str(e)}"
+    Args:
+        user_input: User's chat message
+        
+    Returns:
+        Generator of response text chunks, suitable for st.write_stream
+    """
+    return groq_chat_completion(build_chat_messages(user_input), max_tokens=300, temperature=0.7, stream=True)
 
 def display_media_previews() -> None:
     """Display preview of uploaded media files."""
@@ -219,8 +221,14 @@ def render_ai_enhancement_tab() -> None:
             # Add user message to conversation history
             st.session_state.conversation_history.append(("user", audio_description))
             
-            # Generate AI response
-            response = generate_chat_response(audio_description)
+            # Stream the AI response as it is generated
+            st.markdown("---")
+            st.markdown(f"**You:** {audio_description}")
+            st.markdown("**AI:**")
+            try:
+                response = st.write_stream(stream_chat_response(audio_description))
+            except Exception as e:
+                response = f"Failed to generate response: {str(e)}"
             
             # Add AI response to conversation history
             st.session_state.conversation_history.append(("ai", response))
@@ -0,0 +1,209 @@
+"""
+Analysis Result Cache for HACKSEEK
+
+This module caches the output of the full analysis pipeline
+(analyze → insights → innovations → prioritize), keyed by a hash of the
+normalized problem statement and the generation settings. Entries are kept in
+an in-memory LRU and optionally mirrored to JSON files on disk so they survive
+restarts and can be shared between workers.
+"""
+import os
+import json
+import random
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from data_utils import derive_seed
+from problem_analyzer import ProblemAnalysis, analyze_problem, get_profile_for_depth
+from insights_generator import generate_insights
+from innovation_spotter import generate_innovations
+from prioritization_system import prioritize_actions
+
+# Cache settings (can be overridden from the environment)
+CACHE_MAX_ENTRIES = int(os.environ.get("HACKSEEK_CACHE_MAX_ENTRIES", "256"))
+CACHE_DIR = os.environ.get("HACKSEEK_CACHE_DIR")
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different inputs share a cache entry"""
+    return " ".join(text.split())
+
+def make_cache_key(problem_statement: str, depth: int, level: int, seed: Optional[int] = None) -> str:
+    """
+    Build the content-addressed key for a pipeline run.
+
+    Args:
+        problem_statement: The problem statement text
+        depth: Analysis depth (1-5)
+        level: Innovation level (1-5)
+        seed: Optional random seed used for generation
+
+    Returns:
+        Hex SHA-256 digest identifying the run
+    """
+    payload = json.dumps([normalize_text(problem_statement), depth, level, seed])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class ResultCache:
+    """Thread-safe LRU cache with an optional on-disk JSON backing store"""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, cache_dir: Optional[str] = CACHE_DIR):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None if it isn't cached"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        if self.cache_dir:
+            try:
+                with open(self._path(key), encoding="utf-8") as f:
+                    result = json.load(f)
+            except (OSError, ValueError):
+                result = None
+
+            if result is not None:
+                result["problem_analysis"] = ProblemAnalysis.from_dict(result["problem_analysis"])
+                self._remember(key, result)
+                with self._lock:
+                    self.disk_hits += 1
+                return result
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result in memory and, if configured, on disk"""
+        self._remember(key, result)
+
+        if self.cache_dir:
+            # Write to a temporary file first so readers never see partial JSON
+            tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(result, f, default=lambda obj: obj.to_dict())
+                os.replace(tmp_path, self._path(key))
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Error writing analysis cache entry: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def _remember(self, key: str, result: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def find_analysis(self, problem_statement: str) -> Optional[ProblemAnalysis]:
+        """
+        Find the most recently used cached analysis of a problem statement.
+
+        Any depth, innovation level or seed will do, since callers only need
+        the problem analysis itself (e.g. for hackathon tips).
+        """
+        normalized = normalize_text(problem_statement)
+        with self._lock:
+            for result in reversed(self._entries.values()):
+                problem_analysis = result["problem_analysis"]
+                if normalize_text(problem_analysis["text"]) == normalized:
+                    return problem_analysis
+        return None
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (on-disk entries are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses
+            }
+
+# Process-wide cache shared by all sessions
+result_cache = ResultCache()
+
+def get_cached_analysis(problem_statement, cache=result_cache):
+    """
+    Get an already computed ProblemAnalysis for a statement, or None.
+
+    Args:
+        problem_statement (str): The problem statement text
+        cache (ResultCache, optional): Cache to search
+
+    Returns:
+        ProblemAnalysis or None: The cached analysis, if any
+    """
+    if cache is None:
+        return None
+    return cache.find_analysis(problem_statement)
+
+def run_analysis_pipeline(problem_statement, depth=3, level=3, seed=None, cache=result_cache):
+    """
+    Run analyze → insights → innovations → prioritize, reusing cached results.
+
+    Args:
+        problem_statement (str): The problem statement text
+        depth (int): Analysis depth (1-5)
+        level (int): Innovation level (1-5)
+        seed (int, optional): Random seed used for generation; by default it is
+            derived from the statement, depth and level, so repeated runs of
+            the same input give the same results
+        cache (ResultCache, optional): Cache to use, or None to always recompute
+
+    Returns:
+        dict: Results with problem_analysis (a ProblemAnalysis), insights,
+            innovations and prioritized_actions keys
+    """
+    key = make_cache_key(problem_statement, depth, level, seed)
+
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    # One generator shared by every stage, so the whole run follows from the seed
+    if seed is None:
+        seed = derive_seed(problem_statement, depth, level)
+    rng = random.Random(seed)
+    
+    problem_analysis = analyze_problem(problem_statement, profile=get_profile_for_depth(depth))
+    insights = generate_insights(problem_analysis, depth=depth, rng=rng)
+    innovations = generate_innovations(problem_analysis, insights, level=level, rng=rng)
+    prioritized_actions = prioritize_actions(innovations, rng=rng, problem_analysis=problem_analysis,
+                                             insights=insights)
+
+    result = {
+        'problem_analysis': problem_analysis,
+        'insights': insights,
+        'innovations': innovations,
+        'prioritized_actions': prioritized_actions
+    }
+
+    if cache is not None:
+        cache.set(key, result)
+
+    return result
@@ -0,0 +1,383 @@
+"""
+HTTP API for HACKSEEK
+
+This module exposes the analysis pipeline as a dependency-free ASGI
+application, so other front ends can use HackSeek without the Streamlit app.
+CPU-bound work (spaCy parsing and generation) runs in a pool of worker
+processes while the event loop keeps serving requests.
+
+Endpoints (all POST with a JSON body, except GET /health):
+    /analyze      {"problem_statement", "depth"?}
+    /insights     {"problem_statement" | "problem_analysis", "depth"?, "seed"?}
+    /innovations  {"problem_statement" | "problem_analysis" + "insights", "depth"?, "level"?, "seed"?}
+    /prioritize   {"problem_statement" | "innovations" + "problem_analysis"? + "insights"?, "depth"?, "level"?,
+                   "seed"?, "scoring"?}
+    /tips         {"problem_statement", "problem_analysis"?, "lightweight"?}
+
+Run with any ASGI server, e.g.:
+    uvicorn api:app --host 0.0.0.0 --port 8000
+"""
+import os
+import json
+import random
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from nlp_registry import get_nlp
+from problem_analyzer import ProblemAnalysis, analyze_problem, get_profile_for_depth
+from insights_generator import generate_insights
+from innovation_spotter import generate_innovations
+from prioritization_system import prioritize_actions, SCORING_MODELS
+from context_aware_tips import suggest_context_aware_hackathon_tips
+from analysis_cache import run_analysis_pipeline
+
+# Worker processes for CPU-bound stages (can be overridden from the environment)
+API_WORKERS = int(os.environ.get("HACKSEEK_API_WORKERS", str(os.cpu_count() or 1)))
+
+# Largest request body accepted, in bytes
+MAX_BODY_BYTES = int(os.environ.get("HACKSEEK_API_MAX_BODY_BYTES", str(1024 * 1024)))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+class APIError(Exception):
+    """An error reported to the client with an HTTP status code"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def get_executor():
+    """
+    Get the process pool used for CPU-bound stages, starting it on first use.
+
+    Returns:
+        ProcessPoolExecutor: The shared worker pool
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ProcessPoolExecutor(max_workers=API_WORKERS, initializer=get_nlp)
+    return _executor
+
+def _replace_broken_executor(broken):
+    """Drop a pool whose worker died so the next request starts a fresh one"""
+    global _executor
+
+    with _executor_lock:
+        if _executor is broken:
+            _executor = None
+    broken.shutdown(wait=False)
+
+def shutdown_executor():
+    """Stop the worker pool (it is restarted on next use)"""
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+
+async def run_in_worker(func, *args):
+    """
+    Run func(*args) in the worker pool without blocking the event loop.
+
+    If a worker process died (e.g. killed for using too much memory), the
+    pool is replaced and the call retried once before reporting 503.
+    """
+    loop = asyncio.get_running_loop()
+    for _ in range(2):
+        executor = get_executor()
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            print("Worker pool broke; starting a new one")
+            _replace_broken_executor(executor)
+    raise APIError(503, "Analysis workers are unavailable, please retry")
+
+# Stage functions run in the worker processes; they take and return plain JSON data
+
+def _make_rng(seed):
+    return random.Random(seed) if seed is not None else None
+
+def _pipeline_result(result):
+    """Convert a run_analysis_pipeline result to plain JSON data"""
+    return {**result, "problem_analysis": result["problem_analysis"].to_dict()}
+
+def analyze_stage(problem_statement, depth):
+    return analyze_problem(problem_statement, profile=get_profile_for_depth(depth)).to_dict()
+
+def pipeline_stage(problem_statement, depth, level, seed):
+    return _pipeline_result(run_analysis_pipeline(problem_statement, depth=depth, level=level, seed=seed))
+
+def insights_stage(problem_analysis, depth, seed):
+    return generate_insights(ProblemAnalysis.from_dict(problem_analysis), depth=depth, rng=_make_rng(seed))
+
+def innovations_stage(problem_analysis, insights, level, seed):
+    return generate_innovations(ProblemAnalysis.from_dict(problem_analysis), insights, level=level,
+                                rng=_make_rng(seed))
+
+def prioritize_stage(innovations, problem_analysis, insights, seed, scoring):
+    if problem_analysis is not None:
+        problem_analysis = ProblemAnalysis.from_dict(problem_analysis)
+    return prioritize_actions(innovations, rng=_make_rng(seed), problem_analysis=problem_analysis, scoring=scoring,
+                              insights=insights)
+
+def tips_stage(problem_statement, problem_analysis, lightweight):
+    if problem_analysis is not None:
+        problem_analysis = ProblemAnalysis.from_dict(problem_analysis)
+    return suggest_context_aware_hackathon_tips(problem_statement, problem_analysis=problem_analysis,
+                                                lightweight=lightweight)
+
+# Request validation
+
+def _get_text(body, field="problem_statement", required=True):
+    value = body.get(field)
+    if value is None and not required:
+        return None
+    if not isinstance(value, str) or not value.strip():
+        raise APIError(400, f"'{field}' must be a non-empty string")
+    return value
+
+def _get_int(body, field, default, low=1, high=5):
+    value = body.get(field, default)
+    if value is None:
+        return default
+    if isinstance(value, bool) or not isinstance(value, int) or not low <= value <= high:
+        raise APIError(400, f"'{field}' must be an integer from {low} to {high}")
+    return value
+
+def _get_seed(body):
+    seed = body.get("seed")
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+        raise APIError(400, "'seed' must be an integer")
+    return seed
+
+def _get_object(body, field, required=True):
+    value = body.get(field)
+    if value is None and not required:
+        return None
+    if not isinstance(value, dict):
+        raise APIError(400, f"'{field}' must be an object")
+    return value
+
+def _is_string_list(value):
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _is_entity(entity):
+    return isinstance(entity, dict) and isinstance(entity.get("text"), str)
+
+# Optional problem_analysis fields, with a check and the message when it fails
+PROBLEM_ANALYSIS_FIELDS = {
+    "objectives": (_is_string_list, "a list of strings"),
+    "constraints": (_is_string_list, "a list of strings"),
+    "key_phrases": (_is_string_list, "a list of strings"),
+    "entities": (lambda value: isinstance(value, list) and all(_is_entity(entity) for entity in value),
+                 "a list of objects with a 'text' string"),
+    "sentiment": (_is_number, "a number"),
+    "complexity": (_is_number, "a number"),
+    "profile": (lambda value: isinstance(value, str), "a string")
+}
+
+def _get_problem_analysis(body, required=True):
+    problem_analysis = _get_object(body, "problem_analysis", required)
+    if problem_analysis is None:
+        return None
+    if not isinstance(problem_analysis.get("text"), str):
+        raise APIError(400, "'problem_analysis' must include the problem 'text'")
+    # The spaCy doc is never accepted from clients; workers reparse the text when they need it
+    if "doc_bytes" in problem_analysis:
+        raise APIError(400, "'problem_analysis.doc_bytes' is not accepted")
+    for field, (is_valid, expected) in PROBLEM_ANALYSIS_FIELDS.items():
+        if field in problem_analysis and not is_valid(problem_analysis[field]):
+            raise APIError(400, f"'problem_analysis.{field}' must be {expected}")
+    return problem_analysis
+
+def _get_insights(body, required=True):
+    insights = _get_object(body, "insights", required)
+    if insights is None:
+        return None
+    domain_relevance = insights.get("domain_relevance")
+    if (not isinstance(domain_relevance, dict) or len(domain_relevance) < 2
+            or not all(isinstance(score, (int, float)) for score in domain_relevance.values())):
+        raise APIError(400, "'insights.domain_relevance' must map at least two domains to scores")
+    for field in ("trends", "gaps"):
+        if not isinstance(insights.get(field), list):
+            raise APIError(400, f"'insights.{field}' must be a list")
+    return insights
+
+def _is_step(step):
+    return (isinstance(step, dict) and isinstance(step.get("name"), str)
+            and isinstance(step.get("description"), str) and "number" in step)
+
+def _get_innovations(body):
+    innovations = _get_object(body, "innovations")
+    solutions = innovations.get("solutions")
+    technologies = innovations.get("technologies")
+    if not isinstance(solutions, list) or not isinstance(technologies, list):
+        raise APIError(400, "'innovations' must include 'solutions' and 'technologies' lists")
+
+    for solution in solutions:
+        if not isinstance(solution, dict) or not isinstance(solution.get("title"), str):
+            raise APIError(400, "Each of 'innovations.solutions' must be an object with a 'title'")
+        steps = solution.get("steps")
+        if steps is None:
+            if not isinstance(solution.get("approach"), str):
+                raise APIError(400, "Each of 'innovations.solutions' needs 'steps' or an 'approach' string")
+        elif not isinstance(steps, list) or not all(_is_step(step) for step in steps):
+            raise APIError(400, "Solution 'steps' must be objects with 'number', 'name' and 'description'")
+
+    for technology in technologies:
+        if (not isinstance(technology, dict) or not isinstance(technology.get("technology"), str)
+                or not isinstance(technology.get("category"), str)):
+            raise APIError(400, "Each of 'innovations.technologies' must have 'technology' and 'category' strings")
+    return innovations
+
+# Endpoint handlers
+
+async def handle_analyze(body):
+    problem_statement = _get_text(body)
+    depth = _get_int(body, "depth", 3)
+    return {"problem_analysis": await run_in_worker(analyze_stage, problem_statement, depth)}
+
+async def handle_insights(body):
+    depth = _get_int(body, "depth", 3)
+    seed = _get_seed(body)
+
+    if "problem_analysis" in body:
+        problem_analysis = _get_problem_analysis(body)
+        return {"insights": await run_in_worker(insights_stage, problem_analysis, depth, seed)}
+
+    result = await run_in_worker(pipeline_stage, _get_text(body), depth, _get_int(body, "level", 3), seed)
+    return {key: result[key] for key in ("problem_analysis", "insights")}
+
+async def handle_innovations(body):
+    depth = _get_int(body, "depth", 3)
+    level = _get_int(body, "level", 3)
+    seed = _get_seed(body)
+
+    if "problem_analysis" in body:
+        problem_analysis = _get_problem_analysis(body)
+        insights = _get_insights(body)
+        return {"innovations": await run_in_worker(innovations_stage, problem_analysis, insights, level, seed)}
+
+    result = await run_in_worker(pipeline_stage, _get_text(body), depth, level, seed)
+    return {key: result[key] for key in ("problem_analysis", "insights", "innovations")}
+
+async def handle_prioritize(body):
+    depth = _get_int(body, "depth", 3)
+    level = _get_int(body, "level", 3)
+    seed = _get_seed(body)
+    scoring = body.get("scoring", "evidence")
+    if scoring not in SCORING_MODELS:
+        raise APIError(400, f"'scoring' must be one of: {', '.join(SCORING_MODELS)}")
+
+    if "innovations" in body:
+        innovations = _get_innovations(body)
+        problem_analysis = _get_problem_analysis(body, required=False)
+        insights = _get_insights(body, required=False)
+        actions = await run_in_worker(prioritize_stage, innovations, problem_analysis, insights, seed, scoring)
+        return {"prioritized_actions": actions}
+
+    return await run_in_worker(pipeline_stage, _get_text(body), depth, level, seed)
+
+async def handle_tips(body):
+    problem_statement = _get_text(body)
+    problem_analysis = _get_problem_analysis(body, required=False)
+    lightweight = bool(body.get("lightweight", False))
+    return {"tips": await run_in_worker(tips_stage, problem_statement, problem_analysis, lightweight)}
+
+ROUTES = {
+    "/analyze": handle_analyze,
+    "/insights": handle_insights,
+    "/innovations": handle_innovations,
+    "/prioritize": handle_prioritize,
+    "/tips": handle_tips
+}
+
+# ASGI plumbing
+
+async def _read_body(receive):
+    chunks = []
+    size = 0
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise APIError(400, "Client disconnected")
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise APIError(413, f"Request body larger than {MAX_BODY_BYTES} bytes")
+        chunks.append(chunk)
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+async def _send_json(send, status, payload):
+    body = json.dumps(payload).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii"))
+        ]
+    })
+    await send({"type": "http.response.body", "body": body})
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            get_executor()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await asyncio.get_running_loop().run_in_executor(None, shutdown_executor)
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def app(scope, receive, send):
+    """ASGI entry point"""
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    path = scope["path"].rstrip("/") or "/"
+    method = scope["method"]
+
+    try:
+        if path == "/health":
+            if method != "GET":
+                raise APIError(405, "Method not allowed")
+            await _send_json(send, 200, {"status": "ok", "workers": API_WORKERS})
+            return
+
+        handler = ROUTES.get(path)
+        if handler is None:
+            raise APIError(404, f"Unknown endpoint {path}")
+        if method != "POST":
+            raise APIError(405, "Method not allowed")
+
+        try:
+            body = json.loads(await _read_body(receive) or b"{}")
+        except ValueError:
+            raise APIError(400, "Request body must be valid JSON")
+        if not isinstance(body, dict):
+            raise APIError(400, "Request body must be a JSON object")
+
+        await _send_json(send, 200, await handler(body))
+    except APIError as e:
+        await _send_json(send, e.status, {"error": e.message})
+    except Exception as e:
+        print(f"Error handling {method} {path}: {e}")
+        await _send_json(send, 500, {"error": "Internal server error"})
@@ -9,15 +9,13 @@ from dotenv import load_dotenv
 load_dotenv()
 import psycopg2
 from problem_analyzer import analyze_problem
-from insights_generator import generate_insights
-from innovation_spotter import generate_innovations
-from prioritization_system import prioritize_actions
+from analysis_cache import run_analysis_pipeline, get_cached_analysis, normalize_text
 from sample_problems import sample_problems
 from context_aware_tips import suggest_context_aware_hackathon_tips
 
 # Import auth modules
 from auth_interface import render_auth_ui
-from auth_utils import save_user_search, save_user_solution
+from auth_utils import save_search_with_solution
 from timeline import render_timeline
 from sample_problems import get_sample_problems, problem_templates, generate_problem
 from hackathon_tips import (get_hackathon_planning_tips, get_technical_execution_strategies,
@@ -188,13 +186,29 @@ if user_is_authenticated:
                 key="problem_input_for_tips"
             )
             
+            quick_tips = st.checkbox(
+                "Quick tips (keyword matching only, no NLP parsing)",
+                key="quick_tips"
+            )
+            
             # Generate button
             if st.button("Generate Customized Tips"):
                 if problem_statement_for_tips.strip():
                     with st.spinner("Analyzing your problem statement..."):
-                        # Analyze problem and suggest tips
-                        problem_analysis = analyze_problem(problem_statement_for_tips)
-                        context_aware_tips = suggest_context_aware_hackathon_tips(problem_statement_for_tips, problem_analysis)
+                        # Reuse the main view's analysis or a cached one for the same statement
+                        problem_analysis = st.session_state.get('problem_analysis')
+                        if not problem_analysis or normalize_text(problem_analysis['text']) != normalize_text(problem_statement_for_tips):
+                            problem_analysis = get_cached_analysis(problem_statement_for_tips)
+                        
+                        # Otherwise analyze it (lemmas and complexity need no parser)
+                        if problem_analysis is None and not quick_tips:
+                            problem_analysis = analyze_problem(problem_statement_for_tips, profile="standard")
+                        
+                        context_aware_tips = suggest_context_aware_hackathon_tips(
+                            problem_statement_for_tips,
+                            problem_analysis,
+                            lightweight=quick_tips
+                        )
                         
                         # Store in session state
                         st.session_state.context_aware_tips = context_aware_tips
@@ -537,44 +551,24 @@ if user_is_authenticated and st.session_state.current_view == "main":
         st.session_state.analyzed = True
         
         with st.spinner("Analyzing problem statement..."):
-            # Analyze problem statement
-            problem_analysis = analyze_problem(problem_statement)
-            
-            # Generate domain insights
-            insights = generate_insights(problem_analysis, depth=st.session_state.analysis_depth)
-            
-            # Generate innovation suggestions
-            innovations = generate_innovations(problem_analysis, insights, level=st.session_state.innovation_level)
-            
-            # Prioritize actions
-            prioritized_actions = prioritize_actions(innovations)
+            # Analyze, generate insights and innovations, and prioritize actions
+            # (repeat analyses of the same statement and settings come from the cache)
+            solution_data = run_analysis_pipeline(
+                problem_statement,
+                depth=st.session_state.analysis_depth,
+                level=st.session_state.innovation_level
+            )
         
         # Store results in session state
-        st.session_state.problem_analysis = problem_analysis
-        st.session_state.insights = insights
-        st.session_state.innovations = innovations
-        st.session_state.prioritized_actions = prioritized_actions
+        st.session_state.problem_analysis = solution_data['problem_analysis']
+        st.session_state.insights = solution_data['insights']
+        st.session_state.innovations = solution_data['innovations']
+        st.session_state.prioritized_actions = solution_data['prioritized_actions']
         
         # Save the search to the database
         if st.session_state.get('user_info'):
-            user_id = st.session_state.user_info['id']
-            search_id = save_user_search(user_id, problem_statement)
-            
-            if search_id:
-                # Create a JSON-serializable copy of the solution data
-                # Remove spaCy doc from problem_analysis as it's not JSON serializable
-                serializable_problem_analysis = problem_analysis.copy()
-                if 'doc' in serializable_problem_analysis:
-                    del serializable_problem_analysis['doc']
-                
-                # Save the solution data
-                solution_data = {
-                    'problem_analysis': serializable_problem_analysis,
-                    'insights': insights, 
-                    'innovations': innovations,
-                    'prioritized_actions': prioritized_actions
-                }
-                save_user_solution(user_id, search_id, solution_data)
+            # Search and solution are saved together (the analysis serializes itself without the spaCy doc)
+            save_search_with_solution(st.session_state.user_info['id'], problem_statement, solution_data)
     elif not user_is_authenticated and st.session_state.processing_started and st.session_state.problem_input:
         st.session_state.processing_started = False
         st.warning("Please log in to analyze problems and save your solutions.")
@@ -0,0 +1,227 @@
+"""
+Batch Runner for HACKSEEK
+
+This module runs the full analysis pipeline (analyze → insights →
+innovations → prioritize) over a corpus of problem statements without the
+Streamlit app. Problems are read from JSONL or CSV, processed by a pool of
+worker processes and written as one JSON object per line, with progress and
+throughput reported on stderr.
+
+Usage:
+    python -m batch problems.jsonl -o results.jsonl --depth 3 --level 3
+"""
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+import contextlib
+import multiprocessing
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+from nlp_registry import get_nlp
+from analysis_cache import ResultCache, run_analysis_pipeline
+
+# Fields tried, in order, when the input doesn't name its text or id field
+TEXT_FIELDS = ("problem_statement", "problem", "text", "statement", "body", "description")
+ID_FIELDS = ("id", "problem_id", "request_id")
+
+# Per-worker settings, set by _init_worker
+_worker_settings: Dict[str, Any] = {}
+
+def _pick_field(record: Dict[str, Any], requested: Optional[str], candidates: Tuple[str, ...]) -> Optional[str]:
+    """Return the requested field, or the first candidate present in the record"""
+    if requested:
+        return requested
+    for field in candidates:
+        if record.get(field):
+            return field
+    return None
+
+def read_problems(path: str, text_field: Optional[str] = None,
+                  id_field: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Read problem statements from a JSONL or CSV file.
+
+    Args:
+        path: Input file ("-" for JSONL on stdin); ".csv" files are read as CSV
+        text_field: Field holding the problem statement (default: first of TEXT_FIELDS)
+        id_field: Field holding the record id (default: first of ID_FIELDS, else the line number)
+
+    Yields:
+        (id, problem statement) tuples, skipping records without text
+    """
+    if path == "-":
+        records = (json.loads(line) for line in sys.stdin if line.strip())
+        yield from _iter_records(records, text_field, id_field)
+        return
+
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            records = csv.DictReader(f)
+        else:
+            records = (json.loads(line) for line in f if line.strip())
+        yield from _iter_records(records, text_field, id_field)
+
+def _iter_records(records, text_field, id_field):
+    for number, record in enumerate(records, start=1):
+        field = _pick_field(record, text_field, TEXT_FIELDS)
+        text = record.get(field) if field else None
+        if not text or not str(text).strip():
+            print(f"Skipping record {number}: no problem statement found", file=sys.stderr)
+            continue
+
+        key = _pick_field(record, id_field, ID_FIELDS)
+        record_id = record.get(key) if key else None
+        yield (str(record_id) if record_id is not None else str(number)), str(text)
+
+def _init_worker(depth: int, level: int, seed: Optional[int], cache_dir: Optional[str]) -> None:
+    """Load the spaCy model and settings once per worker process"""
+    _worker_settings.update({
+        "depth": depth,
+        "level": level,
+        "seed": seed,
+        # A disk cache lets re-runs skip statements that were already analyzed
+        "cache": ResultCache(max_entries=64, cache_dir=cache_dir) if cache_dir else None
+    })
+    get_nlp()
+
+def analyze_record(item: Tuple[str, str]) -> Tuple[str, bool]:
+    """
+    Run the pipeline for one (id, problem statement) pair in a worker.
+
+    Returns:
+        (line, failed): JSON line with the id, results and elapsed seconds (or
+            the error), and whether the pipeline raised
+    """
+    record_id, text = item
+    start = time.perf_counter()
+
+    try:
+        result = run_analysis_pipeline(
+            text,
+            depth=_worker_settings["depth"],
+            level=_worker_settings["level"],
+            seed=_worker_settings["seed"],
+            cache=_worker_settings["cache"]
+        )
+        output = {"id": record_id, **result}
+    except Exception as e:
+        output = {"id": record_id, "error": f"{type(e).__name__}: {e}"}
+
+    output["elapsed_seconds"] = round(time.perf_counter() - start, 4)
+    # Serialize in the worker so the parent only writes lines
+    return json.dumps(output, default=lambda obj: obj.to_dict()), "error" in output
+
+def run_batch(input_path: str, output_file, depth: int = 3, level: int = 3, seed: Optional[int] = None,
+              workers: Optional[int] = None, chunksize: int = 4, text_field: Optional[str] = None,
+              id_field: Optional[str] = None, cache_dir: Optional[str] = None,
+              progress_every: float = 2.0) -> Dict[str, Any]:
+    """
+    Analyze every problem in input_path and write JSON lines to output_file.
+
+    Args:
+        input_path: JSONL or CSV file of problem statements
+        output_file: Writable text file for the results
+        depth: Analysis depth (1-5)
+        level: Innovation level (1-5)
+        seed: Random seed; by default each statement gets one derived from its text
+        workers: Number of worker processes (default: one per CPU; 1 runs in-process)
+        chunksize: Records sent to a worker at a time
+        text_field: Field holding the problem statement
+        id_field: Field holding the record id
+        cache_dir: Directory for the on-disk result cache (optional)
+        progress_every: Seconds between progress lines on stderr
+
+    Returns:
+        dict: Totals with processed, errors, elapsed_seconds and per_second keys
+    """
+    workers = workers or os.cpu_count() or 1
+    problems = read_problems(input_path, text_field, id_field)
+
+    # Load the model before forking so workers share its memory
+    get_nlp()
+
+    pool = None
+    if workers > 1:
+        pool = multiprocessing.Pool(workers, initializer=_init_worker,
+                                    initargs=(depth, level, seed, cache_dir))
+        lines = pool.imap(analyze_record, problems, chunksize=chunksize)
+    else:
+        _init_worker(depth, level, seed, cache_dir)
+        lines = map(analyze_record, problems)
+
+    processed = errors = 0
+    start = last_report = time.perf_counter()
+
+    try:
+        for line, failed in lines:
+            output_file.write(line + "\n")
+            processed += 1
+            errors += failed
+
+            now = time.perf_counter()
+            if now - last_report >= progress_every:
+                last_report = now
+                output_file.flush()
+                print(f"Processed {processed} problems ({processed / (now - start):.1f}/s, {errors} errors)",
+                      file=sys.stderr)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    elapsed = time.perf_counter() - start
+    output_file.flush()
+
+    stats = {
+        "processed": processed,
+        "errors": errors,
+        "elapsed_seconds": round(elapsed, 2),
+        "per_second": round(processed / elapsed, 2) if elapsed > 0 else 0.0
+    }
+    print(f"Done: {processed} problems in {elapsed:.1f}s ({stats['per_second']}/s, {errors} errors, "
+          f"{workers} worker{'s' if workers != 1 else ''})", file=sys.stderr)
+    return stats
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m batch",
+        description="Run the HACKSEEK analysis pipeline over a JSONL or CSV file of problem statements."
+    )
+    parser.add_argument("input", help="JSONL or CSV file of problem statements ('-' for JSONL on stdin)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL file to write results to (default: stdout)")
+    parser.add_argument("--depth", type=int, default=3, choices=range(1, 6), help="Analysis depth (1-5)")
+    parser.add_argument("--level", type=int, default=3, choices=range(1, 6), help="Innovation level (1-5)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed (default: derived from each statement)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--chunksize", type=int, default=4, help="Records sent to a worker at a time")
+    parser.add_argument("--text-field", default=None,
+                        help=f"Field holding the problem statement (default: first of {', '.join(TEXT_FIELDS)})")
+    parser.add_argument("--id-field", default=None,
+                        help=f"Field holding the record id (default: first of {', '.join(ID_FIELDS)})")
+    parser.add_argument("--cache-dir", default=None, help="Reuse and store results in this directory")
+    args = parser.parse_args(argv)
+
+    options = (args.depth, args.level, args.seed, args.workers, args.chunksize,
+               args.text_field, args.id_field, args.cache_dir)
+
+    # Results own stdout; log messages printed by the pipeline go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.output == "-":
+            output_file = sys.__stdout__
+            try:
+                stats = run_batch(args.input, output_file, *options)
+            except BrokenPipeError:
+                # The reader went away (e.g. piped into head); stop quietly
+                os.dup2(os.open(os.devnull, os.O_WRONLY), output_file.fileno())
+                return 1
+        else:
+            with open(args.output, "w", encoding="utf-8") as output_file:
+                stats = run_batch(args.input, output_file, *options)
+
+    return 1 if stats["errors"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
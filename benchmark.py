@@ -0,0 +1,291 @@
+"""
+Pipeline Benchmark for HACKSEEK
+
+This module times each stage of the analysis pipeline (analyze, insights,
+innovations, prioritize, tips) over fixed corpora generated from
+sample_problems.problem_templates at several text lengths. It reports
+latency percentiles, throughput and peak memory per stage, and can save the
+results as JSON and compare them with an earlier run (e.g. from another
+commit). Everything runs offline.
+
+Usage:
+    python -m benchmark --json before.json
+    python -m benchmark --json after.json --compare before.json
+"""
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from sample_problems import problem_templates, generate_problem
+from nlp_registry import get_nlp, get_model_stats
+from problem_analyzer import analyze_problem, get_profile_for_depth
+from insights_generator import generate_insights
+from innovation_spotter import generate_innovations
+from prioritization_system import prioritize_actions
+from context_aware_tips import suggest_context_aware_hackathon_tips
+
+# Number of generated problems joined into each statement, per corpus size
+# (xlong statements are over 10,000 characters)
+CORPUS_SIZES = {
+    "short": 1,
+    "medium": 3,
+    "long": 8,
+    "xlong": 40
+}
+
+STAGES = ("analyze", "insights", "innovations", "prioritize", "tips")
+
+def build_corpus(size: str, count: int, seed: int = 0) -> List[str]:
+    """
+    Build a reproducible corpus of problem statements.
+
+    Args:
+        size: Name of a corpus size in CORPUS_SIZES
+        count: Number of statements
+        seed: Random seed; the same seed always gives the same corpus
+
+    Returns:
+        List of problem statements
+    """
+    rng = random.Random(f"{seed}:{size}")
+    categories = sorted(problem_templates)
+    return [
+        " ".join(generate_problem(rng.choice(categories), rng) for _ in range(CORPUS_SIZES[size]))
+        for _ in range(count)
+    ]
+
+def run_stages(problem_statement: str, index: int, depth: int, level: int, timings: Dict[str, List[float]]) -> None:
+    """Run every stage once for a statement, appending each stage's seconds to timings"""
+    def timed(stage, func, *args, **kwargs):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings[stage].append(time.perf_counter() - start)
+        return result
+
+    rng = random.Random(index)
+    analysis = timed("analyze", analyze_problem, problem_statement, profile=get_profile_for_depth(depth))
+    insights = timed("insights", generate_insights, analysis, depth=depth, rng=rng)
+    innovations = timed("innovations", generate_innovations, analysis, insights, level=level, rng=rng)
+    timed("prioritize", prioritize_actions, innovations, rng=rng, problem_analysis=analysis, insights=insights)
+    timed("tips", suggest_context_aware_hackathon_tips, problem_statement, problem_analysis=analysis)
+
+def measure_peak_memory(problem_statement: str, depth: int, level: int) -> Dict[str, int]:
+    """
+    Measure the peak Python memory allocated by each stage for one statement.
+
+    Run separately from the timing loop because tracemalloc slows allocation down.
+
+    Returns:
+        Dict of stage name to peak traced bytes
+    """
+    peaks = {}
+    rng = random.Random(0)
+    steps = {
+        "analyze": lambda: analyze_problem(problem_statement, profile=get_profile_for_depth(depth)),
+        "insights": lambda: generate_insights(results["analyze"], depth=depth, rng=rng),
+        "innovations": lambda: generate_innovations(results["analyze"], results["insights"], level=level, rng=rng),
+        "prioritize": lambda: prioritize_actions(results["innovations"], rng=rng, problem_analysis=results["analyze"],
+                                                 insights=results["insights"]),
+        "tips": lambda: suggest_context_aware_hackathon_tips(problem_statement, problem_analysis=results["analyze"])
+    }
+    results = {}
+
+    tracemalloc.start()
+    try:
+        for stage in STAGES:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            results[stage] = steps[stage]()
+            peaks[stage] = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    return peaks
+
+def peak_rss_mb() -> Optional[float]:
+    """Return the peak resident set size of this process in MB (None where unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Return the linearly interpolated percentile (fraction from 0 to 1) of values"""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def summarize(seconds: List[float]) -> Dict[str, float]:
+    """Summarize stage timings as milliseconds and calls per second"""
+    total = sum(seconds)
+    return {
+        "calls": len(seconds),
+        "mean_ms": total / len(seconds) * 1000,
+        "p50_ms": percentile(seconds, 0.50) * 1000,
+        "p90_ms": percentile(seconds, 0.90) * 1000,
+        "p99_ms": percentile(seconds, 0.99) * 1000,
+        "max_ms": max(seconds) * 1000,
+        "per_second": len(seconds) / total if total > 0 else 0.0
+    }
+
+def run_benchmark(sizes=tuple(CORPUS_SIZES), count: int = 20, repeat: int = 3, warmup: int = 2,
+                  depth: int = 3, level: int = 3, seed: int = 0) -> Dict[str, Any]:
+    """
+    Benchmark every pipeline stage on each corpus size.
+
+    Args:
+        sizes: Corpus sizes to run (names in CORPUS_SIZES)
+        count: Statements per corpus
+        repeat: Passes over each corpus
+        warmup: Untimed statements run first per corpus
+        depth: Analysis depth (1-5)
+        level: Innovation level (1-5)
+        seed: Corpus seed
+
+    Returns:
+        dict: Run metadata and, per corpus size, per-stage latency, throughput and memory
+    """
+    get_nlp()
+
+    results = {
+        "metadata": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "model": get_model_stats().get("model"),
+            "settings": {"count": count, "repeat": repeat, "warmup": warmup,
+                         "depth": depth, "level": level, "seed": seed}
+        },
+        "corpora": {}
+    }
+
+    for size in sizes:
+        corpus = build_corpus(size, count, seed)
+
+        scratch = {stage: [] for stage in STAGES}
+        for index, problem_statement in enumerate(corpus[:warmup]):
+            run_stages(problem_statement, index, depth, level, scratch)
+
+        timings = {stage: [] for stage in STAGES}
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for index, problem_statement in enumerate(corpus):
+                run_stages(problem_statement, index, depth, level, timings)
+        elapsed = time.perf_counter() - start
+
+        peaks = measure_peak_memory(corpus[0], depth, level)
+
+        results["corpora"][size] = {
+            "statements": len(corpus),
+            "mean_chars": sum(len(text) for text in corpus) / len(corpus),
+            "pipeline_per_second": len(corpus) * repeat / elapsed,
+            "stages": {
+                stage: {**summarize(timings[stage]), "peak_memory_kb": peaks[stage] / 1024}
+                for stage in STAGES
+            }
+        }
+
+    results["metadata"]["peak_rss_mb"] = peak_rss_mb()
+    return results
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def format_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Format benchmark results as a text table.
+
+    Args:
+        results: Output of run_benchmark
+        baseline: Earlier results to compare p50 latency against (optional)
+
+    Returns:
+        str: The report
+    """
+    metadata = results["metadata"]
+    peak_rss = f"{metadata['peak_rss_mb']:.0f} MB" if metadata.get("peak_rss_mb") is not None else "n/a"
+    lines = [
+        f"commit {metadata['commit'] or 'unknown'} | Python {metadata['python']} | model {metadata['model']} | "
+        f"peak RSS {peak_rss}"
+    ]
+    if baseline:
+        lines.append(f"compared with commit {baseline['metadata'].get('commit') or 'unknown'} (p50 change)")
+
+    for size, corpus in results["corpora"].items():
+        lines.append("")
+        lines.append(f"{size}: {corpus['statements']} statements, {corpus['mean_chars']:.0f} chars on average, "
+                     f"{corpus['pipeline_per_second']:.1f} pipelines/s")
+        header = f"  {'stage':<12}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}{'calls/s':>10}{'peak KB':>10}"
+        if baseline:
+            header += f"{'vs base':>10}"
+        lines.append(header)
+
+        for stage, stats in corpus["stages"].items():
+            line = (f"  {stage:<12}{stats['p50_ms']:>9.2f}{stats['p90_ms']:>9.2f}{stats['p99_ms']:>9.2f}"
+                    f"{stats['max_ms']:>9.2f}{stats['per_second']:>10.1f}{stats['peak_memory_kb']:>10.0f}")
+            if baseline:
+                base = baseline.get("corpora", {}).get(size, {}).get("stages", {}).get(stage)
+                if base and base["p50_ms"] > 0:
+                    line += f"{(stats['p50_ms'] / base['p50_ms'] - 1) * 100:>+9.1f}%"
+                else:
+                    line += f"{'n/a':>10}"
+            lines.append(line)
+
+    return "\n".join(lines)
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmark",
+                                     description="Benchmark each stage of the HACKSEEK analysis pipeline.")
+    parser.add_argument("--sizes", default=",".join(CORPUS_SIZES),
+                        help=f"Comma-separated corpus sizes (default: {','.join(CORPUS_SIZES)})")
+    parser.add_argument("--count", type=int, default=20, help="Statements per corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over each corpus")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed statements run first")
+    parser.add_argument("--depth", type=int, default=3, choices=range(1, 6), help="Analysis depth (1-5)")
+    parser.add_argument("--level", type=int, default=3, choices=range(1, 6), help="Innovation level (1-5)")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed")
+    parser.add_argument("--json", dest="json_path", default=None, help="Save results to this JSON file")
+    parser.add_argument("--compare", default=None, help="JSON results of an earlier run to compare against")
+    args = parser.parse_args(argv)
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in CORPUS_SIZES]
+    if unknown:
+        parser.error(f"unknown corpus size(s): {', '.join(unknown)}")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = run_benchmark(sizes, args.count, args.repeat, args.warmup, args.depth, args.level, args.seed)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    print(format_report(results, baseline))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,19 +5,12 @@ This module analyzes problem statements and provides tailored hackathon tips
 relevant to the specific problem domain and characteristics.
 """
 
-import spacy
+from nlp_registry import process
+from keyword_matcher import KeywordMatcher
 from hackathon_tips import (get_hackathon_planning_tips, get_technical_execution_strategies,
                            get_presentation_strategies, get_judge_perspective_insights,
                            get_hackathon_categories_info, get_pitfall_avoidance_tips)
 
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except:
-    # If model isn't available, use a simpler pipeline
-    nlp = spacy.blank("en")
-    nlp.add_pipe("sentencizer")
-
 # Domain keywords mapping
 DOMAIN_KEYWORDS = {
     "health": ["healthcare", "medical", "health", "patient", "doctor", "hospital", "wellness", "diagnosis"],
@@ -56,74 +49,86 @@ TARGET_USERS = {
     "researchers": ["researcher", "scientist", "academic", "study", "investigation", "laboratory", "publication", "finding"],
 }
 
-def analyze_problem_domain(problem_statement, problem_analysis=None):
+# Keyword tables scored by analyze_problem_domain
+KEYWORD_TABLES = {
+    "domain": DOMAIN_KEYWORDS,
+    "approach": TECHNICAL_APPROACH,
+    "user": TARGET_USERS,
+}
+
+def build_lemma_index(keyword_tables):
+    """
+    Build an inverted index from keyword to the (category, label) pairs it scores for.
+    
+    Args:
+        keyword_tables (dict): Category name to a {label: [keywords]} table
+        
+    Returns:
+        dict: Lowercased keyword to a tuple of (category, label) pairs
+    """
+    index = {}
+    for category, table in keyword_tables.items():
+        for label, keywords in table.items():
+            for keyword in set(keyword.lower() for keyword in keywords):
+                index.setdefault(keyword, []).append((category, label))
+    return {keyword: tuple(pairs) for keyword, pairs in index.items()}
+
+# Built once at import so scoring is a single pass over the doc's tokens
+LEMMA_INDEX = build_lemma_index(KEYWORD_TABLES)
+
+# Substring matcher over all three tables, labelled by (category, label)
+TIPS_MATCHER = KeywordMatcher({
+    (category, label): keywords
+    for category, table in KEYWORD_TABLES.items()
+    for label, keywords in table.items()
+})
+
+def analyze_problem_domain(problem_statement, problem_analysis=None, lightweight=False):
     """
     Analyze the problem statement to determine relevant domain areas.
     
     Args:
         problem_statement (str): The problem statement text
-        problem_analysis (dict, optional): Pre-existing problem analysis
+        problem_analysis (dict, optional): Pre-existing problem analysis; its
+            spaCy doc is reused instead of parsing the text again when it
+            has lemmas
+        lightweight (bool): Never run spaCy; score keyword matches only,
+            plus lemmas if problem_analysis already carries a doc
         
     Returns:
         dict: Domain relevance scores and other analysis results
     """
-    # Process text if problem_analysis not provided
+    # Reuse the existing analysis and its doc when available
     if not problem_analysis:
-        doc = nlp(problem_statement.lower())
         text = problem_statement.lower()
+        doc = None
     else:
         text = problem_analysis.get("text", "").lower()
         doc = problem_analysis.get("doc")
-        if not doc:
-            doc = nlp(text)
+        # Only reuse a doc that has lemmas (the "fast" profile of a depth-1 analysis runs NER alone)
+        if doc is not None and not doc.has_annotation("LEMMA"):
+            doc = None
     
-    # Calculate domain relevance scores
-    domain_scores = {}
-    for domain, keywords in DOMAIN_KEYWORDS.items():
-        score = 0
-        for keyword in keywords:
-            if keyword.lower() in text:
-                score += text.count(keyword.lower()) * 2
-        
-        # Add scores for token lemmas to catch variations
-        if doc:
-            for token in doc:
-                if token.lemma_.lower() in keywords:
-                    score += 1
-        
-        domain_scores[domain] = score
+    # Process text only if no usable doc was provided
+    if not doc and not lightweight:
+        doc = process(text, profile="tips")
     
-    # Calculate technical approach relevance
-    approach_scores = {}
-    for approach, keywords in TECHNICAL_APPROACH.items():
-        score = 0
-        for keyword in keywords:
-            if keyword.lower() in text:
-                score += text.count(keyword.lower()) * 2
-        
-        # Add scores for token lemmas
-        if doc:
-            for token in doc:
-                if token.lemma_.lower() in keywords:
-                    score += 1
-        
-        approach_scores[approach] = score
+    # Start every category at zero, in table order (ties keep the first entry)
+    scores = {category: {label: 0 for label in table} for category, table in KEYWORD_TABLES.items()}
     
-    # Calculate target user relevance
-    user_scores = {}
-    for user_type, keywords in TARGET_USERS.items():
-        score = 0
-        for keyword in keywords:
-            if keyword.lower() in text:
-                score += text.count(keyword.lower()) * 2
-        
-        # Add scores for token lemmas
-        if doc:
-            for token in doc:
-                if token.lemma_.lower() in keywords:
-                    score += 1
-        
-        user_scores[user_type] = score
+    # Score keyword occurrences in the text with a single scan
+    for (category, label), score in TIPS_MATCHER.score(TIPS_MATCHER.count(text), weight=2).items():
+        scores[category][label] += score
+    
+    # Add scores for token lemmas to catch variations (one pass, O(1) lookups)
+    if doc:
+        for token in doc:
+            for category, label in LEMMA_INDEX.get(token.lemma_.lower(), ()):
+                scores[category][label] += 1
+    
+    domain_scores = scores["domain"]
+    approach_scores = scores["approach"]
+    user_scores = scores["user"]
     
     # Get top domains, approaches, and user types (normalize to ensure we have selections)
     top_domains = sorted(domain_scores.items(), key=lambda x: x[1], reverse=True)
@@ -334,19 +339,21 @@ def get_user_specific_tip(user_type):
         "detail": "Regardless of user type, judges value evidence of user feedback. Test your concept with even 2-3 potential users during the hackathon, document their feedback, and explain how you incorporated their input into your solution."
     })
 
-def suggest_context_aware_hackathon_tips(problem_statement, problem_analysis=None):
+def suggest_context_aware_hackathon_tips(problem_statement, problem_analysis=None, lightweight=False):
     """
     Generate context-aware hackathon tips based on the problem statement.
     
     Args:
         problem_statement (str): The problem statement text
         problem_analysis (dict, optional): Pre-existing problem analysis
+            (e.g. from the main view or the result cache) to reuse
+        lightweight (bool): Skip spaCy parsing entirely (see analyze_problem_domain)
         
     Returns:
         dict: Tailored hackathon tips
     """
     # Analyze the problem domain
-    domain_analysis = analyze_problem_domain(problem_statement, problem_analysis)
+    domain_analysis = analyze_problem_domain(problem_statement, problem_analysis, lightweight=lightweight)
     
     # Get general tips from hackathon_tips module
     planning_tips = get_hackathon_planning_tips()
@@ -1,6 +1,8 @@
 import re
+import json
 import string
 import random
+import hashlib
 
 def preprocess_text(text):
     """
@@ -102,3 +104,30 @@ def generate_random_id():
         str: Random ID
     """
     return ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
+
+def derive_seed(*parts):
+    """
+    Derive a stable random seed from input values.
+    
+    Args:
+        *parts: JSON-serializable values identifying the input (e.g. problem
+            text and depth); whitespace in strings is normalized first
+        
+    Returns:
+        int: 64-bit seed, the same for the same inputs in every process
+    """
+    normalized = [" ".join(part.split()) if isinstance(part, str) else part for part in parts]
+    payload = json.dumps(normalized, sort_keys=True, default=str)
+    return int.from_bytes(hashlib.sha256(payload.encode("utf-8")).digest()[:8], "big")
+
+def make_rng(*parts):
+    """
+    Create a random generator seeded from input values.
+    
+    Args:
+        *parts: Values passed to derive_seed
+        
+    Returns:
+        random.Random: Generator whose output depends only on the inputs
+    """
+    return random.Random(derive_seed(*parts))
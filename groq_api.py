@@ -6,21 +6,58 @@ This module provides integration with Groq's API for text analysis and model inf
 import os
 import json
 import base64
+import threading
 import requests
-from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Iterator, List, Optional, Union
 
 # Use the Groq API key from environment variables
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY")
 
 # Groq API base URL
-GROQ_API_BASE = "https://api.groq.com/openai/v1"
+GROQ_API_BASE = os.environ.get("GROQ_API_BASE", "https://api.groq.com/openai/v1")
+
+# HTTP client settings (seconds / connections)
+GROQ_CONNECT_TIMEOUT = float(os.environ.get("GROQ_CONNECT_TIMEOUT", "5"))
+GROQ_READ_TIMEOUT = float(os.environ.get("GROQ_READ_TIMEOUT", "60"))
+GROQ_POOL_SIZE = int(os.environ.get("GROQ_POOL_SIZE", "10"))
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """
+    Get the shared HTTP session used for Groq API calls.
+    
+    The session keeps connections alive between calls, so chat messages reuse
+    an open TLS connection instead of doing a fresh handshake each time.
+    
+    Returns:
+        requests.Session with a connection pool sized by GROQ_POOL_SIZE
+    """
+    global _session
+    
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=GROQ_POOL_SIZE,
+                    pool_maxsize=GROQ_POOL_SIZE
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    
+    return _session
 
 def groq_chat_completion(
     messages: List[Dict[str, str]], 
     model: str = "llama3-70b-8192",
     max_tokens: int = 1000,
-    temperature: float = 0.7
-) -> Dict[str, Any]:
+    temperature: float = 0.7,
+    stream: bool = False
+) -> Union[Dict[str, Any], Iterator[str]]:
     """
     Send a request to Groq's chat completion API.
     
@@ -29,9 +66,11 @@ def groq_chat_completion(
         model: The Groq model to use
         max_tokens: Maximum tokens to generate
         temperature: Temperature for response generation (0-1)
+        stream: Stream the completion as server-sent events
         
     Returns:
-        Dict containing the response from Groq API
+        Dict containing the response from Groq API, or, if stream is True,
+        a generator of response text chunks as they arrive
     """
     headers = {
         "Authorization": f"Bearer {GROQ_API_KEY}",
@@ -45,11 +84,16 @@ def groq_chat_completion(
         "temperature": temperature
     }
     
+    if stream:
+        payload["stream"] = True
+        return _stream_chat_completion(headers, payload)
+    
     try:
-        response = requests.post(
+        response = get_http_session().post(
             f"{GROQ_API_BASE}/chat/completions",
             headers=headers,
-            json=payload
+            json=payload,
+            timeout=(GROQ_CONNECT_TIMEOUT, GROQ_READ_TIMEOUT)
         )
         response.raise_for_status()
         return response.json()
@@ -57,6 +101,46 @@ def groq_chat_completion(
         print(f"Error with Groq API: {e}")
         return {"error": str(e)}
 
+def _stream_chat_completion(headers: Dict[str, str], payload: Dict[str, Any]) -> Iterator[str]:
+    """
+    Send a streaming chat completion request and yield content deltas.
+    
+    Groq streams OpenAI-style server-sent events: one "data: {json}" line per
+    chunk, terminated by "data: [DONE]".
+    
+    Yields:
+        Response text chunks (an error message chunk if the request fails)
+    """
+    try:
+        with get_http_session().post(
+            f"{GROQ_API_BASE}/chat/completions",
+            headers=headers,
+            json=payload,
+            timeout=(GROQ_CONNECT_TIMEOUT, GROQ_READ_TIMEOUT),
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            
+            # The stream is sent without a charset, so decode each line as UTF-8
+            # ourselves (requests would fall back to ISO-8859-1)
+            for raw_line in response.iter_lines():
+                line = raw_line.decode("utf-8")
+                if not line or not line.startswith("data:"):
+                    continue  # Blank separators, comments and keep-alives
+                
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                
+                chunk = json.loads(data)
+                choices = chunk.get("choices") or [{}]
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    yield content
+    except Exception as e:
+        print(f"Error with Groq API: {e}")
+        yield f"Error generating response: {e}"
+
 def analyze_problem_with_image(
     problem_text: str, 
     image_base64: str,
@@ -1,12 +1,363 @@
 import random
+from types import MappingProxyType
 from domain_knowledge import (
     TECH_DOMAINS, 
     CROSS_DOMAIN_PATTERNS, 
     PROBLEM_SOLVING_METHODOLOGIES, 
     EMERGING_TECHNOLOGIES
 )
+from insights_generator import DOMAIN_MAPPING
+from data_utils import make_rng
 
-def generate_innovations(problem_analysis, insights, level=3):
+# Solution templates based on innovation level
+SOLUTION_TEMPLATES = MappingProxyType({
+    1: (  # Conservative solutions
+        "Optimize existing {process} to improve {outcome}",
+        "Enhance {feature} to better meet {need}",
+        "Streamline {process} to reduce {problem}",
+        "Update {system} to incorporate {trend}"
+    ),
+    2: (  # Moderate solutions
+        "Integrate {technology} into existing {system} to enhance {outcome}",
+        "Develop a new approach to {process} that addresses {gap}",
+        "Create a platform that connects {stakeholder1} with {stakeholder2}",
+        "Implement a feedback system that improves {process} based on {data}"
+    ),
+    3: (  # Balanced solutions
+        "Build a {technology}-powered system that transforms how {stakeholders} approach {problem}",
+        "Create an ecosystem where {stakeholder1} and {stakeholder2} collaborate to solve {problem}",
+        "Develop a hybrid solution combining {approach1} and {approach2} to address {problem}",
+        "Design a modular system that adapts to changing {conditions} while maintaining {outcome}"
+    ),
+    4: (  # Innovative solutions
+        "Leverage {technology1} and {technology2} to create a novel approach to {problem}",
+        "Develop an AI-driven platform that continuously optimizes {process} based on {data}",
+        "Create a decentralized system where {stakeholders} contribute to solving {problem}",
+        "Build a predictive model that identifies potential {problems} before they occur"
+    ),
+    5: (  # Disruptive solutions
+        "Reimagine the entire {industry} paradigm through the integration of {technology1}, {technology2}, and {approach}",
+        "Create a self-evolving ecosystem that autonomously adapts to changes in {conditions}",
+        "Develop a platform that fundamentally changes how {stakeholders} interact with {system}",
+        "Design a solution that eliminates the root cause of {problem} rather than treating symptoms"
+    )
+})
+
+# Solution description templates
+DESCRIPTION_TEMPLATES = (
+    "A {adjective} approach that addresses {problem} through innovative use of {technology}",
+    "This solution tackles {problem} by {action}, resulting in improved {outcome}",
+    "By combining {approach1} with {approach2}, this solution offers a unique way to address {problem}",
+    "A {scale} solution designed to transform how {stakeholders} deal with {problem}",
+    "An innovative framework that allows {stakeholders} to overcome {problem} through {approach}"
+)
+
+# Vocabulary used to fill in solution templates
+SOLUTION_APPROACHES = (
+    "data-driven decision making", 
+    "user-centered design", 
+    "agile implementation", 
+    "systems thinking", 
+    "collaborative innovation",
+    "iterative prototyping",
+    "predictive analytics",
+    "cross-functional integration"
+)
+SOLUTION_OUTCOMES = (
+    "efficiency", "productivity", "user satisfaction", "cost reduction", 
+    "quality improvement", "sustainability", "scalability", "innovation"
+)
+SOLUTION_FEATURES = (
+    "user interface", "analytics dashboard", "automation capabilities", 
+    "integration options", "customization features", "reporting tools"
+)
+SOLUTION_SYSTEMS = (
+    "platform", "framework", "application", "algorithm", "ecosystem", 
+    "infrastructure", "network", "database"
+)
+SOLUTION_CONDITIONS = (
+    "market demands", "user needs", "technological advancements", 
+    "regulatory requirements", "competitive pressures", "resource constraints"
+)
+SOLUTION_ADJECTIVES = (
+    "revolutionary", "holistic", "integrated", "scalable", "adaptable",
+    "intuitive", "efficient", "sustainable", "intelligent", "resilient"
+)
+SOLUTION_ACTIONS = (
+    "redefining the workflow", "integrating disparate systems", 
+    "applying machine learning algorithms", "enabling real-time collaboration",
+    "implementing predictive analytics", "utilizing crowd-sourced data"
+)
+SOLUTION_SCALES = (
+    "enterprise-wide", "community-based", "industry-specific", 
+    "globally applicable", "individually tailored", "team-oriented"
+)
+SOLUTION_DATA = ("user feedback", "performance metrics", "market data", "analytics")
+SOLUTION_INDUSTRIES = ("industry", "sector", "market", "field", "domain")
+
+# Baseline technologies per domain (extended with knowledge base concepts below)
+BASE_DOMAIN_TECHNOLOGIES = {
+    "Technology": ["cloud computing", "AI", "machine learning", "blockchain", "IoT", "AR/VR", "quantum computing"],
+    "Healthcare": ["telehealth", "wearable sensors", "medical imaging", "health informatics", "genomics", "biometrics"],
+    "Education": ["e-learning platforms", "adaptive learning", "educational games", "virtual classrooms", "learning analytics"],
+    "Environment": ["remote sensing", "environmental monitoring", "clean tech", "GIS mapping", "carbon capture"],
+    "Business": ["CRM systems", "ERP solutions", "business intelligence", "process automation", "digital marketing"],
+    "Finance": ["fintech", "payment processing", "blockchain", "algorithmic trading", "risk assessment tools"],
+    "Transportation": ["route optimization", "telematics", "autonomous vehicles", "traffic management systems", "mobility platforms"],
+    "Energy": ["smart grid", "energy storage", "renewable technology", "demand response systems", "energy analytics"],
+    "Communication": ["real-time messaging", "video conferencing", "collaborative platforms", "social media analytics", "content management"],
+    "Entertainment": ["content streaming", "interactive media", "gaming engines", "recommendation algorithms", "digital rights management"],
+    "Agriculture": ["precision farming", "crop monitoring", "agricultural drones", "soil sensors", "farm management software"],
+    "Manufacturing": ["robotics", "industrial IoT", "3D printing", "predictive maintenance", "quality control systems"],
+    "Retail": ["inventory management", "point of sale", "customer analytics", "omnichannel platforms", "supply chain optimization"],
+    "Urban Planning": ["GIS", "traffic simulation", "infrastructure monitoring", "urban analytics", "smart city platforms"],
+    "Sustainability": ["lifecycle assessment", "carbon footprint tracking", "resource management", "sustainability reporting", "circular economy tools"]
+}
+
+# Baseline cross-domain technologies (extended with emerging technologies below)
+BASE_CROSS_DOMAIN_TECHNOLOGIES = [
+    "data analytics", "cloud computing", "mobile applications", 
+    "API integration", "automation tools", "visualization software",
+    "collaborative platforms", "AI/ML models", "digital twins"
+]
+
+# Domain-specific innovation concepts (extended with knowledge base concepts below)
+BASE_DOMAIN_CONCEPTS = {
+    "Technology": ["algorithmic approach", "digital platform", "automated system", "data-driven solution"],
+    "Healthcare": ["preventive model", "wellness approach", "patient-centered design", "remote monitoring"],
+    "Education": ["learner-centered model", "adaptive curriculum", "competency-based framework", "peer learning"],
+    "Environment": ["circular economy", "zero-waste approach", "ecosystem thinking", "regenerative design"],
+    "Business": ["value chain optimization", "customer journey mapping", "agile organization", "sustainable business model"],
+    "Finance": ["risk distribution", "value exchange", "resource allocation", "portfolio approach"],
+    "Transportation": ["mobility as a service", "hub-and-spoke model", "intelligent routing", "demand prediction"],
+    "Energy": ["decentralized production", "demand response", "energy arbitrage", "load balancing"],
+    "Communication": ["network effects", "viral distribution", "peer-to-peer exchange", "information cascade"],
+    "Entertainment": ["user-generated content", "immersive experience", "gamification", "narrative structure"],
+    "Agriculture": ["precision techniques", "crop rotation", "companion planting", "integrated pest management"],
+    "Manufacturing": ["just-in-time production", "modular design", "quality circles", "continuous improvement"],
+    "Retail": ["omnichannel strategy", "experiential retail", "personalized marketing", "inventory optimization"],
+    "Urban Planning": ["mixed-use development", "transit-oriented design", "walkable communities", "green infrastructure"],
+    "Sustainability": ["cradle-to-cradle design", "resource efficiency", "systems thinking", "impact assessment"]
+}
+
+# Cross-domain idea templates
+CROSS_DOMAIN_TEMPLATES = (
+    "Apply {concept1} from {domain1} to solve {problem} in {domain2}",
+    "Combine {concept1} from {domain1} with {concept2} from {domain2} to create a novel solution",
+    "Use {domain1}'s approach to {action} as inspiration for addressing {problem}",
+    "Adapt the concept of {concept1} from {domain1} to revolutionize how {problem} is approached",
+    "Implement a hybrid model combining {concept1} from {domain1} and {concept2} from {domain2}"
+)
+
+# Actions used in cross-domain ideas
+CROSS_DOMAIN_ACTIONS = (
+    "optimize resources", "enhance user experience", "improve efficiency", 
+    "reduce complexity", "increase adoption", "foster innovation"
+)
+
+# Domain-specific technologies with categories for suggest_technologies
+BASE_SUGGESTED_TECHNOLOGIES = {
+    "Technology": [
+        {"technology": "Machine Learning", "category": "AI & Analytics"},
+        {"technology": "Big Data Analytics", "category": "AI & Analytics"},
+        {"technology": "Cloud Computing", "category": "Infrastructure"},
+        {"technology": "Blockchain", "category": "Security & Trust"},
+        {"technology": "Internet of Things", "category": "Connected Systems"},
+        {"technology": "Augmented Reality", "category": "User Experience"},
+        {"technology": "Natural Language Processing", "category": "AI & Analytics"}
+    ],
+    "Healthcare": [
+        {"technology": "Telemedicine", "category": "Service Delivery"},
+        {"technology": "Electronic Health Records", "category": "Data Management"},
+        {"technology": "Wearable Health Monitors", "category": "Monitoring"},
+        {"technology": "Medical Imaging AI", "category": "Diagnostics"},
+        {"technology": "Health Analytics", "category": "AI & Analytics"},
+        {"technology": "3D Bioprinting", "category": "Manufacturing"}
+    ],
+    "Education": [
+        {"technology": "Learning Management Systems", "category": "Platforms"},
+        {"technology": "Adaptive Learning Software", "category": "Personalization"},
+        {"technology": "Educational Analytics", "category": "AI & Analytics"},
+        {"technology": "Virtual Classrooms", "category": "Service Delivery"},
+        {"technology": "Gamified Learning", "category": "User Experience"}
+    ],
+    "Environment": [
+        {"technology": "Environmental Monitoring", "category": "Monitoring"},
+        {"technology": "Geographic Information Systems", "category": "Mapping & Analysis"},
+        {"technology": "Clean Tech", "category": "Sustainability"},
+        {"technology": "Waste Management Systems", "category": "Sustainability"},
+        {"technology": "Climate Modeling", "category": "AI & Analytics"}
+    ],
+    "Business": [
+        {"technology": "CRM Systems", "category": "Customer Management"},
+        {"technology": "ERP Solutions", "category": "Operations"},
+        {"technology": "Business Intelligence", "category": "AI & Analytics"},
+        {"technology": "Process Automation", "category": "Automation"},
+        {"technology": "Digital Marketing Tools", "category": "Marketing"}
+    ],
+    "Finance": [
+        {"technology": "Payment Processing", "category": "Transactions"},
+        {"technology": "Algorithmic Trading", "category": "Investment"},
+        {"technology": "Blockchain Ledgers", "category": "Security & Trust"},
+        {"technology": "Fraud Detection", "category": "Security & Trust"},
+        {"technology": "Financial Analytics", "category": "AI & Analytics"}
+    ],
+    "Transportation": [
+        {"technology": "Route Optimization", "category": "Logistics"},
+        {"technology": "Autonomous Vehicles", "category": "Automation"},
+        {"technology": "Traffic Management Systems", "category": "Infrastructure"},
+        {"technology": "Fleet Telematics", "category": "Monitoring"},
+        {"technology": "Mobility Platforms", "category": "Service Delivery"}
+    ],
+    "Energy": [
+        {"technology": "Smart Grid", "category": "Infrastructure"},
+        {"technology": "Energy Storage", "category": "Storage"},
+        {"technology": "Renewable Energy Tech", "category": "Generation"},
+        {"technology": "Energy Analytics", "category": "AI & Analytics"},
+        {"technology": "Building Management Systems", "category": "Automation"}
+    ],
+    "Communication": [
+        {"technology": "Real-time Messaging", "category": "Service Delivery"},
+        {"technology": "Video Conferencing", "category": "Service Delivery"},
+        {"technology": "Collaborative Platforms", "category": "Collaboration"},
+        {"technology": "Content Management", "category": "Data Management"},
+        {"technology": "Language Translation", "category": "AI & Analytics"}
+    ]
+}
+
+# Categories a knowledge base concept may be suggested under, per domain
+CONCEPT_CATEGORIES = {
+    "Technology": ("AI & Analytics", "Infrastructure", "Connected Systems", "Security & Trust"),
+    "Healthcare": ("Diagnostics", "Monitoring", "Data Management", "Service Delivery"),
+    "Education": ("Platforms", "Personalization", "Content Delivery", "Assessment Tools"),
+    "Business": ("Operations", "Analytics", "Security", "Automation", "Customer Management"),
+    "Finance": ("Operations", "Analytics", "Security", "Automation", "Customer Management"),
+    "Manufacturing": ("Automation", "Quality Control", "Supply Chain", "Production"),
+    "Sustainability": ("Monitoring", "Resource Management", "Sustainability", "Analytics"),
+    "Environment": ("Monitoring", "Resource Management", "Sustainability", "Analytics"),
+    "Transportation": ("Logistics", "Safety", "Infrastructure", "Automation")
+}
+DEFAULT_CONCEPT_CATEGORIES = ("Core Technology", "Integration", "Analytics", "Automation")
+
+# Cross-domain technologies for suggest_technologies
+SUGGESTED_CROSS_DOMAIN_TECHNOLOGIES = (
+    ("Data Visualization", "Presentation"),
+    ("API Integration", "Connectivity"),
+    ("Mobile Applications", "Service Delivery"),
+    ("Cloud Services", "Infrastructure"),
+    ("Automation Workflows", "Automation"),
+    ("Digital Twin Systems", "Simulation"),
+    ("Edge Computing", "Infrastructure"),
+    ("Knowledge Graphs", "Data Management"),
+    ("Progressive Web Apps", "Service Delivery"),
+    ("Low-Code Platforms", "Development")
+)
+
+def get_domain_concepts():
+    """
+    Get the knowledge base concepts for each mapped domain.
+    
+    Returns:
+        dict: Domain name to its list of concepts from TECH_DOMAINS
+    """
+    return {
+        domain: TECH_DOMAINS[domain_key]["concepts"]
+        for domain, domain_key in DOMAIN_MAPPING.items()
+        if domain_key in TECH_DOMAINS and "concepts" in TECH_DOMAINS[domain_key]
+    }
+
+def get_emerging_technology_category(tech_name):
+    """Get the suggestion category for an emerging technology from its name"""
+    if "Computing" in tech_name or "AI" in tech_name:
+        return "Advanced Computing"
+    elif "Energy" in tech_name:
+        return "Energy Innovation"
+    elif "Reality" in tech_name or "Interface" in tech_name:
+        return "Human-Computer Interaction"
+    elif "Biology" in tech_name:
+        return "Biotechnology"
+    return "Emerging Technology"
+
+def build_technology_catalogues():
+    """
+    Merge the baseline catalogues with the domain knowledge base.
+    
+    Returns:
+        dict: Read-only catalogues keyed by name:
+            domain_technologies: domain -> tuple of technology names
+            cross_domain_technologies: tuple of technology names
+            domain_concepts: domain -> tuple of innovation concepts
+            suggested_technologies: domain -> tuple of (technology, categories)
+                pairs, where categories is a tuple to pick the category from
+            emerging_technologies: tuple of (technology, category) pairs
+            mature_emerging_technologies: the same, without "Early" technologies
+            high_potential_technologies: tuple of EMERGING_TECHNOLOGIES entries
+                with high disruption potential
+    """
+    domain_concepts = get_domain_concepts()
+    
+    # Technologies for extract_technologies
+    domain_technologies = {domain: list(techs) for domain, techs in BASE_DOMAIN_TECHNOLOGIES.items()}
+    for domain, concepts in domain_concepts.items():
+        domain_technologies.setdefault(domain, []).extend(concept.lower() for concept in concepts)
+    
+    # Only technologies past the "Early" stage count as cross-domain
+    cross_domain_technologies = BASE_CROSS_DOMAIN_TECHNOLOGIES + [
+        tech["technology"].lower() for tech in EMERGING_TECHNOLOGIES if tech["maturity"] != "Early"
+    ]
+    
+    # Concepts for generate_cross_domain_ideas, formatted as solution approaches
+    innovation_concepts = {domain: list(concepts) for domain, concepts in BASE_DOMAIN_CONCEPTS.items()}
+    for domain, concepts in domain_concepts.items():
+        innovation_concepts.setdefault(domain, []).extend(
+            concept.lower().replace(" ", "-") + " approach" for concept in concepts
+        )
+    
+    # Technologies for suggest_technologies; concepts get a category picked per suggestion
+    suggested_technologies = {
+        domain: [(tech["technology"], (tech["category"],)) for tech in techs]
+        for domain, techs in BASE_SUGGESTED_TECHNOLOGIES.items()
+    }
+    for domain, concepts in domain_concepts.items():
+        categories = CONCEPT_CATEGORIES.get(domain, DEFAULT_CONCEPT_CATEGORIES)
+        suggested_technologies.setdefault(domain, []).extend((concept, categories) for concept in concepts)
+    
+    return {
+        "domain_technologies": MappingProxyType({
+            domain: tuple(techs) for domain, techs in domain_technologies.items()
+        }),
+        "cross_domain_technologies": tuple(cross_domain_technologies),
+        "domain_concepts": MappingProxyType({
+            domain: tuple(concepts) for domain, concepts in innovation_concepts.items()
+        }),
+        "suggested_technologies": MappingProxyType({
+            domain: tuple(techs) for domain, techs in suggested_technologies.items()
+        }),
+        "emerging_technologies": tuple(
+            (tech["technology"], get_emerging_technology_category(tech["technology"]))
+            for tech in EMERGING_TECHNOLOGIES
+        ),
+        "mature_emerging_technologies": tuple(
+            (tech["technology"], get_emerging_technology_category(tech["technology"]))
+            for tech in EMERGING_TECHNOLOGIES if tech["maturity"] != "Early"
+        ),
+        "high_potential_technologies": tuple(
+            tech for tech in EMERGING_TECHNOLOGIES
+            if tech.get("disruption_potential", "") in ["High", "Very High"]
+        )
+    }
+
+# Built once at import; the generators below only read these
+_CATALOGUES = build_technology_catalogues()
+DOMAIN_TECHNOLOGIES = _CATALOGUES["domain_technologies"]
+CROSS_DOMAIN_TECHNOLOGIES = _CATALOGUES["cross_domain_technologies"]
+DOMAIN_CONCEPTS = _CATALOGUES["domain_concepts"]
+SUGGESTED_TECHNOLOGIES = _CATALOGUES["suggested_technologies"]
+EMERGING_TECHNOLOGY_ENTRIES = _CATALOGUES["emerging_technologies"]
+MATURE_EMERGING_TECHNOLOGY_ENTRIES = _CATALOGUES["mature_emerging_technologies"]
+HIGH_POTENTIAL_TECHNOLOGIES = _CATALOGUES["high_potential_technologies"]
+
+def generate_innovations(problem_analysis, insights, level=3, rng=None):
     """
     Generate innovative solutions based on problem analysis and insights.
     
@@ -14,10 +365,15 @@ def generate_innovations(problem_analysis, insights, level=3):
         problem_analysis (dict): The problem analysis from analyze_problem
         insights (dict): The insights from generate_insights
         level (int): Innovation level (1-5, with 5 being most innovative)
+        rng (random.Random, optional): Random generator to use; by default one
+            is seeded from the problem text and level
         
     Returns:
         dict: A dictionary containing innovative solutions
     """
+    if rng is None:
+        rng = make_rng(problem_analysis['text'], level)
+    
     # Get relevant data
     objectives = problem_analysis['objectives']
     key_phrases = problem_analysis['key_phrases']
@@ -25,13 +381,13 @@ def generate_innovations(problem_analysis, insights, level=3):
     trends = insights['trends']
     
     # Generate main solutions
-    solutions = generate_solutions(problem_analysis, insights, level)
+    solutions = generate_solutions(problem_analysis, insights, level, rng)
     
     # Generate cross-domain innovation ideas
-    cross_domain = generate_cross_domain_ideas(problem_analysis, domain_relevance, level)
+    cross_domain = generate_cross_domain_ideas(problem_analysis, domain_relevance, level, rng)
     
     # Generate technology suggestions
-    technologies = suggest_technologies(problem_analysis, domain_relevance, level)
+    technologies = suggest_technologies(problem_analysis, domain_relevance, level, rng)
     
     # Return the innovations
     return {
@@ -40,103 +396,20 @@ def generate_innovations(problem_analysis, insights, level=3):
         "technologies": technologies
     }
 
-def generate_solutions(problem_analysis, insights, level):
+def generate_solutions(problem_analysis, insights, level, rng=random):
     """
     Generate main solutions based on problem analysis and insights.
     
     Returns:
         list: List of solution dictionaries
     """
-    # Solution templates based on innovation level
-    solution_templates = {
-        1: [  # Conservative solutions
-            "Optimize existing {process} to improve {outcome}",
-            "Enhance {feature} to better meet {need}",
-            "Streamline {process} to reduce {problem}",
-            "Update {system} to incorporate {trend}"
-        ],
-        2: [  # Moderate solutions
-            "Integrate {technology} into existing {system} to enhance {outcome}",
-            "Develop a new approach to {process} that addresses {gap}",
-            "Create a platform that connects {stakeholder1} with {stakeholder2}",
-            "Implement a feedback system that improves {process} based on {data}"
-        ],
-        3: [  # Balanced solutions
-            "Build a {technology}-powered system that transforms how {stakeholders} approach {problem}",
-            "Create an ecosystem where {stakeholder1} and {stakeholder2} collaborate to solve {problem}",
-            "Develop a hybrid solution combining {approach1} and {approach2} to address {problem}",
-            "Design a modular system that adapts to changing {conditions} while maintaining {outcome}"
-        ],
-        4: [  # Innovative solutions
-            "Leverage {technology1} and {technology2} to create a novel approach to {problem}",
-            "Develop an AI-driven platform that continuously optimizes {process} based on {data}",
-            "Create a decentralized system where {stakeholders} contribute to solving {problem}",
-            "Build a predictive model that identifies potential {problems} before they occur"
-        ],
-        5: [  # Disruptive solutions
-            "Reimagine the entire {industry} paradigm through the integration of {technology1}, {technology2}, and {approach}",
-            "Create a self-evolving ecosystem that autonomously adapts to changes in {conditions}",
-            "Develop a platform that fundamentally changes how {stakeholders} interact with {system}",
-            "Design a solution that eliminates the root cause of {problem} rather than treating symptoms"
-        ]
-    }
-    
-    # Solution description templates
-    description_templates = [
-        "A {adjective} approach that addresses {problem} through innovative use of {technology}",
-        "This solution tackles {problem} by {action}, resulting in improved {outcome}",
-        "By combining {approach1} with {approach2}, this solution offers a unique way to address {problem}",
-        "A {scale} solution designed to transform how {stakeholders} deal with {problem}",
-        "An innovative framework that allows {stakeholders} to overcome {problem} through {approach}"
-    ]
-    
     # Get elements to fill in templates
-    processes = extract_processes(problem_analysis)
-    problems = extract_problems(problem_analysis)
-    technologies = extract_technologies(insights)
-    stakeholders = extract_stakeholders(problem_analysis)
-    approaches = [
-        "data-driven decision making", 
-        "user-centered design", 
-        "agile implementation", 
-        "systems thinking", 
-        "collaborative innovation",
-        "iterative prototyping",
-        "predictive analytics",
-        "cross-functional integration"
-    ]
-    outcomes = [
-        "efficiency", "productivity", "user satisfaction", "cost reduction", 
-        "quality improvement", "sustainability", "scalability", "innovation"
-    ]
-    features = [
-        "user interface", "analytics dashboard", "automation capabilities", 
-        "integration options", "customization features", "reporting tools"
-    ]
-    systems = [
-        "platform", "framework", "application", "algorithm", "ecosystem", 
-        "infrastructure", "network", "database"
-    ]
-    conditions = [
-        "market demands", "user needs", "technological advancements", 
-        "regulatory requirements", "competitive pressures", "resource constraints"
-    ]
-    adjectives = [
-        "revolutionary", "holistic", "integrated", "scalable", "adaptable",
-        "intuitive", "efficient", "sustainable", "intelligent", "resilient"
-    ]
-    actions = [
-        "redefining the workflow", "integrating disparate systems", 
-        "applying machine learning algorithms", "enabling real-time collaboration",
-        "implementing predictive analytics", "utilizing crowd-sourced data"
-    ]
-    scales = [
-        "enterprise-wide", "community-based", "industry-specific", 
-        "globally applicable", "individually tailored", "team-oriented"
-    ]
-    
+    processes = extract_processes(problem_analysis, rng)
+    problems = extract_problems(problem_analysis, rng)
+    technologies = extract_technologies(insights, rng)
+    stakeholders = extract_stakeholders(problem_analysis, rng)
     # Select appropriate templates based on innovation level
-    templates = solution_templates.get(level, solution_templates[3])
+    templates = SOLUTION_TEMPLATES.get(level, SOLUTION_TEMPLATES[3])
     
     # Number of solutions depends on innovation level
     num_solutions = min(level + 1, 5)
@@ -145,29 +418,29 @@ def generate_solutions(problem_analysis, insights, level):
     solutions = []
     for i in range(num_solutions):
         # Select random elements for templates
-        process = random.choice(processes)
-        problem = random.choice(problems)
-        technology = random.choice(technologies)
-        technology1 = random.choice(technologies)
-        technology2 = random.choice([t for t in technologies if t != technology1]) if len(technologies) > 1 else technology1
-        approach = random.choice(approaches)
-        approach1 = random.choice(approaches)
-        approach2 = random.choice([a for a in approaches if a != approach1])
-        outcome = random.choice(outcomes)
-        feature = random.choice(features)
-        system = random.choice(systems)
-        stakeholder = random.choice(stakeholders)
-        stakeholders_plural = random.choice(stakeholders) + "s"
-        stakeholder1 = random.choice(stakeholders)
-        stakeholder2 = random.choice([s for s in stakeholders if s != stakeholder1]) if len(stakeholders) > 1 else stakeholder1
-        condition = random.choice(conditions)
-        gap = random.choice(insights['gaps']) if insights['gaps'] else "identified gaps"
-        trend = random.choice(insights['trends']) if insights['trends'] else "emerging trends"
-        data = random.choice(["user feedback", "performance metrics", "market data", "analytics"])
-        industry = random.choice(["industry", "sector", "market", "field", "domain"])
+        process = rng.choice(processes)
+        problem = rng.choice(problems)
+        technology = rng.choice(technologies)
+        technology1 = rng.choice(technologies)
+        technology2 = rng.choice([t for t in technologies if t != technology1]) if len(technologies) > 1 else technology1
+        approach = rng.choice(SOLUTION_APPROACHES)
+        approach1 = rng.choice(SOLUTION_APPROACHES)
+        approach2 = rng.choice([a for a in SOLUTION_APPROACHES if a != approach1])
+        outcome = rng.choice(SOLUTION_OUTCOMES)
+        feature = rng.choice(SOLUTION_FEATURES)
+        system = rng.choice(SOLUTION_SYSTEMS)
+        stakeholder = rng.choice(stakeholders)
+        stakeholders_plural = rng.choice(stakeholders) + "s"
+        stakeholder1 = rng.choice(stakeholders)
+        stakeholder2 = rng.choice([s for s in stakeholders if s != stakeholder1]) if len(stakeholders) > 1 else stakeholder1
+        condition = rng.choice(SOLUTION_CONDITIONS)
+        gap = rng.choice(insights['gaps']) if insights['gaps'] else "identified gaps"
+        trend = rng.choice(insights['trends']) if insights['trends'] else "emerging trends"
+        data = rng.choice(SOLUTION_DATA)
+        industry = rng.choice(SOLUTION_INDUSTRIES)
         
         # Create title
-        template = random.choice(templates)
+        template = rng.choice(templates)
         title = template.format(
             process=process, outcome=outcome, feature=feature, problem=problem,
             system=system, technology=technology, gap=gap, trend=trend,
@@ -175,14 +448,15 @@ def generate_solutions(problem_analysis, insights, level):
             stakeholder1=stakeholder1, stakeholder2=stakeholder2,
             technology1=technology1, technology2=technology2,
             approach=approach, approach1=approach1, approach2=approach2,
-            conditions=condition, data=data, industry=industry
+            conditions=condition, data=data, industry=industry,
+            need=f"{stakeholder} needs", problems=problem
         )
         
         # Create description
-        desc_template = random.choice(description_templates)
-        adjective = random.choice(adjectives)
-        action = random.choice(actions)
-        scale = random.choice(scales)
+        desc_template = rng.choice(DESCRIPTION_TEMPLATES)
+        adjective = rng.choice(SOLUTION_ADJECTIVES)
+        action = rng.choice(SOLUTION_ACTIONS)
+        scale = rng.choice(SOLUTION_SCALES)
         
         description = desc_template.format(
             adjective=adjective, problem=problem, technology=technology,
@@ -191,19 +465,22 @@ def generate_solutions(problem_analysis, insights, level):
             approach=approach
         )
         
-        # Create approach details
-        approach_details = generate_approach(problem, technology, approach, level)
+        # Create approach details (steps for prioritization, text for display)
+        approach_steps = generate_approach_steps(problem, technology, approach, level)
         
         # Add solution
         solutions.append({
             "title": title,
             "description": description,
-            "approach": approach_details
+            "approach": format_approach(approach_steps),
+            "steps": approach_steps,
+            "level": level,
+            "technology": technology
         })
     
     return solutions
 
-def extract_processes(problem_analysis):
+def extract_processes(problem_analysis, rng=random):
     """Extract potential processes from problem analysis"""
     processes = []
     
@@ -226,12 +503,12 @@ def extract_processes(problem_analysis):
     ]
     
     while len(processes) < 5:
-        processes.append(random.choice(generic_processes))
+        processes.append(rng.choice(generic_processes))
     
     # Make unique
-    return list(set(processes))
+    return list(dict.fromkeys(processes))
 
-def extract_problems(problem_analysis):
+def extract_problems(problem_analysis, rng=random):
     """Extract potential problems from problem analysis"""
     problems = []
     
@@ -257,96 +534,40 @@ def extract_problems(problem_analysis):
     ]
     
     while len(problems) < 5:
-        problems.append(random.choice(generic_problems))
+        problems.append(rng.choice(generic_problems))
     
     # Make unique
-    return list(set(problems))
+    return list(dict.fromkeys(problems))
 
-def extract_technologies(insights):
+def extract_technologies(insights, rng=random):
     """Extract potential technologies based on insights"""
     # Get top domains
     top_domains = sorted(insights['domain_relevance'].items(), key=lambda x: x[1], reverse=True)[:3]
     
-    # Enhanced domain-technology mapping from our knowledge base
-    enhanced_domain_technologies = {
-        "Technology": ["cloud computing", "AI", "machine learning", "blockchain", "IoT", "AR/VR", "quantum computing"],
-        "Healthcare": ["telehealth", "wearable sensors", "medical imaging", "health informatics", "genomics", "biometrics"],
-        "Education": ["e-learning platforms", "adaptive learning", "educational games", "virtual classrooms", "learning analytics"],
-        "Environment": ["remote sensing", "environmental monitoring", "clean tech", "GIS mapping", "carbon capture"],
-        "Business": ["CRM systems", "ERP solutions", "business intelligence", "process automation", "digital marketing"],
-        "Finance": ["fintech", "payment processing", "blockchain", "algorithmic trading", "risk assessment tools"],
-        "Transportation": ["route optimization", "telematics", "autonomous vehicles", "traffic management systems", "mobility platforms"],
-        "Energy": ["smart grid", "energy storage", "renewable technology", "demand response systems", "energy analytics"],
-        "Communication": ["real-time messaging", "video conferencing", "collaborative platforms", "social media analytics", "content management"],
-        "Entertainment": ["content streaming", "interactive media", "gaming engines", "recommendation algorithms", "digital rights management"],
-        "Agriculture": ["precision farming", "crop monitoring", "agricultural drones", "soil sensors", "farm management software"],
-        "Manufacturing": ["robotics", "industrial IoT", "3D printing", "predictive maintenance", "quality control systems"],
-        "Retail": ["inventory management", "point of sale", "customer analytics", "omnichannel platforms", "supply chain optimization"],
-        "Urban Planning": ["GIS", "traffic simulation", "infrastructure monitoring", "urban analytics", "smart city platforms"],
-        "Sustainability": ["lifecycle assessment", "carbon footprint tracking", "resource management", "sustainability reporting", "circular economy tools"]
-    }
-    
-    # Enhance with domain-specific concepts from our knowledge database
-    from insights_generator import DOMAIN_MAPPING
-    
-    for domain, domain_key in DOMAIN_MAPPING.items():
-        if domain_key in TECH_DOMAINS and "concepts" in TECH_DOMAINS[domain_key]:
-            # Add or extend domain-specific concepts as technologies
-            concepts = [concept.lower() for concept in TECH_DOMAINS[domain_key]["concepts"]]
-            if domain in enhanced_domain_technologies:
-                enhanced_domain_technologies[domain].extend(concepts)
-            else:
-                enhanced_domain_technologies[domain] = concepts
-    
-    # Add emerging technologies from our knowledge base
-    emerging_tech_list = []
-    for tech in EMERGING_TECHNOLOGIES:
-        tech_name = tech["technology"]
-        tech_maturity = tech["maturity"]
-        
-        # Only add technology if it's mature enough (not in "Early" stage)
-        if tech_maturity != "Early":
-            emerging_tech_list.append(tech_name.lower())
-    
-    # Enhanced cross-domain technologies
-    cross_domain_technologies = [
-        "data analytics", "cloud computing", "mobile applications", 
-        "API integration", "automation tools", "visualization software",
-        "collaborative platforms", "AI/ML models", "digital twins"
-    ]
-    
-    # Add emerging technologies to cross-domain list
-    cross_domain_technologies.extend(emerging_tech_list)
-    
     # Collect technologies based on top domains
     technologies = []
     for domain, score in top_domains:
-        domain_techs = enhanced_domain_technologies.get(domain, [])
+        domain_techs = DOMAIN_TECHNOLOGIES.get(domain, ())
         if domain_techs:
             # Add more technologies from higher-scoring domains
             num_techs = min(int(score / 2) + 2, len(domain_techs))  # Add more for enhanced diversity
-            domain_sample = random.sample(domain_techs, min(num_techs, len(domain_techs)))
+            domain_sample = rng.sample(domain_techs, min(num_techs, len(domain_techs)))
             technologies.extend(domain_sample)
     
     # Add some cross-domain technologies
-    cross_domain_count = min(5, len(cross_domain_technologies))  # Increased from 3 to 5
-    cross_domain_sample = random.sample(cross_domain_technologies, cross_domain_count)
+    cross_domain_count = min(5, len(CROSS_DOMAIN_TECHNOLOGIES))  # Increased from 3 to 5
+    cross_domain_sample = rng.sample(CROSS_DOMAIN_TECHNOLOGIES, cross_domain_count)
     technologies.extend(cross_domain_sample)
     
     # If applicable, add a disruptive emerging technology with high potential
-    high_potential_techs = [
-        tech["technology"] for tech in EMERGING_TECHNOLOGIES 
-        if tech.get("disruption_potential", "") in ["High", "Very High"]
-    ]
-    
-    if high_potential_techs and random.random() < 0.7:  # 70% chance to include
-        disruptive_tech = random.choice(high_potential_techs)
-        technologies.append(disruptive_tech.lower())
+    if HIGH_POTENTIAL_TECHNOLOGIES and rng.random() < 0.7:  # 70% chance to include
+        disruptive_tech = rng.choice(HIGH_POTENTIAL_TECHNOLOGIES)
+        technologies.append(disruptive_tech["technology"].lower())
     
-    # Make unique by converting to set and back to list
-    return list(set(technologies))
+    # Make unique, keeping order so seeded runs are reproducible
+    return list(dict.fromkeys(technologies))
 
-def extract_stakeholders(problem_analysis):
+def extract_stakeholders(problem_analysis, rng=random):
     """Extract potential stakeholders from problem analysis"""
     stakeholders = []
     
@@ -378,37 +599,47 @@ def extract_stakeholders(problem_analysis):
     
     # If not enough stakeholders, add some generic ones
     while len(stakeholders) < 5:
-        stakeholders.append(random.choice(generic_stakeholders))
+        stakeholders.append(rng.choice(generic_stakeholders))
     
     # Make unique
-    return list(set(stakeholders))
+    return list(dict.fromkeys(stakeholders))
 
-def generate_approach(problem, technology, approach, level):
+def generate_approach_steps(problem, technology, approach, level):
     """
-    Generate detailed approach for a solution.
+    Generate the steps of the detailed approach for a solution.
     
     Returns:
-        str: Detailed approach
+        list: Step dicts with number, name and description keys
     """
     # Approach components
     components = [
-        f"1. **Analysis Phase**: Begin with a thorough assessment of the {problem} to understand root causes and key requirements.",
-        f"2. **Design Phase**: Develop a {['basic', 'comprehensive', 'innovative', 'transformative', 'revolutionary'][level-1]} solution architecture integrating {technology}.",
-        f"3. **Implementation Strategy**: Use {approach} to build the solution in {['sequential', 'phased', 'iterative', 'adaptive', 'continuous'][level-1]} stages.",
-        f"4. **Integration Plan**: Ensure seamless connection with existing systems and workflows.",
-        f"5. **Validation Approach**: Implement {['standard', 'enhanced', 'multi-dimensional', 'predictive', 'autonomous'][level-1]} testing and validation protocols.",
-        f"6. **Deployment Framework**: Roll out the solution using a {['controlled', 'staged', 'agile', 'dynamic', 'self-optimizing'][level-1]} deployment strategy.",
-        f"7. **Feedback Mechanism**: Establish {['basic', 'comprehensive', 'real-time', 'AI-powered', 'predictive'][level-1]} feedback channels to continuously improve the solution."
+        ("Analysis Phase", f"Begin with a thorough assessment of the {problem} to understand root causes and key requirements."),
+        ("Design Phase", f"Develop a {['basic', 'comprehensive', 'innovative', 'transformative', 'revolutionary'][level-1]} solution architecture integrating {technology}."),
+        ("Implementation Strategy", f"Use {approach} to build the solution in {['sequential', 'phased', 'iterative', 'adaptive', 'continuous'][level-1]} stages."),
+        ("Integration Plan", "Ensure seamless connection with existing systems and workflows."),
+        ("Validation Approach", f"Implement {['standard', 'enhanced', 'multi-dimensional', 'predictive', 'autonomous'][level-1]} testing and validation protocols."),
+        ("Deployment Framework", f"Roll out the solution using a {['controlled', 'staged', 'agile', 'dynamic', 'self-optimizing'][level-1]} deployment strategy."),
+        ("Feedback Mechanism", f"Establish {['basic', 'comprehensive', 'real-time', 'AI-powered', 'predictive'][level-1]} feedback channels to continuously improve the solution.")
     ]
     
     # Select number of components based on level
     num_components = min(level + 2, 7)
-    selected_components = components[:num_components]
     
-    # Join components
-    return "\n".join(selected_components)
+    return [
+        {"number": number, "name": name, "description": description}
+        for number, (name, description) in enumerate(components[:num_components], start=1)
+    ]
+
+def format_approach(steps):
+    """
+    Render approach steps as the markdown shown for a solution.
+    
+    Returns:
+        str: One numbered, bold-titled line per step
+    """
+    return "\n".join(f"{step['number']}. **{step['name']}**: {step['description']}" for step in steps)
 
-def generate_cross_domain_ideas(problem_analysis, domain_relevance, level):
+def generate_cross_domain_ideas(problem_analysis, domain_relevance, level, rng=random):
     """
     Generate cross-domain innovation ideas.
     
@@ -419,52 +650,6 @@ def generate_cross_domain_ideas(problem_analysis, domain_relevance, level):
     top_domains = sorted(domain_relevance.items(), key=lambda x: x[1], reverse=True)[:3]
     top_domain_names = [domain for domain, _ in top_domains]
     
-    # Domain-specific innovation concepts
-    domain_concepts = {
-        "Technology": ["algorithmic approach", "digital platform", "automated system", "data-driven solution"],
-        "Healthcare": ["preventive model", "wellness approach", "patient-centered design", "remote monitoring"],
-        "Education": ["learner-centered model", "adaptive curriculum", "competency-based framework", "peer learning"],
-        "Environment": ["circular economy", "zero-waste approach", "ecosystem thinking", "regenerative design"],
-        "Business": ["value chain optimization", "customer journey mapping", "agile organization", "sustainable business model"],
-        "Finance": ["risk distribution", "value exchange", "resource allocation", "portfolio approach"],
-        "Transportation": ["mobility as a service", "hub-and-spoke model", "intelligent routing", "demand prediction"],
-        "Energy": ["decentralized production", "demand response", "energy arbitrage", "load balancing"],
-        "Communication": ["network effects", "viral distribution", "peer-to-peer exchange", "information cascade"],
-        "Entertainment": ["user-generated content", "immersive experience", "gamification", "narrative structure"],
-        "Agriculture": ["precision techniques", "crop rotation", "companion planting", "integrated pest management"],
-        "Manufacturing": ["just-in-time production", "modular design", "quality circles", "continuous improvement"],
-        "Retail": ["omnichannel strategy", "experiential retail", "personalized marketing", "inventory optimization"],
-        "Urban Planning": ["mixed-use development", "transit-oriented design", "walkable communities", "green infrastructure"],
-        "Sustainability": ["cradle-to-cradle design", "resource efficiency", "systems thinking", "impact assessment"]
-    }
-    
-    # Enhance domain concepts with our knowledge base
-    from insights_generator import DOMAIN_MAPPING
-    
-    for domain, domain_key in DOMAIN_MAPPING.items():
-        if domain_key in TECH_DOMAINS and "concepts" in TECH_DOMAINS[domain_key]:
-            # Select a few concepts to add
-            key_concepts = []
-            for concept in TECH_DOMAINS[domain_key]["concepts"]:
-                # Format concept as a solution approach
-                formatted_concept = concept.lower().replace(" ", "-") + " approach"
-                key_concepts.append(formatted_concept)
-            
-            # Add concepts to domain
-            if domain in domain_concepts:
-                domain_concepts[domain].extend(key_concepts)
-            else:
-                domain_concepts[domain] = key_concepts
-    
-    # Cross-domain idea templates
-    standard_templates = [
-        "Apply {concept1} from {domain1} to solve {problem} in {domain2}",
-        "Combine {concept1} from {domain1} with {concept2} from {domain2} to create a novel solution",
-        "Use {domain1}'s approach to {action} as inspiration for addressing {problem}",
-        "Adapt the concept of {concept1} from {domain1} to revolutionize how {problem} is approached",
-        "Implement a hybrid model combining {concept1} from {domain1} and {concept2} from {domain2}"
-    ]
-    
     # Generate ideas
     ideas = []
     
@@ -473,7 +658,7 @@ def generate_cross_domain_ideas(problem_analysis, domain_relevance, level):
     
     if num_pattern_ideas > 0:
         # Select cross-domain patterns based on level 
-        selected_patterns = random.sample(CROSS_DOMAIN_PATTERNS, num_pattern_ideas)
+        selected_patterns = rng.sample(CROSS_DOMAIN_PATTERNS, num_pattern_ideas)
         
         for pattern in selected_patterns:
             pattern_name = pattern["pattern"]
@@ -482,33 +667,33 @@ def generate_cross_domain_ideas(problem_analysis, domain_relevance, level):
             
             # Get a relevant problem
             if problem_analysis['objectives']:
-                problem = random.choice(problem_analysis['objectives'])
+                problem = rng.choice(problem_analysis['objectives'])
             else:
                 problem = "the core challenge"
             
             # Create idea based on the pattern
             if len(top_domain_names) > 0:
-                domain = random.choice(top_domain_names)
-                idea = f"Apply the '{pattern_name}' pattern ({description}) to {problem} in the {domain} domain, similar to {random.choice(examples)}"
+                domain = rng.choice(top_domain_names)
+                idea = f"Apply the '{pattern_name}' pattern ({description}) to {problem} in the {domain} domain, similar to {rng.choice(examples)}"
             else:
-                idea = f"Use the '{pattern_name}' pattern ({description}) to address {problem}, drawing inspiration from {random.choice(examples)}"
+                idea = f"Use the '{pattern_name}' pattern ({description}) to address {problem}, drawing inspiration from {rng.choice(examples)}"
             
             ideas.append(idea)
     
     # Add methodology-based cross-domain ideas for higher-level innovation
     if level >= 4:
         # Select a problem-solving methodology
-        methodology = random.choice(PROBLEM_SOLVING_METHODOLOGIES)
+        methodology = rng.choice(PROBLEM_SOLVING_METHODOLOGIES)
         methodology_name = methodology["name"]
         techniques = methodology["techniques"]
         best_for = methodology["best_for"]
         
         # Select two techniques from the methodology
-        selected_techniques = random.sample(techniques, min(2, len(techniques)))
+        selected_techniques = rng.sample(techniques, min(2, len(techniques)))
         
         # Create the idea
         if problem_analysis['objectives']:
-            problem = random.choice(problem_analysis['objectives'])
+            problem = rng.choice(problem_analysis['objectives'])
         else:
             problem = "the core challenge"
             
@@ -522,29 +707,27 @@ def generate_cross_domain_ideas(problem_analysis, domain_relevance, level):
     for _ in range(num_standard_ideas):
         # Select two different domains
         if len(top_domain_names) >= 2:
-            domain1, domain2 = random.sample(top_domain_names, 2)
+            domain1, domain2 = rng.sample(top_domain_names, 2)
         else:
             # If we don't have enough domains, select one from top and one random
-            domain1 = top_domain_names[0] if top_domain_names else random.choice(list(domain_concepts.keys()))
-            domain2 = random.choice([d for d in domain_relevance.keys() if d != domain1])
+            domain1 = top_domain_names[0] if top_domain_names else rng.choice(list(DOMAIN_CONCEPTS))
+            domain2 = rng.choice([d for d in domain_relevance.keys() if d != domain1])
         
         # Get concepts from each domain (ensuring they exist in our dictionary)
-        concept1 = random.choice(domain_concepts.get(domain1, ["innovative approach"]))
-        concept2 = random.choice(domain_concepts.get(domain2, ["novel methodology"]))
+        concept1 = rng.choice(DOMAIN_CONCEPTS.get(domain1, ("innovative approach",)))
+        concept2 = rng.choice(DOMAIN_CONCEPTS.get(domain2, ("novel methodology",)))
         
         # Select template and fill in
-        template = random.choice(standard_templates)
+        template = rng.choice(CROSS_DOMAIN_TEMPLATES)
         
         # Get problem
         if problem_analysis['objectives']:
-            problem = random.choice(problem_analysis['objectives'])
+            problem = rng.choice(problem_analysis['objectives'])
         else:
             problem = "the core challenge"
         
         # Actions
-        actions = ["optimize resources", "enhance user experience", "improve efficiency", 
-                  "reduce complexity", "increase adoption", "foster innovation"]
-        action = random.choice(actions)
+        action = rng.choice(CROSS_DOMAIN_ACTIONS)
         
         # Create idea
         idea = template.format(
@@ -559,193 +742,33 @@ def generate_cross_domain_ideas(problem_analysis, domain_relevance, level):
         ideas.append(idea)
     
     # Ensure ideas are unique
-    unique_ideas = list(set(ideas))
+    unique_ideas = list(dict.fromkeys(ideas))
     
     # For very high innovation levels, add an emerging technology cross-domain idea
     if level >= 5 and len(unique_ideas) < 7:
         # Select a high-potential emerging technology
-        high_potential_techs = [
-            tech for tech in EMERGING_TECHNOLOGIES 
-            if tech.get("disruption_potential", "") in ["High", "Very High"]
-        ]
-        
-        if high_potential_techs:
-            tech = random.choice(high_potential_techs)
+        if HIGH_POTENTIAL_TECHNOLOGIES:
+            tech = rng.choice(HIGH_POTENTIAL_TECHNOLOGIES)
             tech_name = tech["technology"]
             applications = tech["applications"]
             
             # Create a cross-domain idea that combines the technology with a relevant domain
             if top_domain_names:
-                domain = random.choice(top_domain_names)
-                application = random.choice(applications)
+                domain = rng.choice(top_domain_names)
+                application = rng.choice(applications)
                 
                 idea = f"Explore how {tech_name} could revolutionize {domain} through {application}, creating entirely new possibilities"
                 unique_ideas.append(idea)
     
     return unique_ideas
 
-def suggest_technologies(problem_analysis, domain_relevance, level):
+def suggest_technologies(problem_analysis, domain_relevance, level, rng=random):
     """
     Suggest technologies relevant to the problem.
     
     Returns:
         list: Technology suggestions with relevance scores
     """
-    # Domain-specific technologies with categories
-    domain_technologies = {
-        "Technology": [
-            {"technology": "Machine Learning", "category": "AI & Analytics"},
-            {"technology": "Big Data Analytics", "category": "AI & Analytics"},
-            {"technology": "Cloud Computing", "category": "Infrastructure"},
-            {"technology": "Blockchain", "category": "Security & Trust"},
-            {"technology": "Internet of Things", "category": "Connected Systems"},
-            {"technology": "Augmented Reality", "category": "User Experience"},
-            {"technology": "Natural Language Processing", "category": "AI & Analytics"}
-        ],
-        "Healthcare": [
-            {"technology": "Telemedicine", "category": "Service Delivery"},
-            {"technology": "Electronic Health Records", "category": "Data Management"},
-            {"technology": "Wearable Health Monitors", "category": "Monitoring"},
-            {"technology": "Medical Imaging AI", "category": "Diagnostics"},
-            {"technology": "Health Analytics", "category": "AI & Analytics"},
-            {"technology": "3D Bioprinting", "category": "Manufacturing"}
-        ],
-        "Education": [
-            {"technology": "Learning Management Systems", "category": "Platforms"},
-            {"technology": "Adaptive Learning Software", "category": "Personalization"},
-            {"technology": "Educational Analytics", "category": "AI & Analytics"},
-            {"technology": "Virtual Classrooms", "category": "Service Delivery"},
-            {"technology": "Gamified Learning", "category": "User Experience"}
-        ],
-        "Environment": [
-            {"technology": "Environmental Monitoring", "category": "Monitoring"},
-            {"technology": "Geographic Information Systems", "category": "Mapping & Analysis"},
-            {"technology": "Clean Tech", "category": "Sustainability"},
-            {"technology": "Waste Management Systems", "category": "Sustainability"},
-            {"technology": "Climate Modeling", "category": "AI & Analytics"}
-        ],
-        "Business": [
-            {"technology": "CRM Systems", "category": "Customer Management"},
-            {"technology": "ERP Solutions", "category": "Operations"},
-            {"technology": "Business Intelligence", "category": "AI & Analytics"},
-            {"technology": "Process Automation", "category": "Automation"},
-            {"technology": "Digital Marketing Tools", "category": "Marketing"}
-        ],
-        "Finance": [
-            {"technology": "Payment Processing", "category": "Transactions"},
-            {"technology": "Algorithmic Trading", "category": "Investment"},
-            {"technology": "Blockchain Ledgers", "category": "Security & Trust"},
-            {"technology": "Fraud Detection", "category": "Security & Trust"},
-            {"technology": "Financial Analytics", "category": "AI & Analytics"}
-        ],
-        "Transportation": [
-            {"technology": "Route Optimization", "category": "Logistics"},
-            {"technology": "Autonomous Vehicles", "category": "Automation"},
-            {"technology": "Traffic Management Systems", "category": "Infrastructure"},
-            {"technology": "Fleet Telematics", "category": "Monitoring"},
-            {"technology": "Mobility Platforms", "category": "Service Delivery"}
-        ],
-        "Energy": [
-            {"technology": "Smart Grid", "category": "Infrastructure"},
-            {"technology": "Energy Storage", "category": "Storage"},
-            {"technology": "Renewable Energy Tech", "category": "Generation"},
-            {"technology": "Energy Analytics", "category": "AI & Analytics"},
-            {"technology": "Building Management Systems", "category": "Automation"}
-        ],
-        "Communication": [
-            {"technology": "Real-time Messaging", "category": "Service Delivery"},
-            {"technology": "Video Conferencing", "category": "Service Delivery"},
-            {"technology": "Collaborative Platforms", "category": "Collaboration"},
-            {"technology": "Content Management", "category": "Data Management"},
-            {"technology": "Language Translation", "category": "AI & Analytics"}
-        ]
-    }
-    
-    # Enhance with domain-specific technologies from our knowledge database
-    from insights_generator import DOMAIN_MAPPING
-    
-    for domain, domain_key in DOMAIN_MAPPING.items():
-        if domain_key in TECH_DOMAINS and "concepts" in TECH_DOMAINS[domain_key]:
-            # Create a list of technology entries from concepts
-            enhanced_technologies = []
-            
-            # Define appropriate categories based on domain
-            if domain == "Technology":
-                categories = ["AI & Analytics", "Infrastructure", "Connected Systems", "Security & Trust"]
-            elif domain == "Healthcare":
-                categories = ["Diagnostics", "Monitoring", "Data Management", "Service Delivery"]
-            elif domain == "Education":
-                categories = ["Platforms", "Personalization", "Content Delivery", "Assessment Tools"]
-            elif domain == "Business" or domain == "Finance":
-                categories = ["Operations", "Analytics", "Security", "Automation", "Customer Management"]
-            elif domain == "Manufacturing":
-                categories = ["Automation", "Quality Control", "Supply Chain", "Production"]
-            elif domain == "Sustainability" or domain == "Environment":
-                categories = ["Monitoring", "Resource Management", "Sustainability", "Analytics"]
-            elif domain == "Transportation":
-                categories = ["Logistics", "Safety", "Infrastructure", "Automation"]
-            else:
-                categories = ["Core Technology", "Integration", "Analytics", "Automation"]
-            
-            # Create technology entries from concepts
-            for concept in TECH_DOMAINS[domain_key]["concepts"]:
-                category = random.choice(categories)
-                tech_entry = {
-                    "technology": concept,
-                    "category": category
-                }
-                enhanced_technologies.append(tech_entry)
-            
-            # Add or update domain technologies
-            if domain in domain_technologies:
-                domain_technologies[domain].extend(enhanced_technologies)
-            else:
-                domain_technologies[domain] = enhanced_technologies
-    
-    # Add emerging technologies from our knowledge base
-    emerging_tech_entries = []
-    
-    for tech in EMERGING_TECHNOLOGIES:
-        tech_name = tech["technology"]
-        maturity = tech["maturity"]
-        disruption = tech.get("disruption_potential", "Medium")
-        
-        # Skip very early-stage technologies for lower innovation levels
-        if maturity == "Early" and level < 4:
-            continue
-            
-        # Determine appropriate category based on technology
-        if "Computing" in tech_name or "AI" in tech_name:
-            category = "Advanced Computing"
-        elif "Energy" in tech_name:
-            category = "Energy Innovation"
-        elif "Reality" in tech_name or "Interface" in tech_name:
-            category = "Human-Computer Interaction"
-        elif "Biology" in tech_name:
-            category = "Biotechnology"
-        else:
-            category = "Emerging Technology"
-        
-        tech_entry = {
-            "technology": tech_name,
-            "category": category
-        }
-        emerging_tech_entries.append(tech_entry)
-    
-    # Cross-domain technologies
-    cross_domain_technologies = [
-        {"technology": "Data Visualization", "category": "Presentation"},
-        {"technology": "API Integration", "category": "Connectivity"},
-        {"technology": "Mobile Applications", "category": "Service Delivery"},
-        {"technology": "Cloud Services", "category": "Infrastructure"},
-        {"technology": "Automation Workflows", "category": "Automation"},
-        {"technology": "Digital Twin Systems", "category": "Simulation"},
-        {"technology": "Edge Computing", "category": "Infrastructure"},
-        {"technology": "Knowledge Graphs", "category": "Data Management"},
-        {"technology": "Progressive Web Apps", "category": "Service Delivery"},
-        {"technology": "Low-Code Platforms", "category": "Development"}
-    ]
-    
     # Get top domains
     top_domains = sorted(domain_relevance.items(), key=lambda x: x[1], reverse=True)[:3]
     
@@ -754,55 +777,58 @@ def suggest_technologies(problem_analysis, domain_relevance, level):
     
     # Add domain-specific technologies
     for domain, score in top_domains:
-        domain_techs = domain_technologies.get(domain, [])
+        domain_techs = SUGGESTED_TECHNOLOGIES.get(domain, ())
         if domain_techs:
             # Number of technologies depends on domain relevance and level
             num_techs = min(level + 2, len(domain_techs))
-            selected_techs = random.sample(domain_techs, min(num_techs, len(domain_techs)))
+            selected_techs = rng.sample(domain_techs, min(num_techs, len(domain_techs)))
             
-            for tech in selected_techs:
+            for technology, categories in selected_techs:
                 # Calculate relevance based on domain score and add small variation
-                relevance = score * random.uniform(0.7, 1.0)
-                tech_entry = tech.copy()
-                tech_entry["relevance"] = float(min(10.0, max(1.0, relevance)))
-                suggested_technologies.append(tech_entry)
+                relevance = score * rng.uniform(0.7, 1.0)
+                suggested_technologies.append({
+                    "technology": technology,
+                    "category": rng.choice(categories),
+                    "relevance": float(min(10.0, max(1.0, relevance)))
+                })
     
     # Add cross-domain technologies
-    num_cross_domain = min(level + 1, len(cross_domain_technologies))
-    selected_cross_domain = random.sample(cross_domain_technologies, min(num_cross_domain, len(cross_domain_technologies)))
+    num_cross_domain = min(level + 1, len(SUGGESTED_CROSS_DOMAIN_TECHNOLOGIES))
+    selected_cross_domain = rng.sample(SUGGESTED_CROSS_DOMAIN_TECHNOLOGIES, num_cross_domain)
     
-    for tech in selected_cross_domain:
+    for technology, category in selected_cross_domain:
         # Random relevance for cross-domain technologies
-        relevance = random.uniform(5, 8)
-        tech_entry = tech.copy()
-        tech_entry["relevance"] = relevance
-        suggested_technologies.append(tech_entry)
+        suggested_technologies.append({
+            "technology": technology,
+            "category": category,
+            "relevance": rng.uniform(5, 8)
+        })
     
     # For higher innovation levels, add emerging technologies
     if level >= 3:
+        # Skip very early-stage technologies for lower innovation levels
+        emerging_tech_entries = EMERGING_TECHNOLOGY_ENTRIES if level >= 4 else MATURE_EMERGING_TECHNOLOGY_ENTRIES
+        
         # Number of emerging technologies depends on innovation level
         num_emerging = min(level - 1, len(emerging_tech_entries))
         
-        if num_emerging > 0 and emerging_tech_entries:
-            selected_emerging = random.sample(emerging_tech_entries, min(num_emerging, len(emerging_tech_entries)))
+        if num_emerging > 0:
+            selected_emerging = rng.sample(emerging_tech_entries, num_emerging)
             
-            for tech in selected_emerging:
+            for technology, category in selected_emerging:
                 # Emerging technologies have higher variability in relevance
-                relevance = random.uniform(7, 10) if level >= 4 else random.uniform(4, 8)
-                tech_entry = tech.copy()
-                tech_entry["relevance"] = relevance
-                suggested_technologies.append(tech_entry)
+                relevance = rng.uniform(7, 10) if level >= 4 else rng.uniform(4, 8)
+                suggested_technologies.append({
+                    "technology": technology,
+                    "category": category,
+                    "relevance": relevance
+                })
     
     # For highest innovation level, ensure a breakthrough technology is included
     if level == 5:
         # Look for high disruption potential technologies
-        high_potential_techs = [
-            tech for tech in EMERGING_TECHNOLOGIES 
-            if tech.get("disruption_potential", "") in ["High", "Very High"]
-        ]
-        
-        if high_potential_techs:
-            selected_tech = random.choice(high_potential_techs)
+        if HIGH_POTENTIAL_TECHNOLOGIES:
+            selected_tech = rng.choice(HIGH_POTENTIAL_TECHNOLOGIES)
             tech_name = selected_tech["technology"]
             
             # Check if this technology is already included
@@ -1,6 +1,10 @@
+import re
 import random
 import pandas as pd
 from collections import Counter
+from types import MappingProxyType
+from keyword_matcher import KeywordMatcher
+from data_utils import make_rng
 from domain_knowledge import (
     TECH_DOMAINS, 
     CROSS_DOMAIN_PATTERNS, 
@@ -29,36 +33,251 @@ DOMAIN_MAPPING = {
     "Sustainability": "sustainability"
 }
 
-def generate_insights(problem_analysis, depth=3):
+# Keywords signalling each domain (matched as case-insensitive substrings)
+DOMAIN_KEYWORDS = {
+    "Technology": ["digital", "tech", "software", "hardware", "app", "online", "internet", "algorithm", "data", "computer", "AI", "artificial intelligence", "machine learning"],
+    "Healthcare": ["health", "medical", "patient", "doctor", "hospital", "wellness", "disease", "treatment", "care", "clinical", "diagnosis"],
+    "Education": ["education", "learning", "student", "teach", "school", "university", "training", "curriculum", "classroom", "knowledge", "skill"],
+    "Environment": ["environment", "sustainability", "climate", "green", "eco", "pollution", "conservation", "waste", "recycling", "natural", "energy"],
+    "Business": ["business", "company", "organization", "market", "customer", "product", "service", "strategy", "management", "operation"],
+    "Finance": ["finance", "money", "budget", "cost", "investment", "fund", "economic", "profit", "revenue", "expense", "financial"],
+    "Transportation": ["transport", "vehicle", "car", "bus", "train", "traffic", "commute", "travel", "mobility", "logistics"],
+    "Energy": ["energy", "power", "electricity", "fuel", "renewable", "solar", "wind", "grid", "consumption", "efficiency"],
+    "Communication": ["communication", "message", "media", "information", "network", "social", "community", "connect", "interaction"],
+    "Entertainment": ["entertainment", "media", "game", "video", "music", "film", "art", "leisure", "play", "creative"],
+    "Agriculture": ["agriculture", "farm", "crop", "food", "harvest", "soil", "plant", "livestock", "organic", "cultivation"],
+    "Manufacturing": ["manufacturing", "production", "factory", "industry", "assembly", "quality", "product", "process", "automation"],
+    "Retail": ["retail", "store", "shop", "consumer", "customer", "product", "sale", "purchase", "e-commerce", "market"],
+    "Urban Planning": ["urban", "city", "planning", "infrastructure", "building", "community", "development", "public", "space", "design"],
+    "Sustainability": ["sustainable", "renewable", "eco-friendly", "green", "environmental", "conservation", "resource", "efficiency", "circular"]
+}
+
+# Compiled once so each text is scanned in a single pass
+DOMAIN_MATCHER = KeywordMatcher(DOMAIN_KEYWORDS)
+
+# Baseline trends for each domain (extended from domain_knowledge in build_domain_trends)
+BASE_DOMAIN_TRENDS = {
+    "Technology": [
+        "Increasing adoption of AI and machine learning for automation",
+        "Growing focus on user experience and interface design",
+        "Rising importance of cybersecurity and data privacy",
+        "Shift towards cloud-based and distributed computing",
+        "Integration of IoT devices in everyday products and services"
+    ],
+    "Healthcare": [
+        "Growing focus on preventive healthcare and wellness",
+        "Increasing use of telemedicine and remote monitoring",
+        "Rise of personalized medicine and treatment plans",
+        "Integration of AI in diagnostics and treatment recommendations",
+        "Greater emphasis on mental health and holistic well-being"
+    ],
+    "Education": [
+        "Shift towards personalized and adaptive learning approaches",
+        "Integration of technology in classroom and remote education",
+        "Growing emphasis on lifelong learning and skill development",
+        "Rise of microlearning and bite-sized educational content",
+        "Focus on developing critical thinking and problem-solving skills"
+    ],
+    "Environment": [
+        "Increasing focus on circular economy and waste reduction",
+        "Growing adoption of renewable energy sources",
+        "Rising consumer demand for sustainable products",
+        "Development of innovative techniques for carbon capture",
+        "Implementation of stricter environmental regulations"
+    ],
+    "Business": [
+        "Shift towards remote and flexible work arrangements",
+        "Growing importance of digital transformation",
+        "Rise of subscription-based business models",
+        "Increasing focus on customer experience and personalization",
+        "Growing emphasis on corporate social responsibility"
+    ],
+    "Finance": [
+        "Rise of digital and mobile payment systems",
+        "Growing adoption of blockchain and cryptocurrency",
+        "Increasing focus on financial inclusion",
+        "Development of AI-driven financial advice and services",
+        "Shift towards sustainable and ethical investing"
+    ],
+    "Transportation": [
+        "Growing development of autonomous vehicles",
+        "Shift towards electric and alternative fuel vehicles",
+        "Rise of shared mobility services",
+        "Integration of smart technology in transportation infrastructure",
+        "Focus on last-mile delivery solutions"
+    ],
+    "Energy": [
+        "Increasing investment in renewable energy sources",
+        "Development of more efficient energy storage solutions",
+        "Growth of smart grid technology and infrastructure",
+        "Focus on decentralized energy production",
+        "Rising adoption of energy-efficient technologies"
+    ],
+    "Communication": [
+        "Growing importance of visual communication",
+        "Rise of real-time and asynchronous collaboration tools",
+        "Increasing personalization of communication channels",
+        "Development of more immersive communication technologies",
+        "Focus on inclusive and accessible communication"
+    ],
+    "Entertainment": [
+        "Shift towards streaming and on-demand content",
+        "Growing integration of AR and VR in entertainment",
+        "Rise of interactive and participatory entertainment",
+        "Increasing personalization of content recommendations",
+        "Development of more immersive gaming experiences"
+    ],
+    "Agriculture": [
+        "Adoption of precision agriculture techniques",
+        "Integration of IoT and sensors in farming",
+        "Growing focus on sustainable and regenerative practices",
+        "Development of vertical and urban farming solutions",
+        "Rise of alternative protein sources and lab-grown foods"
+    ],
+    "Manufacturing": [
+        "Increasing automation and use of robotics",
+        "Adoption of additive manufacturing (3D printing)",
+        "Growing implementation of Industry 4.0 principles",
+        "Focus on sustainable and circular manufacturing",
+        "Rise of customization and on-demand production"
+    ],
+    "Retail": [
+        "Growing integration of online and offline shopping experiences",
+        "Rise of experiential retail and immersive shopping",
+        "Increasing use of AI for personalized recommendations",
+        "Development of faster and more efficient delivery methods",
+        "Focus on sustainability and ethical sourcing"
+    ],
+    "Urban Planning": [
+        "Growing development of smart city infrastructure",
+        "Increasing focus on walkability and public spaces",
+        "Rise of mixed-use developments and urban villages",
+        "Integration of green spaces and natural elements",
+        "Focus on resilience and adaptation to climate change"
+    ],
+    "Sustainability": [
+        "Growing implementation of circular economy principles",
+        "Rise of sustainable and ethical consumption",
+        "Increasing focus on biodiversity and ecosystem preservation",
+        "Development of innovative materials and processes",
+        "Shift towards measuring and reducing carbon footprints"
+    ]
+}
+
+def build_domain_trends():
+    """
+    Merge the baseline trends with trends from the domain knowledge base.
+    
+    Returns:
+        MappingProxyType: Read-only mapping of domain to a tuple of unique trends
+    """
+    # Copy every list so the shared knowledge base is never modified
+    domain_trends_dict = {domain: list(trends) for domain, trends in BASE_DOMAIN_TRENDS.items()}
+    
+    # Enhance with domain-specific knowledge from our new dataset
+    for domain, domain_key in DOMAIN_MAPPING.items():
+        if domain_key in TECH_DOMAINS and "trends" in TECH_DOMAINS[domain_key]:
+            domain_trends_dict.setdefault(domain, []).extend(TECH_DOMAINS[domain_key]["trends"])
+    
+    # Include relevant emerging technologies as trends
+    for tech in EMERGING_TECHNOLOGIES:
+        tech_name = tech["technology"]
+        applications = tech["applications"]
+        
+        # Add to relevant domains
+        if "Technology" in domain_trends_dict:
+            domain_trends_dict["Technology"].append(f"Emergence of {tech_name} with applications in {applications[0]}")
+        
+        # Add specific applications to relevant domains
+        for app in applications:
+            app_lower = app.lower()
+            for domain in DOMAINS:
+                if domain.lower() in app_lower and domain in domain_trends_dict:
+                    domain_trends_dict[domain].append(f"Application of {tech_name} for {app}")
+    
+    # Freeze as de-duplicated tuples, keeping first-seen order
+    return MappingProxyType({
+        domain: tuple(dict.fromkeys(trends))
+        for domain, trends in domain_trends_dict.items()
+    })
+
+# Built once at import; generate_trends only reads it
+DOMAIN_TRENDS = build_domain_trends()
+
+# Words used to match objectives against trends
+WORD_PATTERN = re.compile(r"\w+")
+
+def build_trend_word_index(domain_trends, min_length=4):
+    """
+    Build an inverted index from word fragments to the trends containing them.
+    
+    Every fragment of at least min_length characters of every trend word is
+    indexed, so looking up an objective word also finds trends where it is
+    part of a longer word (e.g. "solution" finds "solutions").
+    
+    Args:
+        domain_trends (Mapping): Domain to trends, e.g. DOMAIN_TRENDS
+        min_length (int): Shortest fragment indexed
+        
+    Returns:
+        tuple: (catalogue, index) where catalogue is a tuple of every unique
+            trend and index maps each lowercased fragment to the sorted
+            catalogue positions of the trends containing it
+    """
+    catalogue = tuple(dict.fromkeys(
+        trend for trends in domain_trends.values() for trend in trends
+    ))
+    
+    index = {}
+    for trend_id, trend in enumerate(catalogue):
+        fragments = set()
+        for word in WORD_PATTERN.findall(trend.lower()):
+            for start in range(len(word) - min_length + 1):
+                for end in range(start + min_length, len(word) + 1):
+                    fragments.add(word[start:end])
+        for fragment in fragments:
+            index.setdefault(fragment, []).append(trend_id)
+    
+    return catalogue, MappingProxyType({fragment: tuple(ids) for fragment, ids in index.items()})
+
+# Objective matching looks up only the objective's words, not every trend
+TREND_CATALOGUE, TREND_WORD_INDEX = build_trend_word_index(DOMAIN_TRENDS)
+
+def generate_insights(problem_analysis, depth=3, rng=None):
     """
     Generate insights based on the problem analysis.
     
     Args:
         problem_analysis (dict): The problem analysis from analyze_problem
         depth (int): Depth of analysis (1-5, with 5 being deepest)
+        rng (random.Random, optional): Random generator to use; by default one
+            is seeded from the problem text and depth, so the same input
+            always gives the same insights
         
     Returns:
         dict: A dictionary containing insights
     """
+    if rng is None:
+        rng = make_rng(problem_analysis['text'], depth)
+    
     # Extract key information from the problem analysis
     text = problem_analysis['text']
-    doc = problem_analysis['doc']
     key_phrases = problem_analysis['key_phrases']
     entities = problem_analysis['entities']
     objectives = problem_analysis['objectives']
     
     # Determine relevant domains based on key phrases and entities
-    domain_relevance = calculate_domain_relevance(text, key_phrases, entities)
+    domain_relevance = calculate_domain_relevance(text, key_phrases, entities, rng)
     
     # Generate trends based on the most relevant domains
     top_domains = sorted(domain_relevance.items(), key=lambda x: x[1], reverse=True)[:3]
-    trends = generate_trends(top_domains, objectives, depth)
+    trends = generate_trends(top_domains, objectives, depth, rng)
     
     # Generate patterns based on problem complexity and objectives
-    patterns = generate_patterns(problem_analysis, depth)
+    patterns = generate_patterns(problem_analysis, depth, rng)
     
     # Identify potential gaps in current solutions
-    gaps = identify_gaps(problem_analysis, domain_relevance, depth)
+    gaps = identify_gaps(problem_analysis, domain_relevance, depth, rng)
     
     # Return the insights
     return {
@@ -68,60 +287,34 @@ def generate_insights(problem_analysis, depth=3):
         "gaps": gaps
     }
 
-def calculate_domain_relevance(text, key_phrases, entities):
+def calculate_domain_relevance(text, key_phrases, entities, rng=random):
     """
     Calculate the relevance of different domains to the problem.
     
     Returns:
         dict: Domain relevance scores
     """
-    # Domain keywords dictionary
-    domain_keywords = {
-        "Technology": ["digital", "tech", "software", "hardware", "app", "online", "internet", "algorithm", "data", "computer", "AI", "artificial intelligence", "machine learning"],
-        "Healthcare": ["health", "medical", "patient", "doctor", "hospital", "wellness", "disease", "treatment", "care", "clinical", "diagnosis"],
-        "Education": ["education", "learning", "student", "teach", "school", "university", "training", "curriculum", "classroom", "knowledge", "skill"],
-        "Environment": ["environment", "sustainability", "climate", "green", "eco", "pollution", "conservation", "waste", "recycling", "natural", "energy"],
-        "Business": ["business", "company", "organization", "market", "customer", "product", "service", "strategy", "management", "operation"],
-        "Finance": ["finance", "money", "budget", "cost", "investment", "fund", "economic", "profit", "revenue", "expense", "financial"],
-        "Transportation": ["transport", "vehicle", "car", "bus", "train", "traffic", "commute", "travel", "mobility", "logistics"],
-        "Energy": ["energy", "power", "electricity", "fuel", "renewable", "solar", "wind", "grid", "consumption", "efficiency"],
-        "Communication": ["communication", "message", "media", "information", "network", "social", "community", "connect", "interaction"],
-        "Entertainment": ["entertainment", "media", "game", "video", "music", "film", "art", "leisure", "play", "creative"],
-        "Agriculture": ["agriculture", "farm", "crop", "food", "harvest", "soil", "plant", "livestock", "organic", "cultivation"],
-        "Manufacturing": ["manufacturing", "production", "factory", "industry", "assembly", "quality", "product", "process", "automation"],
-        "Retail": ["retail", "store", "shop", "consumer", "customer", "product", "sale", "purchase", "e-commerce", "market"],
-        "Urban Planning": ["urban", "city", "planning", "infrastructure", "building", "community", "development", "public", "space", "design"],
-        "Sustainability": ["sustainable", "renewable", "eco-friendly", "green", "environmental", "conservation", "resource", "efficiency", "circular"]
-    }
-    
     # Initialize relevance scores
     relevance_scores = {domain: 0 for domain in DOMAINS}
     
-    # Count keyword occurrences
-    text_lower = text.lower()
-    
-    for domain, keywords in domain_keywords.items():
-        for keyword in keywords:
-            if keyword.lower() in text_lower:
-                # Count occurrences (more occurrences = higher relevance)
-                count = text_lower.count(keyword.lower())
-                relevance_scores[domain] += count * 0.5
-    
-    # Check key phrases for domain relevance
-    for phrase in key_phrases:
-        phrase_lower = phrase.lower()
-        for domain, keywords in domain_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in phrase_lower:
-                    relevance_scores[domain] += 1
-    
-    # Check entities for domain relevance
-    for entity in entities:
-        entity_text = entity['text'].lower()
-        for domain, keywords in domain_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in entity_text:
-                    relevance_scores[domain] += 2  # Entities are more important
+    # Count keyword occurrences (more occurrences = higher relevance)
+    text_scores = DOMAIN_MATCHER.score(DOMAIN_MATCHER.count(text), weight=0.5)
+    
+    # Check key phrases for domain relevance (each keyword counts once per phrase)
+    phrase_counts = Counter()
+    for keywords in DOMAIN_MATCHER.find_each(key_phrases):
+        phrase_counts.update(keywords)
+    phrase_scores = DOMAIN_MATCHER.score(phrase_counts, weight=1)
+    
+    # Check entities for domain relevance (entities are more important)
+    entity_counts = Counter()
+    for keywords in DOMAIN_MATCHER.find_each([entity['text'] for entity in entities]):
+        entity_counts.update(keywords)
+    entity_scores = DOMAIN_MATCHER.score(entity_counts, weight=2)
+    
+    for scores in (text_scores, phrase_scores, entity_scores):
+        for domain, score in scores.items():
+            relevance_scores[domain] += score
     
     # Normalize scores to be between 0 and 10
     max_score = max(relevance_scores.values()) if relevance_scores.values() else 1
@@ -132,184 +325,39 @@ def calculate_domain_relevance(text, key_phrases, entities):
     # Ensure at least some domains have relevance
     if max_score == 0:
         # Assign random relevance to top 3 domains if no clear relevance found
-        for domain in random.sample(DOMAINS, 3):
-            relevance_scores[domain] = random.uniform(5, 10)
+        for domain in rng.sample(DOMAINS, 3):
+            relevance_scores[domain] = rng.uniform(5, 10)
     
     return relevance_scores
 
-def generate_trends(top_domains, objectives, depth):
+def generate_trends(top_domains, objectives, depth, rng=random):
     """
     Generate trends based on top domains and objectives.
     
     Returns:
         list: Trends relevant to the problem
     """
-    # Enhanced trends using our domain-specific knowledge
-    domain_trends_dict = {}
-    
-    # Use our existing trend dictionary as baseline
-    base_domain_trends = {
-        "Technology": [
-            "Increasing adoption of AI and machine learning for automation",
-            "Growing focus on user experience and interface design",
-            "Rising importance of cybersecurity and data privacy",
-            "Shift towards cloud-based and distributed computing",
-            "Integration of IoT devices in everyday products and services"
-        ],
-        "Healthcare": [
-            "Growing focus on preventive healthcare and wellness",
-            "Increasing use of telemedicine and remote monitoring",
-            "Rise of personalized medicine and treatment plans",
-            "Integration of AI in diagnostics and treatment recommendations",
-            "Greater emphasis on mental health and holistic well-being"
-        ],
-        "Education": [
-            "Shift towards personalized and adaptive learning approaches",
-            "Integration of technology in classroom and remote education",
-            "Growing emphasis on lifelong learning and skill development",
-            "Rise of microlearning and bite-sized educational content",
-            "Focus on developing critical thinking and problem-solving skills"
-        ],
-        "Environment": [
-            "Increasing focus on circular economy and waste reduction",
-            "Growing adoption of renewable energy sources",
-            "Rising consumer demand for sustainable products",
-            "Development of innovative techniques for carbon capture",
-            "Implementation of stricter environmental regulations"
-        ],
-        "Business": [
-            "Shift towards remote and flexible work arrangements",
-            "Growing importance of digital transformation",
-            "Rise of subscription-based business models",
-            "Increasing focus on customer experience and personalization",
-            "Growing emphasis on corporate social responsibility"
-        ],
-        "Finance": [
-            "Rise of digital and mobile payment systems",
-            "Growing adoption of blockchain and cryptocurrency",
-            "Increasing focus on financial inclusion",
-            "Development of AI-driven financial advice and services",
-            "Shift towards sustainable and ethical investing"
-        ],
-        "Transportation": [
-            "Growing development of autonomous vehicles",
-            "Shift towards electric and alternative fuel vehicles",
-            "Rise of shared mobility services",
-            "Integration of smart technology in transportation infrastructure",
-            "Focus on last-mile delivery solutions"
-        ],
-        "Energy": [
-            "Increasing investment in renewable energy sources",
-            "Development of more efficient energy storage solutions",
-            "Growth of smart grid technology and infrastructure",
-            "Focus on decentralized energy production",
-            "Rising adoption of energy-efficient technologies"
-        ],
-        "Communication": [
-            "Growing importance of visual communication",
-            "Rise of real-time and asynchronous collaboration tools",
-            "Increasing personalization of communication channels",
-            "Development of more immersive communication technologies",
-            "Focus on inclusive and accessible communication"
-        ],
-        "Entertainment": [
-            "Shift towards streaming and on-demand content",
-            "Growing integration of AR and VR in entertainment",
-            "Rise of interactive and participatory entertainment",
-            "Increasing personalization of content recommendations",
-            "Development of more immersive gaming experiences"
-        ],
-        "Agriculture": [
-            "Adoption of precision agriculture techniques",
-            "Integration of IoT and sensors in farming",
-            "Growing focus on sustainable and regenerative practices",
-            "Development of vertical and urban farming solutions",
-            "Rise of alternative protein sources and lab-grown foods"
-        ],
-        "Manufacturing": [
-            "Increasing automation and use of robotics",
-            "Adoption of additive manufacturing (3D printing)",
-            "Growing implementation of Industry 4.0 principles",
-            "Focus on sustainable and circular manufacturing",
-            "Rise of customization and on-demand production"
-        ],
-        "Retail": [
-            "Growing integration of online and offline shopping experiences",
-            "Rise of experiential retail and immersive shopping",
-            "Increasing use of AI for personalized recommendations",
-            "Development of faster and more efficient delivery methods",
-            "Focus on sustainability and ethical sourcing"
-        ],
-        "Urban Planning": [
-            "Growing development of smart city infrastructure",
-            "Increasing focus on walkability and public spaces",
-            "Rise of mixed-use developments and urban villages",
-            "Integration of green spaces and natural elements",
-            "Focus on resilience and adaptation to climate change"
-        ],
-        "Sustainability": [
-            "Growing implementation of circular economy principles",
-            "Rise of sustainable and ethical consumption",
-            "Increasing focus on biodiversity and ecosystem preservation",
-            "Development of innovative materials and processes",
-            "Shift towards measuring and reducing carbon footprints"
-        ]
-    }
-    
-    # Initialize with base trends
-    domain_trends_dict = base_domain_trends.copy()
-    
-    # Enhance with domain-specific knowledge from our new dataset
-    for domain, domain_key in DOMAIN_MAPPING.items():
-        if domain_key in TECH_DOMAINS:
-            # Extract trends from enhanced dataset if available
-            if "trends" in TECH_DOMAINS[domain_key]:
-                # Combine existing trends with enhanced ones
-                if domain in domain_trends_dict:
-                    domain_trends_dict[domain].extend(TECH_DOMAINS[domain_key]["trends"])
-                else:
-                    domain_trends_dict[domain] = TECH_DOMAINS[domain_key]["trends"]
-    
-    # Include relevant emerging technologies as trends
-    for tech in EMERGING_TECHNOLOGIES:
-        tech_name = tech["technology"]
-        applications = tech["applications"]
-        
-        # Add to relevant domains
-        if "Technology" in domain_trends_dict:
-            domain_trends_dict["Technology"].append(f"Emergence of {tech_name} with applications in {applications[0]}")
-        
-        # Add specific applications to relevant domains
-        for app in applications:
-            app_lower = app.lower()
-            for domain in DOMAINS:
-                domain_lower = domain.lower()
-                if domain_lower in app_lower:
-                    if domain in domain_trends_dict:
-                        domain_trends_dict[domain].append(f"Application of {tech_name} for {app}")
-    
     # Select trends based on top domains and depth
     trends = []
     for domain, score in top_domains:
         # Number of trends to select depends on domain relevance and analysis depth
         num_trends = min(depth + 2, 7)  # Increased for more comprehensive trends
-        domain_specific_trends = domain_trends_dict.get(domain, [])
+        domain_specific_trends = DOMAIN_TRENDS.get(domain, ())
         
         if domain_specific_trends:
-            # Select random trends from the domain but avoid duplicates
-            unique_domain_trends = list(set(domain_specific_trends))
-            selected_trends = random.sample(unique_domain_trends, min(num_trends, len(unique_domain_trends)))
+            # Select random trends from the domain (duplicates were removed at import)
+            selected_trends = rng.sample(domain_specific_trends, min(num_trends, len(domain_specific_trends)))
             trends.extend(selected_trends)
     
     # Add some objectives-based trends
     objective_trends = []
     for objective in objectives[:2]:  # Use top 2 objectives
-        words = objective.lower().split()
-        for domain, domain_trends_list in domain_trends_dict.items():
-            for trend in domain_trends_list:
-                # Check if objective words appear in trend
-                if any(word in trend.lower() for word in words if len(word) > 3):
-                    objective_trends.append(trend)
+        # Find trends containing any of the objective's longer words, in catalogue order
+        trend_ids = set()
+        for word in WORD_PATTERN.findall(objective.lower()):
+            if len(word) > 3:
+                trend_ids.update(TREND_WORD_INDEX.get(word, ()))
+        objective_trends.extend(TREND_CATALOGUE[trend_id] for trend_id in sorted(trend_ids))
     
     # Add unique objective trends
     for trend in objective_trends:
@@ -319,18 +367,18 @@ def generate_trends(top_domains, objectives, depth):
     # Add cross-domain application trends based on problem-solving methodologies
     if depth >= 3:
         # Select a relevant methodology based on the problem
-        methodology = random.choice(PROBLEM_SOLVING_METHODOLOGIES)
+        methodology = rng.choice(PROBLEM_SOLVING_METHODOLOGIES)
         trends.append(f"Growing application of {methodology['name']} methodology for similar challenges")
             
     # Limit the number of trends based on depth but increased for enhanced analysis
     max_trends = depth + 5
     
-    # Make sure we have unique trends
-    unique_trends = list(set(trends))
+    # Make sure we have unique trends (keeping order so seeded runs are reproducible)
+    unique_trends = list(dict.fromkeys(trends))
     
     return unique_trends[:max_trends]
 
-def generate_patterns(problem_analysis, depth):
+def generate_patterns(problem_analysis, depth, rng=random):
     """
     Generate patterns based on problem analysis.
     
@@ -368,7 +416,7 @@ def generate_patterns(problem_analysis, depth):
         factors.append(f"factor-{len(factors)+1}")
     
     # Make the factors unique
-    factors = list(set(factors))
+    factors = list(dict.fromkeys(factors))
     
     # Relationships and cycles
     relationships = ["direct", "inverse", "complex", "causal", "interdependent"]
@@ -383,7 +431,7 @@ def generate_patterns(problem_analysis, depth):
     
     if num_cross_domain > 0:
         # Select some cross-domain patterns from our knowledge database
-        selected_cross_domain = random.sample(CROSS_DOMAIN_PATTERNS, num_cross_domain)
+        selected_cross_domain = rng.sample(CROSS_DOMAIN_PATTERNS, num_cross_domain)
         
         # Add these patterns to our results with appropriate formatting
         for pattern_data in selected_cross_domain:
@@ -392,20 +440,20 @@ def generate_patterns(problem_analysis, depth):
             examples = pattern_data["examples"]
             
             # Format the cross-domain pattern information
-            pattern_text = f"The '{pattern_name}' pattern ({description}) may be applicable, as seen in examples like {random.choice(examples)}"
+            pattern_text = f"The '{pattern_name}' pattern ({description}) may be applicable, as seen in examples like {rng.choice(examples)}"
             patterns.append(pattern_text)
     
     # Add traditional patterns
     num_traditional = min(depth + 1, 5) - len(patterns)
     
     for _ in range(num_traditional):
-        template = random.choice(pattern_templates)
-        relationship = random.choice(relationships)
-        cycle = random.choice(cycles)
+        template = rng.choice(pattern_templates)
+        relationship = rng.choice(relationships)
+        cycle = rng.choice(cycles)
         
         # Ensure we select different factors for each pattern
         if len(factors) >= 2:
-            factor1, factor2 = random.sample(factors, 2)
+            factor1, factor2 = rng.sample(factors, 2)
         else:
             factor1 = factors[0] if factors else "primary factor"
             factor2 = "secondary factor"
@@ -423,7 +471,7 @@ def generate_patterns(problem_analysis, depth):
     # For higher depth analysis, suggest methodologies from our database
     if depth >= 4:
         # Select a methodology that matches the problem's characteristics
-        methodology = random.choice(PROBLEM_SOLVING_METHODOLOGIES)
+        methodology = rng.choice(PROBLEM_SOLVING_METHODOLOGIES)
         methodology_name = methodology["name"]
         methodology_phases = ", ".join(methodology["phases"])
         methodology_best = methodology["best_for"]
@@ -434,7 +482,7 @@ def generate_patterns(problem_analysis, depth):
     
     return patterns
 
-def identify_gaps(problem_analysis, domain_relevance, depth):
+def identify_gaps(problem_analysis, domain_relevance, depth, rng=random):
     """
     Identify potential gaps in current solutions.
     
@@ -500,11 +548,11 @@ def identify_gaps(problem_analysis, domain_relevance, depth):
                 
                 # Select a few challenges based on depth
                 num_challenges = min(depth, len(challenges))
-                selected_challenges = random.sample(challenges, num_challenges)
+                selected_challenges = rng.sample(challenges, num_challenges)
                 
                 for challenge in selected_challenges:
                     # Format a domain-specific gap
-                    issue = random.choice(issues)
+                    issue = rng.choice(issues)
                     gap = f"In the {domain} domain, {challenge} remains a critical gap that affects {issue}"
                     if gap not in gaps:
                         gaps.append(gap)
@@ -512,25 +560,25 @@ def identify_gaps(problem_analysis, domain_relevance, depth):
     # Add technology-specific gaps for deeper analysis
     if depth >= 3:
         # Select a relevant emerging technology
-        tech = random.choice(EMERGING_TECHNOLOGIES)
+        tech = rng.choice(EMERGING_TECHNOLOGIES)
         tech_name = tech["technology"]
         tech_maturity = tech["maturity"]
         applications = tech["applications"]
         
         # Create a gap related to this emerging technology
-        gap = f"While {tech_name} ({tech_maturity} maturity) offers potential for {random.choice(applications)}, integration gaps exist in current solutions"
+        gap = f"While {tech_name} ({tech_maturity} maturity) offers potential for {rng.choice(applications)}, integration gaps exist in current solutions"
         gaps.append(gap)
     
     # Add general template-based gaps to fill out the required number
     num_template_gaps = min(depth + 1, 5) - len(gaps)
     
     for _ in range(num_template_gaps):
-        template = random.choice(gap_templates)
-        aspect = random.choice(enhanced_aspects)
-        aspect1 = random.choice(enhanced_aspects)
-        aspect2 = random.choice([a for a in enhanced_aspects if a != aspect1])
-        issue = random.choice(issues)
-        domain = random.choice(top_domains)
+        template = rng.choice(gap_templates)
+        aspect = rng.choice(enhanced_aspects)
+        aspect1 = rng.choice(enhanced_aspects)
+        aspect2 = rng.choice([a for a in enhanced_aspects if a != aspect1])
+        issue = rng.choice(issues)
+        domain = rng.choice(top_domains)
         
         # Create the gap
         gap = template.format(
@@ -547,9 +595,9 @@ def identify_gaps(problem_analysis, domain_relevance, depth):
     # For advanced depth, suggest methodological gaps
     if depth >= 4:
         # Select a relevant methodology
-        methodology = random.choice(PROBLEM_SOLVING_METHODOLOGIES)
+        methodology = rng.choice(PROBLEM_SOLVING_METHODOLOGIES)
         method_name = methodology["name"]
-        method_techniques = random.sample(methodology["techniques"], 2)
+        method_techniques = rng.sample(methodology["techniques"], 2)
         
         # Create a methodology-specific gap
         gap = f"Current approaches rarely incorporate the {method_name} methodology's techniques like {method_techniques[0]} and {method_techniques[1]}, leaving a methodological gap"
@@ -0,0 +1,135 @@
+"""
+Keyword Matcher for HACKSEEK
+
+This module provides a multi-keyword substring matcher compiled once from a
+keyword table, so scoring code can scan a text for every keyword in a single
+regex pass instead of looping over keywords with `in` and `str.count`.
+"""
+import re
+from bisect import bisect_right
+from typing import Dict, Hashable, Iterable, List, Set
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Build a regex matching any of the keywords, factored by common prefix.
+
+    A flat "kw1|kw2|..." alternation retries every keyword at every position;
+    the trie form rejects a position after checking its first character, and
+    greedy optional suffixes make it prefer the longest keyword.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            pattern = "(?:" + pattern + ")?"
+        return pattern
+
+    return build(trie)
+
+class KeywordMatcher:
+    """
+    Find every occurrence of a fixed set of keywords in one pass.
+
+    Matching is case-insensitive substring matching, equivalent to running
+    `keyword in text.lower()` and `text.lower().count(keyword)` per keyword.
+    """
+
+    # Joins texts for batch scanning; never part of a keyword, so matches can't span texts
+    _SEPARATOR = "\x00"
+
+    def __init__(self, keyword_groups: Dict[Hashable, Iterable[str]]):
+        """
+        Args:
+            keyword_groups: Mapping of label (e.g. domain name) to its keywords
+        """
+        # keyword -> labels it scores for (repeated if listed more than once)
+        self.labels_by_keyword: Dict[str, List[Hashable]] = {}
+        for label, keywords in keyword_groups.items():
+            for keyword in keywords:
+                self.labels_by_keyword.setdefault(keyword.lower(), []).append(label)
+
+        keywords = sorted(self.labels_by_keyword, key=len, reverse=True)
+
+        # The longest keyword starting at a position is found by the regex; any shorter
+        # keyword starting at the same position must be a prefix of it
+        self._keywords_at = {
+            keyword: [other for other in keywords if keyword.startswith(other)]
+            for keyword in keywords
+        }
+
+        # Zero-width lookahead so every start position is tried, including overlaps
+        self._pattern = re.compile(f"(?=({_trie_pattern(keywords)}))")
+
+    def count(self, text: str) -> Dict[str, int]:
+        """
+        Count non-overlapping occurrences of each keyword in text.
+
+        Returns:
+            Dict of keyword to occurrence count (keywords not found are omitted)
+        """
+        counts: Dict[str, int] = {}
+        next_free: Dict[str, int] = {}
+
+        for match in self._pattern.finditer(text.lower()):
+            start = match.start()
+            for keyword in self._keywords_at[match.group(1)]:
+                # Mirror str.count, which skips occurrences overlapping the previous one
+                if start >= next_free.get(keyword, 0):
+                    counts[keyword] = counts.get(keyword, 0) + 1
+                    next_free[keyword] = start + len(keyword)
+
+        return counts
+
+    def find_each(self, texts: List[str]) -> List[Set[str]]:
+        """
+        Find which keywords occur in each of several texts with a single scan.
+
+        Returns:
+            List (parallel to texts) of sets of keywords contained in each text
+        """
+        found: List[Set[str]] = [set() for _ in texts]
+        if not texts:
+            return found
+
+        # Lowercase before computing offsets; lower() can change a string's length
+        lowered = [text.lower() for text in texts]
+
+        # Start offset of each text within the joined string
+        offsets = []
+        position = 0
+        for text in lowered:
+            offsets.append(position)
+            position += len(text) + len(self._SEPARATOR)
+
+        joined = self._SEPARATOR.join(lowered)
+        for match in self._pattern.finditer(joined):
+            index = bisect_right(offsets, match.start()) - 1
+            found[index].update(self._keywords_at[match.group(1)])
+
+        return found
+
+    def score(self, counts: Dict[str, int], weight: float = 1.0) -> Dict[Hashable, float]:
+        """
+        Turn keyword counts into per-label scores.
+
+        Args:
+            counts: Keyword counts, e.g. from count()
+            weight: Score added per keyword occurrence
+
+        Returns:
+            Dict of label to score (labels with no matches are omitted)
+        """
+        scores: Dict[Hashable, float] = {}
+        for keyword, occurrences in counts.items():
+            for label in self.labels_by_keyword[keyword]:
+                scores[label] = scores.get(label, 0) + occurrences * weight
+        return scores
@@ -0,0 +1,227 @@
+"""
+Database Migrations for HACKSEEK
+
+This module applies the versioned SQL files in migrations/ to the PostgreSQL
+database in order, recording each applied version in a schema_migrations
+table so every file runs exactly once. It can also EXPLAIN the hot queries
+in auth_utils to confirm that each one is served by an index.
+
+Usage:
+    python -m migrate            # apply pending migrations
+    python -m migrate --list     # show applied and pending migrations
+    python -m migrate --check    # check the query plans of the hot queries
+"""
+import os
+import re
+import sys
+import argparse
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Tuple
+
+import psycopg2
+
+from auth_utils import (get_db_connection, build_search_history_query, build_saved_solutions_query,
+                        USER_BY_USERNAME_QUERY, USER_BY_USERNAME_OR_EMAIL_QUERY,
+                        USER_BY_USERNAME_AND_EMAIL_QUERY, USER_PROFILE_QUERY)
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+# Migration files are named <version>_<name>.sql, e.g. 0001_solution_data_jsonb.sql
+MIGRATION_PATTERN = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+# Key for the advisory lock that stops two runners migrating at once
+MIGRATION_LOCK_ID = 72410531
+
+# Hot queries from auth_utils, with sample parameters for EXPLAIN:
+# (description, SQL, parameters, tables that must be read through an index)
+HOT_QUERIES = [
+    ("authenticate_user: user by username",
+     USER_BY_USERNAME_QUERY, ("someone",), ("users",)),
+    ("register_user: user by username or email",
+     USER_BY_USERNAME_OR_EMAIL_QUERY, ("someone", "someone@example.com"), ("users",)),
+    ("reset_user_password: user by username and email",
+     USER_BY_USERNAME_AND_EMAIL_QUERY, ("someone", "someone@example.com"), ("users",)),
+    ("get_user_profile: user by id",
+     USER_PROFILE_QUERY, (1,), ("users",)),
+    ("get_user_search_history: first page of searches with solution counts",
+     *build_search_history_query(1, limit=21), ("searches", "saved_solutions")),
+    ("get_user_search_history: later page, continuing from a (created_at, id) cursor",
+     *build_search_history_query(1, limit=21, before=(datetime(2000, 1, 1, tzinfo=timezone.utc), 1)),
+     ("searches", "saved_solutions")),
+    ("get_user_saved_solutions: solutions of a search",
+     *build_saved_solutions_query(1), ("saved_solutions",)),
+    ("get_user_saved_solutions: projected top actions of a search",
+     *build_saved_solutions_query(1, top_actions=3), ("saved_solutions",)),
+]
+
+def discover_migrations(directory: str = MIGRATIONS_DIR) -> List[Tuple[int, str, str]]:
+    """
+    Find the migration files in a directory.
+
+    Args:
+        directory: Directory holding <version>_<name>.sql files
+
+    Returns:
+        List of (version, name, path) tuples sorted by version
+    """
+    migrations = []
+    for filename in os.listdir(directory):
+        match = MIGRATION_PATTERN.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+    migrations.sort()
+
+    versions = [version for version, _, _ in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+def _ensure_migrations_table(cur) -> None:
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+        """
+    )
+
+def get_applied_versions(conn) -> Dict[int, Any]:
+    """Get the applied migration versions with the time each was applied"""
+    with conn.cursor() as cur:
+        _ensure_migrations_table(cur)
+        cur.execute("SELECT version, applied_at FROM schema_migrations")
+        applied = dict(cur.fetchall())
+    conn.commit()
+    return applied
+
+def apply_migrations(conn, directory: str = MIGRATIONS_DIR) -> List[str]:
+    """
+    Apply every pending migration, each in its own transaction.
+
+    A failing migration is rolled back and stops the run; the migrations
+    before it stay applied.
+
+    Args:
+        conn: psycopg2 connection
+        directory: Directory holding the migration files
+
+    Returns:
+        List of the applied migration file names
+    """
+    applied_now = []
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+    try:
+        applied = get_applied_versions(conn)
+
+        for version, name, path in discover_migrations(directory):
+            if version in applied:
+                continue
+
+            with open(path, encoding="utf-8") as f:
+                sql = f.read()
+
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(sql)
+                    cur.execute("INSERT INTO schema_migrations (version, name) VALUES (%s, %s)", (version, name))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                print(f"Migration {os.path.basename(path)} failed; later migrations were not applied")
+                raise
+
+            applied_now.append(os.path.basename(path))
+            print(f"Applied {os.path.basename(path)}")
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+        conn.commit()
+
+    return applied_now
+
+def _plan_scans(plan: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Collect (node type, table) for every scan in an EXPLAIN (FORMAT JSON) plan"""
+    scans = []
+    if "Relation Name" in plan:
+        scans.append((plan["Node Type"], plan["Relation Name"]))
+    for child in plan.get("Plans", []):
+        scans.extend(_plan_scans(child))
+    return scans
+
+def check_query_plans(conn) -> List[Dict[str, Any]]:
+    """
+    EXPLAIN each hot query and check that its tables are read through an index.
+
+    Sequential scans are disabled for the check, so small or empty tables
+    (where a sequential scan would be cheaper) still show whether an index
+    can serve the query.
+
+    Args:
+        conn: psycopg2 connection
+
+    Returns:
+        List of dicts with query, scans and uses_index keys
+    """
+    results = []
+
+    with conn.cursor() as cur:
+        try:
+            cur.execute("SET LOCAL enable_seqscan = off")
+            for description, sql, params, tables in HOT_QUERIES:
+                cur.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+                plan = cur.fetchone()[0][0]["Plan"]
+                scans = _plan_scans(plan)
+                results.append({
+                    "query": description,
+                    "scans": scans,
+                    "uses_index": all(
+                        node != "Seq Scan" for node, table in scans if table in tables
+                    )
+                })
+        finally:
+            conn.rollback()
+
+    return results
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m migrate",
+                                     description="Apply HACKSEEK database migrations.")
+    parser.add_argument("--list", action="store_true", help="Show applied and pending migrations")
+    parser.add_argument("--check", action="store_true",
+                        help="Check that the hot queries in auth_utils use index scans")
+    args = parser.parse_args(argv)
+
+    try:
+        conn = get_db_connection()
+    except psycopg2.OperationalError as e:
+        print(f"Could not connect to the database: {e}")
+        return 1
+
+    try:
+        if args.list:
+            applied = get_applied_versions(conn)
+            for version, name, path in discover_migrations():
+                status = f"applied {applied[version]:%Y-%m-%d %H:%M}" if version in applied else "pending"
+                print(f"{os.path.basename(path):<40} {status}")
+            return 0
+
+        if args.check:
+            results = check_query_plans(conn)
+            for result in results:
+                scans = ", ".join(f"{node} on {table}" for node, table in result["scans"])
+                print(f"{'ok  ' if result['uses_index'] else 'SEQ '} {result['query']}: {scans}")
+            return 0 if all(result["uses_index"] for result in results) else 1
+
+        applied_now = apply_migrations(conn)
+        if not applied_now:
+            print("Database is up to date")
+        return 0
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+-- Baseline schema for users, their searches and saved solutions. Tables are
+-- only created when missing, so databases set up before migrations existed
+-- keep their data; later migrations bring them up to date.
+CREATE TABLE IF NOT EXISTS users (
+    id SERIAL PRIMARY KEY,
+    username VARCHAR(100) NOT NULL UNIQUE,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    password_hash TEXT NOT NULL,
+    date_of_birth DATE,
+    gender VARCHAR(50),
+    profile_pic_url TEXT,
+    theme VARCHAR(20) DEFAULT 'light',
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS searches (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    problem_statement TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS saved_solutions (
+    id SERIAL PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users (id),
+    search_id INTEGER NOT NULL REFERENCES searches (id),
+    solution_data JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,15 @@
+-- Store saved_solutions.solution_data as JSONB instead of JSON text, so reads
+-- can select parts of a solution in the database instead of fetching and
+-- parsing the whole document. Safe to run again: does nothing once the
+-- column is already JSONB.
+DO $$
+BEGIN
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'saved_solutions'
+          AND column_name = 'solution_data') <> 'jsonb' THEN
+        ALTER TABLE saved_solutions
+            ALTER COLUMN solution_data TYPE JSONB USING solution_data::jsonb;
+    END IF;
+END
+$$;
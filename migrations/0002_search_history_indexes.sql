@@ -0,0 +1,7 @@
+-- Indexes for the search history page: the keyset scan over a user's
+-- searches (newest first) and the per-search solution count join.
+CREATE INDEX IF NOT EXISTS searches_user_id_created_at_idx
+    ON searches (user_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS saved_solutions_search_id_idx
+    ON saved_solutions (search_id);
@@ -0,0 +1,37 @@
+-- Indexes for the remaining lookups: login and registration by username and
+-- email, and the foreign key check on saved_solutions.user_id when an account
+-- is deleted. The unique indexes use the names PostgreSQL gives the UNIQUE
+-- constraints in 0000_initial_schema.sql, so they are only built on databases
+-- created without those constraints.
+--
+-- Such a database may hold duplicate usernames or emails, which would make
+-- the unique indexes fail. The check below stops with a list of them instead;
+-- merge or rename those accounts (e.g. find them with
+-- SELECT username, COUNT(*) FROM users GROUP BY username HAVING COUNT(*) > 1)
+-- and run the migration again.
+DO $$
+DECLARE
+    lookup_column TEXT;
+    duplicates TEXT;
+BEGIN
+    FOREACH lookup_column IN ARRAY ARRAY['username', 'email'] LOOP
+        EXECUTE format(
+            'SELECT string_agg(value, '', '') FROM ('
+            '    SELECT %1$I AS value FROM users GROUP BY %1$I HAVING COUNT(*) > 1 ORDER BY %1$I LIMIT 10'
+            ') duplicated',
+            lookup_column
+        ) INTO duplicates;
+
+        IF duplicates IS NOT NULL THEN
+            RAISE EXCEPTION 'users has duplicate % values (first 10: %); merge or rename those accounts, then rerun the migration',
+                lookup_column, duplicates;
+        END IF;
+    END LOOP;
+END
+$$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS users_username_key ON users (username);
+
+CREATE UNIQUE INDEX IF NOT EXISTS users_email_key ON users (email);
+
+CREATE INDEX IF NOT EXISTS saved_solutions_user_id_idx ON saved_solutions (user_id);
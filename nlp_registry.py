@@ -0,0 +1,163 @@
+"""
+spaCy Model Registry for HACKSEEK
+
+This module owns the single spaCy pipeline shared by every module in the
+process. The model is loaded lazily on first use, and callers that only need
+part of the pipeline ask for a named component profile instead of loading
+their own copy of the model.
+"""
+import os
+import time
+import threading
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+import spacy
+
+# Name of the spaCy model to load (can be overridden from the environment)
+MODEL_NAME = os.environ.get("HACKSEEK_SPACY_MODEL", "en_core_web_sm")
+
+# Pipeline components each caller needs. None means the full pipeline.
+# The rule-based lemmatizer depends on the tagger and attribute ruler, which
+# in turn depend on tok2vec, so those stay enabled for lemma-only callers.
+# Profiles without the parser get sentence boundaries from the sentencizer.
+PIPELINE_PROFILES = {
+    "full": None,
+    "standard": ["tok2vec", "tagger", "attribute_ruler", "lemmatizer", "ner"],
+    "fast": ["ner"],
+    "tips": ["tok2vec", "tagger", "attribute_ruler", "lemmatizer"],
+}
+
+_nlp = None
+_load_stats: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+def _current_rss() -> int:
+    """Return the resident set size of this process in bytes (0 if unknown)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+        # ru_maxrss is reported in kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except (ImportError, AttributeError):
+        return 0
+
+def get_nlp():
+    """
+    Get the shared spaCy pipeline, loading it on first use.
+
+    Returns:
+        spacy.language.Language: The process-wide spaCy pipeline
+    """
+    global _nlp
+
+    if _nlp is not None:
+        return _nlp
+
+    with _lock:
+        # Another thread may have finished loading while we waited
+        if _nlp is not None:
+            return _nlp
+
+        rss_before = _current_rss()
+        start = time.perf_counter()
+
+        try:
+            nlp = spacy.load(MODEL_NAME)
+            model = MODEL_NAME
+            # Cheap rule-based sentence splitting for profiles that skip the parser
+            if "parser" in nlp.pipe_names and "sentencizer" not in nlp.pipe_names:
+                nlp.add_pipe("sentencizer", first=True)
+        except OSError:
+            # If model isn't available, use a simpler pipeline
+            nlp = spacy.blank("en")
+            nlp.add_pipe("sentencizer")
+            model = "blank:en"
+
+        load_seconds = time.perf_counter() - start
+
+        _load_stats.update({
+            "model": model,
+            "pipe_names": list(nlp.pipe_names),
+            "load_seconds": load_seconds,
+            "rss_delta_bytes": max(0, _current_rss() - rss_before)
+        })
+        print(f"Loaded spaCy model '{model}' in {load_seconds:.2f}s "
+              f"(+{_load_stats['rss_delta_bytes'] / (1024 * 1024):.1f} MB RSS)")
+
+        _nlp = nlp
+
+    return _nlp
+
+def get_disabled_components(profile: Optional[str] = "full") -> List[str]:
+    """
+    Get the pipeline components to skip for a profile.
+
+    Args:
+        profile: Name of a profile in PIPELINE_PROFILES
+
+    Returns:
+        List of component names that the profile does not need
+    """
+    nlp = get_nlp()
+    enabled = PIPELINE_PROFILES.get(profile)
+    if enabled is None:
+        enabled = [name for name in nlp.pipe_names if name != "sentencizer"]
+
+    # Sentence boundaries come from the parser when it runs, otherwise from the sentencizer
+    if "parser" not in enabled or "parser" not in nlp.pipe_names:
+        enabled = list(enabled) + ["sentencizer"]
+
+    return [name for name in nlp.pipe_names if name not in enabled]
+
+def process(text: str, profile: Optional[str] = "full"):
+    """
+    Run text through the shared pipeline using only the profile's components.
+
+    Components are disabled per call rather than by mutating the shared
+    pipeline, so concurrent callers with different profiles do not interfere.
+
+    Args:
+        text: The text to process
+        profile: Name of a profile in PIPELINE_PROFILES
+
+    Returns:
+        spacy.tokens.Doc: The processed document
+    """
+    return get_nlp()(text, disable=get_disabled_components(profile))
+
+def pipe(texts: Iterable[str], profile: Optional[str] = "full",
+         batch_size: int = 32, n_process: int = 1) -> Iterator:
+    """
+    Stream many texts through the shared pipeline using only the profile's components.
+
+    Args:
+        texts: Iterable of texts to process
+        profile: Name of a profile in PIPELINE_PROFILES
+        batch_size: Number of texts per batch
+        n_process: Number of worker processes (-1 for one per CPU)
+
+    Returns:
+        Iterator of processed spacy.tokens.Doc objects, in input order
+    """
+    return get_nlp().pipe(
+        texts,
+        disable=get_disabled_components(profile),
+        batch_size=batch_size,
+        n_process=n_process
+    )
+
+def get_model_stats() -> Dict[str, Any]:
+    """
+    Get load statistics for the shared model.
+
+    Returns:
+        Dict with the model name, pipeline components, load time in seconds and
+        the resident memory added by the load (empty if not loaded yet)
+    """
+    return dict(_load_stats)
@@ -1,15 +1,309 @@
-import random
+from itertools import permutations
+import numpy as np
+from data_utils import make_rng
+from domain_knowledge import EMERGING_TECHNOLOGIES
+from innovation_spotter import DOMAIN_TECHNOLOGIES, SUGGESTED_TECHNOLOGIES
 
-def prioritize_actions(innovations):
+# Timeframes an action can be assigned, and how likely each is
+TIMEFRAMES = ["Short-term (1-3 months)", "Medium-term (3-6 months)", "Long-term (6+ months)"]
+TIMEFRAME_WEIGHTS = [0.5, 0.3, 0.2]  # Favor shorter timeframes
+
+# Resources an action may need
+RESOURCE_OPTIONS = [
+    "Development team", "Product management", "UX/UI design", 
+    "Data science expertise", "Subject matter experts", 
+    "Testing resources", "Infrastructure support"
+]
+
+# Place value of the 1st, 2nd and 3rd resource in a resource code
+RESOURCE_CODE_WEIGHTS = np.array([64, 8, 1])
+
+def build_resource_strings():
+    """
+    Build the lookup table used by score_actions_vectorized for resource lists.
+    
+    A list of up to three distinct resources is encoded as the base-8 number
+    with digits (option index + 1), most significant first; the table maps each
+    code to the joined resource string ("" for unused codes).
+    """
+    strings = np.full(8 ** 3, "", dtype=object)
+    for length in (1, 2, 3):
+        for picks in permutations(range(len(RESOURCE_OPTIONS)), length):
+            code = sum((pick + 1) * weight for pick, weight in zip(picks, RESOURCE_CODE_WEIGHTS))
+            strings[code] = ", ".join(RESOURCE_OPTIONS[pick] for pick in picks)
+    return strings
+
+RESOURCE_STRINGS = build_resource_strings()
+
+# Technology maturity, least to most risky; technologies not in the knowledge base count as established
+MATURITY_LEVELS = ("Established", "Growing", "Emerging", "Early")
+TECHNOLOGY_MATURITY = {
+    tech["technology"].lower(): MATURITY_LEVELS.index(tech["maturity"])
+    for tech in EMERGING_TECHNOLOGIES
+    if tech["maturity"] in MATURITY_LEVELS
+}
+
+def build_technology_domains():
+    """
+    Map each technology in the full domain catalogues to the domains that list it.
+    
+    Returns:
+        dict: Lowercased technology name -> tuple of domains
+    """
+    technology_domains = {}
+    for catalogue in (DOMAIN_TECHNOLOGIES, {
+        domain: [technology for technology, _ in techs] for domain, techs in SUGGESTED_TECHNOLOGIES.items()
+    }):
+        for domain, techs in catalogue.items():
+            for technology in techs:
+                domains = technology_domains.setdefault(technology.lower(), [])
+                if domain not in domains:
+                    domains.append(domain)
+    return {technology: tuple(domains) for technology, domains in technology_domains.items()}
+
+TECHNOLOGY_DOMAINS = build_technology_domains()
+
+# How well a solution's technology fits the problem, from the highest relevance (0-10)
+# of the domains whose catalogue lists it: a strongly relevant domain, a moderately
+# relevant one, or only weakly relevant ones. Technologies no domain lists (cross-domain
+# and emerging ones) and actions without a technology count as a moderate fit.
+TECHNOLOGY_FIT_LEVELS = ("Core domain", "Related domain", "Unrelated domain")
+TECHNOLOGY_FIT_BUCKETS = (3.3, 6.6)
+
+# Upper bounds of the problem complexity buckets (complexity ranges from 0 to 1)
+COMPLEXITY_BUCKETS = (0.33, 0.66)
+
+# Upper bounds of the constraint count buckets (0, 1-2, 3-4, 5+)
+CONSTRAINT_BUCKETS = (0, 2, 4)
+
+# (impact, difficulty) contributions of each feature value
+LEVEL_SCORES = {1: (5.0, 3.0), 2: (6.0, 4.0), 3: (7.0, 5.0), 4: (8.0, 6.0), 5: (9.0, 7.0)}
+MATURITY_SCORES = ((0.0, 0.0), (0.5, 0.5), (1.0, 1.5), (1.5, 2.5))
+TECHNOLOGY_FIT_SCORES = ((1.0, -0.5), (0.0, 0.0), (-1.0, 0.5))
+COMPLEXITY_SCORES = ((0.0, 0.0), (0.5, 1.0), (1.0, 2.0))
+CONSTRAINT_SCORES = ((0.0, 0.0), (0.0, 0.5), (0.0, 1.0), (0.0, 1.5))
+
+# Approach phases, with how much each adds to impact and difficulty. Within one run
+# the level, complexity and constraints are shared by every action, so apart from
+# technology maturity and fit the ranking follows phase order; remaining ties keep
+# the order of the solutions (see score_actions).
+PHASE_SCORES = {
+    "Analysis Phase": (-1.0, -2.0),
+    "Design Phase": (0.0, -1.0),
+    "Implementation Strategy": (1.0, 1.0),
+    "Integration Plan": (0.5, 1.0),
+    "Validation Approach": (0.0, -0.5),
+    "Deployment Framework": (1.0, 0.5),
+    "Feedback Mechanism": (-0.5, -1.0),
+    "Technology Enhancement": (0.5, 0.5)
+}
+PHASES = tuple(PHASE_SCORES)
+
+def build_score_table():
+    """
+    Precompute impact and difficulty for every combination of action features.
+    
+    Returns:
+        numpy.ndarray: Array indexed by (level - 1, maturity, technology fit,
+            complexity bucket, constraint bucket, phase) whose last axis holds (impact, difficulty),
+            each clipped to 1-10; the last phase index is for actions without a phase
+    """
+    phase_scores = list(PHASE_SCORES.values()) + [(0.0, 0.0)]
+    table = np.zeros((len(LEVEL_SCORES), len(MATURITY_SCORES), len(TECHNOLOGY_FIT_SCORES),
+                      len(COMPLEXITY_SCORES), len(CONSTRAINT_SCORES), len(phase_scores), 2))
+    
+    for level, level_score in LEVEL_SCORES.items():
+        for maturity, maturity_score in enumerate(MATURITY_SCORES):
+            for fit, fit_score in enumerate(TECHNOLOGY_FIT_SCORES):
+                for complexity, complexity_score in enumerate(COMPLEXITY_SCORES):
+                    for constraints, constraint_score in enumerate(CONSTRAINT_SCORES):
+                        for phase, phase_score in enumerate(phase_scores):
+                            table[level - 1, maturity, fit, complexity, constraints, phase] = np.sum(
+                                [level_score, maturity_score, fit_score, complexity_score,
+                                 constraint_score, phase_score],
+                                axis=0
+                            )
+    
+    return np.clip(table, 1.0, 10.0)
+
+SCORE_TABLE = build_score_table()
+
+def get_technology_fit(technology, domain_relevance):
+    """
+    Get the TECHNOLOGY_FIT_LEVELS index of a technology for a problem.
+    
+    Args:
+        technology (str): Technology name
+        domain_relevance (dict): Domain relevance scores from generate_insights
+        
+    Returns:
+        int: 0 (core domain), 1 (related domain) or 2 (unrelated domain)
+    """
+    domains = TECHNOLOGY_DOMAINS.get(technology.lower())
+    if not domains:
+        return 1
+    relevance = max(domain_relevance.get(domain, 0.0) for domain in domains)
+    return 2 - int(np.searchsorted(TECHNOLOGY_FIT_BUCKETS, relevance, side="right"))
+
+def get_action_features(actions, problem_analysis=None, domain_relevance=None):
+    """
+    Encode each action's scoring features as SCORE_TABLE indices.
+    
+    Args:
+        actions (list): Actions from extract_actions
+        problem_analysis (dict, optional): The problem analysis the actions are for;
+            without it, medium complexity and no constraints are assumed
+        domain_relevance (dict, optional): Domain relevance scores from
+            generate_insights; without them every action gets the middle fit
+        
+    Returns:
+        numpy.ndarray: Integer array of shape (len(actions), 6)
+    """
+    if problem_analysis is not None:
+        complexity = int(np.searchsorted(COMPLEXITY_BUCKETS, problem_analysis['complexity']))
+        constraints = int(np.searchsorted(CONSTRAINT_BUCKETS, len(problem_analysis['constraints'])))
+    else:
+        complexity, constraints = 1, 0
+    
+    fits = {}
+    
+    features = np.empty((len(actions), 6), dtype=np.intp)
+    for row, action in enumerate(actions):
+        level = min(5, max(1, int(action.get("level") or 3)))
+        technology = (action.get("technology") or "").lower()
+        maturity = TECHNOLOGY_MATURITY.get(technology, 0)
+        if domain_relevance is None or not technology:
+            fit = 1
+        else:
+            if technology not in fits:
+                fits[technology] = get_technology_fit(technology, domain_relevance)
+            fit = fits[technology]
+        phase = PHASES.index(action["phase"]) if action.get("phase") in PHASE_SCORES else len(PHASES)
+        features[row] = (level - 1, maturity, fit, complexity, constraints, phase)
+    
+    return features
+
+def evidence_scores(features, generator):
+    """Look impact and difficulty up in SCORE_TABLE from each action's features"""
+    scores = SCORE_TABLE[tuple(features.T)]
+    return scores[:, 0], scores[:, 1]
+
+def random_scores(features, generator):
+    """Draw impact (5-10) and difficulty (3-8) at random, ignoring the features"""
+    count = len(features)
+    return generator.uniform(5, 10, count), generator.uniform(3, 8, count)
+
+# Scoring models by name; each maps (features, numpy Generator) to (impact, difficulty) arrays
+SCORING_MODELS = {
+    "evidence": evidence_scores,
+    "random": random_scores
+}
+
+def prioritize_actions(innovations, rng=None, vectorized=False, problem_analysis=None, scoring="evidence",
+                       insights=None):
     """
     Prioritize actions based on the generated innovations.
     
     Args:
         innovations (dict): The innovations from generate_innovations
+        rng (random.Random, optional): Random generator to use; by default one
+            is seeded from the solution titles
+        vectorized (bool): Score with NumPy (see score_actions_vectorized)
+            instead of one action at a time
+        problem_analysis (dict, optional): The problem analysis, whose
+            complexity and constraints feed the evidence scoring model
+        scoring (str): Name of a model in SCORING_MODELS
+        insights (dict, optional): The insights from generate_insights, whose
+            domain relevance sets how well each technology fits the problem
+        
+    With the evidence model, scores are deterministic: they depend on each
+    action's phase and on the maturity and fit of its solution's technology.
+    Actions with equal scores keep the order of the solutions they come from.
         
     Returns:
         list: Prioritized actions with scores
     """
+    if rng is None:
+        rng = make_rng(*[solution['title'] for solution in innovations['solutions']])
+    
+    actions = extract_actions(innovations)
+    features = get_action_features(actions, problem_analysis, insights['domain_relevance'] if insights else None)
+    
+    if vectorized:
+        return score_actions_vectorized(actions, rng, features, scoring=scoring)
+    return score_actions(actions, rng, features, scoring=scoring)
+
+def prioritize_actions_batch(innovations_list, rng=None, problem_analyses=None, scoring="evidence",
+                             insights_list=None):
+    """
+    Prioritize the actions of many innovations with a single vectorized scoring pass.
+    
+    Args:
+        innovations_list (list): Innovations dicts from generate_innovations
+        rng (random.Random, optional): Random generator to use; by default one
+            is seeded from all the solution titles
+        problem_analyses (list, optional): Problem analysis for each innovations dict
+        scoring (str): Name of a model in SCORING_MODELS
+        insights_list (list, optional): Insights for each innovations dict
+        
+    Returns:
+        list: One list of prioritized actions per innovations dict, in input order
+    """
+    if rng is None:
+        rng = make_rng(*[
+            solution['title'] for innovations in innovations_list for solution in innovations['solutions']
+        ])
+    if problem_analyses is None:
+        problem_analyses = [None] * len(innovations_list)
+    if insights_list is None:
+        insights_list = [None] * len(innovations_list)
+    
+    actions = []
+    groups = []
+    features = []
+    for index, (innovations, problem_analysis, insights) in enumerate(
+            zip(innovations_list, problem_analyses, insights_list)):
+        innovation_actions = extract_actions(innovations)
+        actions.extend(innovation_actions)
+        groups.extend([index] * len(innovation_actions))
+        features.append(get_action_features(innovation_actions, problem_analysis,
+                                            insights['domain_relevance'] if insights else None))
+    
+    features = np.concatenate(features) if features else np.empty((0, 6), dtype=np.intp)
+    
+    results = [[] for _ in innovations_list]
+    for group, action in zip(groups, score_actions_vectorized(actions, rng, features, groups=groups, scoring=scoring)):
+        results[group].append(action)
+    return results
+
+def parse_approach_steps(approach_text):
+    """
+    Parse approach markdown from innovation_spotter.format_approach back into steps.
+    
+    Returns:
+        list: Step dicts with number, name and description keys
+    """
+    steps = []
+    for line in approach_text.split("\n"):
+        if "**" in line:  # Steps are formatted with markdown bold markers
+            # Extract the step name and description
+            parts = line.split("**: ")
+            if len(parts) >= 2:
+                number, _, name = parts[0].replace("**", "").strip().partition(". ")
+                steps.append({"number": number, "name": name, "description": parts[1].strip()})
+    return steps
+
+def extract_actions(innovations):
+    """
+    Turn the solution approaches of an innovations dict into unscored actions.
+    
+    Args:
+        innovations (dict): The innovations from generate_innovations
+        
+    Returns:
+        list: Actions with action, description and related_solution keys,
+            plus the phase, level and technology used for scoring
+    """
     # Extract data from innovations
     solutions = innovations['solutions']
     technologies = innovations['technologies']
@@ -19,27 +313,24 @@ def prioritize_actions(innovations):
     
     # Convert solutions into actionable steps
     for solution in solutions:
-        # Extract approach steps from the solution
-        approach_text = solution['approach']
-        approach_steps = approach_text.split("\n")
+        # Solutions saved before steps were recorded only have the approach text
+        steps = solution.get('steps')
+        if steps is None:
+            steps = parse_approach_steps(solution['approach'])
         
-        # Convert approach steps into actions
-        for step in approach_steps:
-            if "**" in step:  # Steps are formatted with markdown bold markers
-                # Extract the step name and description
-                parts = step.split("**: ")
-                if len(parts) >= 2:
-                    step_name = parts[0].replace("**", "").strip()
-                    step_description = parts[1].strip()
-                    
-                    # Create an action from this step
-                    action = {
-                        "action": f"{step_name} for {solution['title'].split(' to ')[0]}",
-                        "description": step_description,
-                        "related_solution": solution['title']
-                    }
-                    
-                    actions.append(action)
+        for step in steps:
+            # Create an action from this step
+            action = {
+                "action": f"{step['number']}. {step['name']} for {solution['title'].split(' to ')[0]}",
+                "description": step['description'],
+                "related_solution": solution['title'],
+                # Scoring features (see get_action_features)
+                "phase": step['name'],
+                "level": solution.get('level'),
+                "technology": solution.get('technology')
+            }
+            
+            actions.append(action)
     
     # If we don't have enough actions from solutions, add technology implementation actions
     if len(actions) < 5:
@@ -47,7 +338,9 @@ def prioritize_actions(innovations):
             action = {
                 "action": f"Implement {tech['technology']}",
                 "description": f"Integrate {tech['technology']} to enhance capabilities in the {tech['category']} area",
-                "related_solution": "Technology Enhancement"
+                "related_solution": "Technology Enhancement",
+                "phase": "Technology Enhancement",
+                "technology": tech['technology']
             }
             actions.append(action)
     
@@ -82,32 +375,41 @@ def prioritize_actions(innovations):
         ]
         actions = generic_actions
     
+    return actions
+
+def score_actions(actions, rng, features=None, scoring="evidence"):
+    """
+    Score, schedule and sort actions one at a time.
+    
+    Args:
+        actions (list): Actions from extract_actions
+        rng (random.Random): Random generator to use
+        features (numpy.ndarray, optional): Features from get_action_features
+        scoring (str): Name of a model in SCORING_MODELS
+        
+    Returns:
+        list: Prioritized actions, highest priority first; equal scores keep
+            their input order
+    """
+    if features is None:
+        features = get_action_features(actions)
+    
+    # Score impact (1-10, higher is better) and difficulty (1-10, lower is easier)
+    impacts, difficulties = SCORING_MODELS[scoring](features, np.random.default_rng(rng.getrandbits(64)))
+    
     # Add metrics to each action
     prioritized_actions = []
     
-    for action in actions:
-        # Score impact (1-10, higher is better)
-        impact = random.uniform(5, 10)
-        
-        # Score difficulty (1-10, lower is easier)
-        difficulty = random.uniform(3, 8)
-        
+    for action, impact, difficulty in zip(actions, impacts.tolist(), difficulties.tolist()):
         # Calculate priority score (impact / difficulty)
         priority_score = impact / (difficulty * 0.5)
         
         # Assign a timeframe
-        timeframes = ["Short-term (1-3 months)", "Medium-term (3-6 months)", "Long-term (6+ months)"]
-        weights = [0.5, 0.3, 0.2]  # Favor shorter timeframes
-        timeframe = random.choices(timeframes, weights=weights)[0]
+        timeframe = rng.choices(TIMEFRAMES, weights=TIMEFRAME_WEIGHTS)[0]
         
         # Assign resources needed
-        resource_options = [
-            "Development team", "Product management", "UX/UI design", 
-            "Data science expertise", "Subject matter experts", 
-            "Testing resources", "Infrastructure support"
-        ]
-        num_resources = random.randint(1, 3)
-        resources = ", ".join(random.sample(resource_options, num_resources))
+        num_resources = rng.randint(1, 3)
+        resources = ", ".join(rng.sample(RESOURCE_OPTIONS, num_resources))
         
         # Create the prioritized action
         prioritized_action = {
@@ -123,7 +425,82 @@ def prioritize_actions(innovations):
         
         prioritized_actions.append(prioritized_action)
     
-    # Sort actions by priority score (highest first)
+    # Sort actions by priority score (highest first); the sort is stable, so ties
+    # keep the order of extract_actions (solution order, then step order)
     prioritized_actions.sort(key=lambda x: x["priority_score"], reverse=True)
     
     return prioritized_actions
+
+def score_actions_vectorized(actions, rng, features=None, groups=None, scoring="evidence"):
+    """
+    Score, schedule and sort actions with NumPy.
+    
+    Draws timeframe and resources for every action at once instead of per
+    action. Returns records with the same schema as score_actions, but uses
+    a different random stream, so results for the same seed differ from the
+    loop version.
+    
+    Args:
+        actions (list): Actions from extract_actions
+        rng (random.Random): Random generator used to seed the NumPy generator
+        features (numpy.ndarray, optional): Features from get_action_features
+        groups (list, optional): Group number of each action; actions are
+            sorted within their group and groups keep their input order
+        scoring (str): Name of a model in SCORING_MODELS
+        
+    Returns:
+        list: Prioritized actions, highest priority first (per group)
+    """
+    count = len(actions)
+    if count == 0:
+        return []
+    if features is None:
+        features = get_action_features(actions)
+    
+    generator = np.random.default_rng(rng.getrandbits(64))
+    
+    # Score impact (1-10, higher is better) and difficulty (1-10, lower is easier)
+    impact, difficulty = SCORING_MODELS[scoring](features, generator)
+    
+    # Calculate priority score (impact / difficulty)
+    priority_score = impact / (difficulty * 0.5)
+    
+    # Assign a timeframe
+    timeframe_index = generator.choice(len(TIMEFRAMES), size=count, p=TIMEFRAME_WEIGHTS)
+    
+    # Assign 1-3 distinct resources: the first few entries of a random permutation per row,
+    # encoded as one integer so the joined strings come from a prebuilt table
+    num_resources = generator.integers(1, 4, count)
+    picks = np.argsort(generator.random((count, len(RESOURCE_OPTIONS))), axis=1)[:, :3]
+    used = np.arange(3) < num_resources[:, None]
+    resource_codes = (np.where(used, picks + 1, 0) * RESOURCE_CODE_WEIGHTS).sum(axis=1)
+    resources = RESOURCE_STRINGS[resource_codes]
+    
+    # Highest priority first; both sorts are stable, so ties keep their input order
+    if groups is None:
+        order = np.argsort(-priority_score, kind="stable")
+    else:
+        order = np.lexsort((-priority_score, np.asarray(groups)))
+    
+    timeframes = np.asarray(TIMEFRAMES, dtype=object)[timeframe_index]
+    
+    return [
+        {
+            "action": action["action"],
+            "description": action["description"],
+            "impact": action_impact,
+            "difficulty": action_difficulty,
+            "priority_score": action_priority,
+            "timeframe": timeframe,
+            "resources": action_resources,
+            "related_solution": action["related_solution"]
+        }
+        for action, action_impact, action_difficulty, action_priority, timeframe, action_resources in zip(
+            [actions[i] for i in order.tolist()],
+            impact[order].tolist(),
+            difficulty[order].tolist(),
+            priority_score[order].tolist(),
+            timeframes[order].tolist(),
+            resources[order].tolist()
+        )
+    ]
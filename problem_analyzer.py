@@ -1,28 +1,179 @@
-import spacy
+import json
+import base64
 import random
+from collections.abc import Mapping
+from spacy.tokens import DocBin
 from textblob import TextBlob
+from nlp_registry import get_nlp, process, pipe
 
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except:
-    # If model isn't available, use a simpler pipeline
-    nlp = spacy.load("en_core_web_sm")
-    nlp.add_pipe("sentencizer")
+# spaCy profile used for each "Analysis Depth" level (see nlp_registry.PIPELINE_PROFILES)
+# fast: sentences and entities only, standard: adds POS and lemmas, full: adds the parser
+DEPTH_PROFILES = {
+    1: "fast",
+    2: "standard",
+    3: "full",
+    4: "full",
+    5: "full"
+}
 
-def analyze_problem(problem_statement):
+class ProblemAnalysis(Mapping):
+    """
+    Compact, serializable result of analyze_problem.
+    
+    The spaCy doc is kept as DocBin bytes and only rebuilt when the "doc" key
+    is read, so instances are cheap to hold in session state and convert to
+    JSON without copying the whole structure. Supports read-only dict access
+    (analysis['objectives'], analysis.get('doc')) for existing callers.
+    """
+    __slots__ = (
+        "objectives", "constraints", "entities", "key_phrases", "sentiment",
+        "complexity", "text", "profile", "doc_bytes"
+    )
+    
+    # Fields included in to_dict/to_json (doc_bytes is handled separately)
+    FIELDS = (
+        "objectives", "constraints", "entities", "key_phrases", "sentiment",
+        "complexity", "text", "profile"
+    )
+    
+    def __init__(self, objectives, constraints, entities, key_phrases, sentiment,
+                 complexity, text, profile="full", doc_bytes=None):
+        self.objectives = objectives
+        self.constraints = constraints
+        self.entities = entities
+        self.key_phrases = key_phrases
+        self.sentiment = sentiment
+        self.complexity = complexity
+        self.text = text
+        self.profile = profile
+        self.doc_bytes = doc_bytes
+    
+    @property
+    def doc(self):
+        """Rebuild the spaCy doc from its DocBin bytes (None if it was dropped)"""
+        if self.doc_bytes is None:
+            return None
+        doc_bin = DocBin().from_bytes(self.doc_bytes)
+        return next(doc_bin.get_docs(get_nlp().vocab))
+    
+    def drop_doc(self):
+        """Discard the stored doc to save memory"""
+        self.doc_bytes = None
+    
+    def __getitem__(self, key):
+        if key == "doc":
+            return self.doc
+        if key in self.FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __iter__(self):
+        return iter(self.FIELDS + ("doc",))
+    
+    def __len__(self):
+        return len(self.FIELDS) + 1
+    
+    def __repr__(self):
+        return f"ProblemAnalysis(text={self.text[:40]!r}, profile={self.profile!r})"
+    
+    def to_dict(self, include_doc=False):
+        """
+        Convert to a plain, JSON-serializable dict.
+        
+        Args:
+            include_doc (bool): Include the doc as base64-encoded DocBin bytes
+        """
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        if include_doc and self.doc_bytes is not None:
+            data["doc_bytes"] = base64.b64encode(self.doc_bytes).decode("ascii")
+        return data
+    
+    def to_json(self, include_doc=False):
+        """Serialize to a JSON string (see to_dict)"""
+        return json.dumps(self.to_dict(include_doc=include_doc))
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Create an instance from a dict produced by to_dict"""
+        doc_bytes = data.get("doc_bytes")
+        return cls(
+            objectives=data.get("objectives", []),
+            constraints=data.get("constraints", []),
+            entities=data.get("entities", []),
+            key_phrases=data.get("key_phrases", []),
+            sentiment=data.get("sentiment", 0.0),
+            complexity=data.get("complexity", 0.5),
+            text=data.get("text", ""),
+            profile=data.get("profile", "full"),
+            doc_bytes=base64.b64decode(doc_bytes) if doc_bytes else None
+        )
+    
+    @classmethod
+    def from_json(cls, payload):
+        """Create an instance from a JSON string produced by to_json"""
+        return cls.from_dict(json.loads(payload))
+
+def serialize_doc(doc):
+    """Serialize a spaCy doc to DocBin bytes, keeping the annotations it has"""
+    if doc.has_annotation("DEP"):
+        attrs = ["ORTH", "TAG", "HEAD", "DEP", "ENT_IOB", "ENT_TYPE", "LEMMA", "MORPH", "POS"]
+    else:
+        # Without a parse, sentence boundaries come from the sentencizer
+        attrs = ["ORTH", "TAG", "SENT_START", "ENT_IOB", "ENT_TYPE", "LEMMA", "MORPH", "POS"]
+    doc_bin = DocBin(attrs=attrs, docs=[doc])
+    return doc_bin.to_bytes()
+
+def get_profile_for_depth(depth):
+    """Get the analysis profile name for an analysis depth (1-5)"""
+    return DEPTH_PROFILES.get(depth, "full")
+
+def analyze_problem(problem_statement, profile="full"):
     """
     Analyze the problem statement using NLP techniques.
     
     Args:
         problem_statement (str): The problem statement text
+        profile (str): spaCy profile ("fast", "standard" or "full"). Lighter
+            profiles skip pipeline components and fall back to simpler
+            heuristics for objectives and key phrases.
         
     Returns:
-        dict: A dictionary containing analysis results
+        ProblemAnalysis: The analysis results
+    """
+    # Process the text with the shared spaCy pipeline
+    doc = process(problem_statement, profile=profile)
+    
+    return build_analysis(problem_statement, doc, profile)
+
+def analyze_problems(texts, batch_size=32, n_process=1, profile="full"):
     """
-    # Process the text with spaCy
-    doc = nlp(problem_statement)
+    Analyze many problem statements in batches.
     
+    Args:
+        texts (iterable): Problem statement texts
+        batch_size (int): Number of texts sent to spaCy per batch
+        n_process (int): Number of spaCy worker processes (-1 for one per CPU)
+        profile (str): spaCy profile, as for analyze_problem
+        
+    Yields:
+        ProblemAnalysis: Analysis results in input order, as returned by analyze_problem
+    """
+    # Stream through spaCy; doc.text reproduces each input text exactly
+    for doc in pipe(texts, profile=profile, batch_size=batch_size, n_process=n_process):
+        yield build_analysis(doc.text, doc, profile)
+
+def build_analysis(problem_statement, doc, profile="full"):
+    """
+    Build the analysis results for an already processed spaCy doc.
+    
+    Args:
+        problem_statement (str): The problem statement text
+        doc (spacy.tokens.Doc): The processed problem statement
+        profile (str): spaCy profile the doc was processed with
+        
+    Returns:
+        ProblemAnalysis: The analysis results
+    """
     # Convert doc.sents to a list so we can reuse it
     sentences = list(doc.sents)
     
@@ -43,6 +194,10 @@ def analyze_problem(problem_statement):
     # Fallback when dependency parser isn't available
         key_phrases = [token.text for token in doc if token.pos_ in ["NOUN", "PROPN"]]
     
+    # Fallback when the tagger isn't available either
+    if not key_phrases and not doc.has_annotation("POS"):
+        key_phrases = [ent["text"] for ent in entities]
+    
     # Identify potential objectives (using verb phrases)
     objectives = []
     for sent in sentences:
@@ -90,13 +245,14 @@ def analyze_problem(problem_statement):
     ) / 4)
     
     # Return the analysis results
-    return {
-        "objectives": objectives[:5],  # Limit to top 5
-        "constraints": constraints[:5],  # Limit to top 5
-        "entities": entities,
-        "key_phrases": key_phrases,
-        "sentiment": sentiment,
-        "complexity": complexity,
-        "doc": doc,  # Include the spaCy doc for further processing (not JSON serializable)
-        "text": problem_statement  # Original text
-    }
+    return ProblemAnalysis(
+        objectives=objectives[:5],  # Limit to top 5
+        constraints=constraints[:5],  # Limit to top 5
+        entities=entities,
+        key_phrases=key_phrases,
+        sentiment=sentiment,
+        complexity=complexity,
+        text=problem_statement,  # Original text
+        profile=profile,
+        doc_bytes=serialize_doc(doc)  # Compact copy of the spaCy doc for further processing
+    )
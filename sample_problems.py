@@ -892,25 +892,29 @@ variable_options = {
     "target_language": ["Java", "Python", "C#", "Rust", "Go", "JavaScript", "TypeScript"]
 }
 
-def generate_problem(category):
-    """Generate a unique problem statement for the given category"""
+def generate_problem(category, rng=random):
+    """
+    Generate a unique problem statement for the given category.
+    
+    Pass a seeded random.Random as rng to get reproducible problems.
+    """
     
     # Select a random template for the category
-    template = random.choice(problem_templates[category])
+    template = rng.choice(problem_templates[category])
     
     # Replace placeholders with random options
     for placeholder, options in variable_options.items():
         if "{" + placeholder + "}" in template:
-            template = template.replace("{" + placeholder + "}", random.choice(options))
+            template = template.replace("{" + placeholder + "}", rng.choice(options))
     
     return template.strip()
 
 # Function to get sample problems
-def get_sample_problems():
+def get_sample_problems(rng=random):
     """Return a dictionary of problem categories with freshly generated problems"""
     problems = {}
     for category in problem_templates.keys():
-        problems[category] = generate_problem(category)
+        problems[category] = generate_problem(category, rng)
     return problems
 
 # For static access, initialize a sample_problems dictionary
@@ -0,0 +1,48 @@
+"""Request validation tests for the ASGI API (rejected before any worker runs)"""
+import asyncio
+import base64
+
+import pytest
+
+from api import app, _get_problem_analysis
+from problem_analyzer import analyze_problem
+
+httpx = pytest.importorskip("httpx")
+
+TEXT = "Farmers need a cheap way to monitor soil moisture across remote fields."
+
+def post(path, body):
+    async def send():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(path, json=body)
+    return asyncio.run(send())
+
+INNOVATIONS = {"solutions": [], "technologies": []}
+INSIGHTS = {"domain_relevance": {"Agriculture": 10, "Technology": 5}, "trends": [], "gaps": []}
+
+@pytest.mark.parametrize("path, extra, field", [
+    ("/insights", {}, {"entities": [1]}),
+    ("/insights", {}, {"key_phrases": 5}),
+    ("/innovations", {"insights": INSIGHTS}, {"objectives": [1, 2]}),
+    ("/tips", {"problem_statement": TEXT}, {"complexity": "high"}),
+    ("/tips", {"problem_statement": TEXT}, {"complexity": True}),
+    ("/tips", {"problem_statement": TEXT}, {"doc_bytes": "not base64!"}),
+    ("/prioritize", {"innovations": INNOVATIONS}, {"sentiment": None}),
+])
+def test_malformed_problem_analysis_is_rejected(path, extra, field):
+    response = post(path, {**extra, "problem_analysis": {"text": TEXT, **field}})
+    assert response.status_code == 400
+    assert next(iter(field)) in response.json()["error"]
+
+def test_client_doc_bytes_are_rejected():
+    analysis = analyze_problem(TEXT)
+    payload = analysis.to_dict(include_doc=True)
+    assert base64.b64decode(payload["doc_bytes"])
+
+    response = post("/tips", {"problem_statement": TEXT, "problem_analysis": payload})
+    assert response.status_code == 400
+
+def test_analysis_from_analyze_is_accepted():
+    payload = analyze_problem(TEXT).to_dict()
+    assert _get_problem_analysis({"problem_analysis": payload}) == payload
@@ -0,0 +1,51 @@
+"""Regression tests for the shared domain-trend table in insights_generator"""
+import copy
+import random
+import tracemalloc
+
+import pytest
+
+from domain_knowledge import TECH_DOMAINS
+from insights_generator import DOMAIN_TRENDS, build_domain_trends, generate_trends
+
+TOP_DOMAINS = [("Technology", 9), ("Healthcare", 7), ("Environment", 5)]
+OBJECTIVES = [
+    "Reduce patient wait times with predictive scheduling",
+    "Monitor water quality with low cost sensors"
+]
+
+def run_generate_trends(calls, rng):
+    for i in range(calls):
+        generate_trends(TOP_DOMAINS, OBJECTIVES, depth=1 + i % 5, rng=rng)
+
+def test_generate_trends_leaves_knowledge_base_unchanged():
+    tech_domains = copy.deepcopy(TECH_DOMAINS)
+    domain_trends = dict(DOMAIN_TRENDS)
+
+    run_generate_trends(10_000, random.Random(0))
+    build_domain_trends()
+
+    assert TECH_DOMAINS == tech_domains
+    assert dict(DOMAIN_TRENDS) == domain_trends
+    assert dict(build_domain_trends()) == domain_trends
+
+def test_generate_trends_memory_is_flat():
+    rng = random.Random(0)
+    run_generate_trends(1_000, rng)  # Warm up caches and interned strings
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        run_generate_trends(10_000, rng)
+        growth = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    # Appending to shared lists on every call grew memory by megabytes over 10k calls
+    assert growth < 64 * 1024
+
+def test_domain_trends_are_read_only():
+    with pytest.raises(TypeError):
+        DOMAIN_TRENDS["Technology"] = ()
+    assert all(isinstance(trends, tuple) for trends in DOMAIN_TRENDS.values())
+    assert all(len(set(trends)) == len(trends) for trends in DOMAIN_TRENDS.values())
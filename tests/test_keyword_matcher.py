@@ -0,0 +1,66 @@
+"""Tests that KeywordMatcher agrees with naive `in` / `str.count` matching"""
+import random
+
+import pytest
+
+from benchmark import build_corpus
+from insights_generator import DOMAIN_KEYWORDS, DOMAIN_MATCHER
+from keyword_matcher import KeywordMatcher
+
+# Overlapping and nested keywords: "ai" inside "maintain", "data" a prefix of "database"
+KEYWORD_GROUPS = {
+    "Technology": ["ai", "data", "database", "data base", "base", "tech", "technology"],
+    "Business": ["maintain", "maintenance", "main", "an", "ana", "anana"],
+    "Health": ["care", "healthcare", "health", "ealth"]
+}
+
+TEXTS = [
+    "",
+    "AI",
+    "We maintain the database and the data base; the maintenance team uses AI.",
+    "banana ananas anananana",
+    "Healthcare health-care HEALTHCARE technology tech-savvy databases",
+    "aiaiai maintainmaintain datadatabase",
+    "Ünïcode data İstanbul maintain ai",
+]
+
+def naive_count(keywords, text):
+    lowered = text.lower()
+    return {keyword: lowered.count(keyword) for keyword in keywords if keyword in lowered}
+
+def naive_find(keywords, text):
+    lowered = text.lower()
+    return {keyword for keyword in keywords if keyword in lowered}
+
+def random_texts(keywords, count, rng):
+    """Texts built from keyword fragments, so matches overlap and nest"""
+    pieces = list(keywords) + ["x", " ", "a", "n", "in"]
+    return ["".join(rng.choice(pieces) for _ in range(rng.randint(0, 40))) for _ in range(count)]
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_count_matches_str_count(text):
+    matcher = KeywordMatcher(KEYWORD_GROUPS)
+    assert matcher.count(text) == naive_count(matcher.labels_by_keyword, text)
+
+def test_find_each_matches_in():
+    matcher = KeywordMatcher(KEYWORD_GROUPS)
+    texts = TEXTS + random_texts(matcher.labels_by_keyword, 200, random.Random(0))
+    assert matcher.find_each(texts) == [naive_find(matcher.labels_by_keyword, text) for text in texts]
+
+def test_count_matches_str_count_on_random_texts():
+    matcher = KeywordMatcher(KEYWORD_GROUPS)
+    for text in random_texts(matcher.labels_by_keyword, 500, random.Random(1)):
+        assert matcher.count(text) == naive_count(matcher.labels_by_keyword, text)
+
+def test_domain_matcher_on_long_statements():
+    keywords = {keyword.lower() for keywords in DOMAIN_KEYWORDS.values() for keyword in keywords}
+    texts = build_corpus("xlong", 3)
+    assert all(len(text) > 10_000 for text in texts)
+
+    for text in texts:
+        assert DOMAIN_MATCHER.count(text) == naive_count(keywords, text)
+    assert DOMAIN_MATCHER.find_each(texts) == [naive_find(keywords, text) for text in texts]
+
+def test_score_counts_repeated_labels():
+    matcher = KeywordMatcher({"A": ["data", "data"], "B": ["data"]})
+    assert matcher.score(matcher.count("data data"), weight=0.5) == {"A": 2.0, "B": 1.0}
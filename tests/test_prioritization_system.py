@@ -0,0 +1,51 @@
+"""Tests for the evidence scoring features in prioritization_system"""
+import random
+
+from problem_analyzer import analyze_problem
+from insights_generator import generate_insights
+from innovation_spotter import generate_innovations, DOMAIN_TECHNOLOGIES
+from prioritization_system import (TECHNOLOGY_FIT_LEVELS, extract_actions, get_action_features,
+                                   get_technology_fit, prioritize_actions)
+
+PROBLEM = ("Hospitals struggle to reduce patient wait times because appointment data is scattered "
+           "across clinics. We need a telehealth triage tool that doctors and nurses can trust, "
+           "with a limited budget and strict privacy requirements.")
+
+FIT = 2  # Column of the technology fit in get_action_features
+
+def test_technology_fit_is_the_same_for_every_seed():
+    analysis = analyze_problem(PROBLEM)
+    insights = generate_insights(analysis, depth=3, rng=random.Random(0))
+
+    fits = {}
+    for seed in range(30):
+        for level in (1, 3, 5):
+            innovations = generate_innovations(analysis, insights, level=level, rng=random.Random(seed))
+            actions = extract_actions(innovations)
+            features = get_action_features(actions, analysis, insights['domain_relevance'])
+            for action, fit in zip(actions, features[:, FIT].tolist()):
+                fits.setdefault(action["technology"].lower(), set()).add(fit)
+
+    assert all(len(values) == 1 for values in fits.values())
+
+def test_technology_fit_follows_domain_relevance():
+    relevance = {"Healthcare": 10.0, "Technology": 5.0, "Agriculture": 0.0}
+
+    assert all(get_technology_fit(tech, relevance) == 0 for tech in DOMAIN_TECHNOLOGIES["Healthcare"])
+    assert get_technology_fit("cloud computing", relevance) == 1
+    assert get_technology_fit("precision farming", relevance) == 2
+    # Technologies no domain lists get the middle fit
+    assert get_technology_fit("not a catalogued technology", relevance) == 1
+    assert len(TECHNOLOGY_FIT_LEVELS) == 3
+
+def test_prioritization_is_deterministic_with_insights():
+    analysis = analyze_problem(PROBLEM)
+    insights = generate_insights(analysis, depth=3, rng=random.Random(0))
+    innovations = generate_innovations(analysis, insights, level=3, rng=random.Random(0))
+
+    def scores(vectorized):
+        actions = prioritize_actions(innovations, rng=random.Random(1), vectorized=vectorized,
+                                     problem_analysis=analysis, insights=insights)
+        return [(action["action"], action["priority_score"]) for action in actions]
+
+    assert scores(False) == scores(True)
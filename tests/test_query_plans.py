@@ -0,0 +1,32 @@
+"""EXPLAIN checks that the hot auth_utils queries are served by indexes
+
+Needs a PostgreSQL database in DATABASE_URL, which the migrations are applied
+to first. Skipped when DATABASE_URL is unset or the database is unreachable.
+"""
+import os
+
+import psycopg2
+import pytest
+
+from migrate import HOT_QUERIES, apply_migrations, check_query_plans
+
+@pytest.fixture(scope="module")
+def plans():
+    database_url = os.environ.get("DATABASE_URL")
+    if not database_url:
+        pytest.skip("DATABASE_URL is not set")
+    try:
+        conn = psycopg2.connect(database_url, connect_timeout=5)
+    except psycopg2.OperationalError as e:
+        pytest.skip(f"Database is not reachable: {e}")
+
+    try:
+        apply_migrations(conn)
+        return {result["query"]: result for result in check_query_plans(conn)}
+    finally:
+        conn.close()
+
+@pytest.mark.parametrize("description", [query[0] for query in HOT_QUERIES])
+def test_hot_query_uses_index(plans, description):
+    result = plans[description]
+    assert result["uses_index"], f"{description}: {result['scans']}"
@@ -3,6 +3,26 @@ import pandas as pd
 from datetime import datetime
 from auth_utils import get_user_search_history, get_user_saved_solutions
 
+# Searches shown per timeline page
+TIMELINE_PAGE_SIZE = 20
+
+# Prioritized actions shown for a past search
+TIMELINE_TOP_ACTIONS = 3
+
+def render_top_actions(search_id):
+    """Show the top actions of the latest saved solution for a search"""
+    # Only the first few prioritized actions are selected in the database, not the whole solution
+    solutions = get_user_saved_solutions(search_id, keys=["prioritized_actions"],
+                                         top_actions=TIMELINE_TOP_ACTIONS)
+    actions = solutions[0]['solution_data'].get('prioritized_actions') if solutions else None
+    
+    if not actions:
+        st.caption("No saved actions for this search.")
+        return
+    
+    for action in actions:
+        st.markdown(f"- **{action['action']}** ({action['timeframe']}, priority {action['priority_score']:.1f})")
+
 def format_datetime(dt_str):
     """Format datetime string to a more readable format"""
     dt = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S.%f")
@@ -16,11 +36,23 @@ def render_timeline():
     
     st.title("Your HACKSEEK Timeline")
     
-    # Get user's search history
+    # Keyset cursors of the pages already visited; the last one is the current page
+    if 'timeline_cursors' not in st.session_state:
+        st.session_state.timeline_cursors = [None]
+    page = len(st.session_state.timeline_cursors) - 1
+    
+    # Get one page of the user's search history (one extra row tells whether there is another page)
     user_id = st.session_state.user_info['id']
-    searches = get_user_search_history(user_id)
+    searches = get_user_search_history(user_id, limit=TIMELINE_PAGE_SIZE + 1,
+                                       before=st.session_state.timeline_cursors[-1])
+    has_more = len(searches) > TIMELINE_PAGE_SIZE
+    searches = searches[:TIMELINE_PAGE_SIZE]
     
     if not searches:
+        if page > 0:
+            # The page emptied (e.g. searches were deleted); go back to the first one
+            st.session_state.timeline_cursors = [None]
+            st.rerun()
         st.info("You haven't made any searches yet. Start by analyzing a problem in the main app!")
         return
     
@@ -35,8 +67,12 @@ def render_timeline():
             
             with col1:
                 # Problem title with truncation
-                st.markdown(f"**{i+1}. {search['problem_statement'][:100]}{'...' if len(search['problem_statement']) > 100 else ''}**")
-                st.caption(f"Date: {format_datetime(str(search['created_at']))}")
+                st.markdown(f"**{page * TIMELINE_PAGE_SIZE + i + 1}. {search['problem_statement'][:100]}{'...' if len(search['problem_statement']) > 100 else ''}**")
+                st.caption(f"Date: {format_datetime(str(search['created_at_local']))}")
+                
+                # Load the saved actions on request rather than for every search on the page
+                if search['solution_count'] and st.toggle("Show top actions", key=f"top_actions_{search['id']}"):
+                    render_top_actions(search['id'])
             
             with col2:
                 # Add a button to reanalyze this problem
@@ -47,4 +83,16 @@ def render_timeline():
                     st.rerun()  # Use st.rerun() instead of experimental_rerun
             
             # Add a separator between items
-            st.markdown("---")
\ No newline at end of file
+            st.markdown("---")
+    
+    # Page navigation
+    col1, col2 = st.columns(2)
+    with col1:
+        if page > 0 and st.button("← Newer searches", key="timeline_newer"):
+            st.session_state.timeline_cursors.pop()
+            st.rerun()
+    with col2:
+        if has_more and st.button("Older searches →", key="timeline_older"):
+            last = searches[-1]
+            st.session_state.timeline_cursors.append((last['created_at'], last['id']))
+            st.rerun()
\ No newline at end of file